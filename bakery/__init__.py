@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Final
+
 from .stuff import BakeryLogger, DefaultLogger
 
 logger: BakeryLogger | None = DefaultLogger()
@@ -10,14 +12,61 @@ logger: BakeryLogger | None = DefaultLogger()
 from .bakery import *
 from .baking import *
 from .cake import *
+from .graph import *
 from .piece_of_cake import *
 from .stuff import *
 
+if TYPE_CHECKING:
+    from .caching import *
+    from .export import *
+    from .metrics import *
+    from .sharing import *
+    from .snapshot import *
+
+# not required to bake cakes, so imported on demand
+LAZY_ATTRIBUTES: Final[dict[str, str]] = {
+    "DiskCache": "caching",
+    "cached": "caching",
+    "bakery_info": "export",
+    "export_dot": "export",
+    "export_json": "export",
+    "export_mermaid": "export",
+    "BakeryMetrics": "metrics",
+    "MetricsRegistry": "metrics",
+    "SharedBuffer": "sharing",
+    "SharedRecipe": "sharing",
+    "shared": "sharing",
+    "bakery_snapshot": "snapshot",
+    "load_snapshot": "snapshot",
+    "restore_bakery": "snapshot",
+    "save_snapshot": "snapshot",
+}
+
 # ruff: noqa: F405, PLE0604
 __all__ = [
     *bakery.__all__,  # type: ignore[name-defined]
     *baking.__all__,  # type: ignore[name-defined]
     *cake.__all__,  # type: ignore[name-defined]
+    *graph.__all__,  # type: ignore[name-defined]
     *piece_of_cake.__all__,  # type: ignore[name-defined]
     *stuff.__all__,  # type: ignore[name-defined]
+    *LAZY_ATTRIBUTES,
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazy attribute."""
+    module_name: str | None = LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module '{__name__}' has no attribute '{name}'"
+        raise AttributeError(msg)
+
+    from importlib import import_module  # noqa: PLC0415
+
+    value: Any = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
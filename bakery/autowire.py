@@ -0,0 +1,248 @@
+"""Cakes autowiring.
+
+Required recipe parameters are matched to bakery cakes by type annotations
+once, when bakery class is created. Baking does no reflection at all:
+autowired cakes are baked just like cakes with explicit arguments.
+"""
+
+from __future__ import annotations
+
+__all__ = ["autowire_bakery", "recipe_parameters"]
+
+import inspect
+import typing
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+from weakref import WeakKeyDictionary
+
+from .baking import BakingMethod
+from .stuff import _LOGGER as logger  # noqa: N811
+from .stuff import flatten, is_cake, is_cake_or_piece
+
+if TYPE_CHECKING:
+    from .bakery import Bakery
+    from .stuff import Cakeable
+
+# recipes called with arguments
+AUTOWIRED_BAKING_METHODS: Final = frozenset(
+    (
+        BakingMethod.BAKE_FROM_CALL,
+        BakingMethod.BAKE_FROM_CORO_FUNC,
+        BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC,
+        BakingMethod.BAKE_FROM_GEN_FUNC,
+    )
+)
+POSITIONAL_KINDS: Final = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+KEYWORD_KINDS: Final = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+class RecipeParameter(NamedTuple):
+    name: str
+    kind: Any
+    annotation: Any
+    required: bool
+
+
+def resolve_annotations(obj: Any) -> dict[str, Any]:
+    """Evaluated annotations. Unresolvable ones are left as is."""
+    try:
+        return typing.get_type_hints(obj)
+    except Exception:  # noqa: BLE001
+        return dict(getattr(obj, "__annotations__", {}))
+
+
+# recipe -> its parameters, recipes are not kept alive by the cache
+RECIPE_PARAMETERS: Final[WeakKeyDictionary[Any, tuple[RecipeParameter, ...]]] = WeakKeyDictionary()
+
+
+def recipe_parameters(recipe: Any) -> tuple[RecipeParameter, ...]:
+    """Recipe parameters with evaluated annotations. Recipe is inspected once.
+
+    Unhashable (or not weak referenceable) recipes are inspected every time.
+    """
+    try:
+        return RECIPE_PARAMETERS[recipe]
+    except KeyError:
+        parameters: tuple[RecipeParameter, ...] = inspect_recipe(recipe)
+        RECIPE_PARAMETERS[recipe] = parameters
+        return parameters
+    except TypeError:
+        return inspect_recipe(recipe)
+
+
+def inspect_recipe(recipe: Any) -> tuple[RecipeParameter, ...]:
+    try:
+        signature: inspect.Signature = inspect.signature(recipe)
+    except (TypeError, ValueError):
+        # builtins without signature
+        return ()
+
+    annotated: Any = recipe
+    if isinstance(recipe, type):
+        annotated = getattr(recipe, "__init__", None)
+    elif not inspect.isroutine(recipe) and callable(recipe):
+        # callable instance
+        annotated = type(recipe).__call__
+    annotations: dict[str, Any] = resolve_annotations(annotated)
+    return tuple(
+        RecipeParameter(
+            name=name,
+            kind=parameter.kind,
+            annotation=annotations.get(name, parameter.annotation),
+            required=parameter.default is inspect.Parameter.empty,
+        )
+        for name, parameter in signature.parameters.items()
+    )
+
+
+def cake_annotations(bakery: type[Bakery]) -> dict[str, Any]:
+    """Evaluated cake annotations declared in the bakery class body.
+
+    Annotations are evaluated one by one in the bakery module:
+    Bakery's own annotations are never evaluated. Unresolvable ones are left as is.
+    """
+    globalns: dict[str, Any] = getattr(inspect.getmodule(bakery), "__dict__", {})
+    localns: dict[str, Any] = dict(vars(bakery))
+    annotations: dict[str, Any] = {}
+    for name, annotation in vars(bakery).get("__annotations__", {}).items():
+        annotations[name] = annotation
+        if isinstance(annotation, str):
+            try:
+                annotations[name] = eval(annotation, globalns, localns)  # noqa: S307
+            except Exception:  # noqa: BLE001
+                logger.debug(
+                    f"{bakery.__qualname__}.{name}: annotation '{annotation}' is not resolved"
+                )
+    return annotations
+
+
+class TypeIndex:
+    """Bakery cakes by their types (cake annotations or recipe classes)."""
+
+    def __init__(self, bakery: type[Bakery]) -> None:
+        annotations: dict[str, Any] = cake_annotations(bakery)
+        self.types: Final[dict[Any, list[str]]] = {}
+        self.bases: Final[dict[Any, list[str]]] = {}
+        # cakes are baked in declaration order
+        self.positions: Final[dict[str, int]] = {
+            name: position for position, name in enumerate(bakery.__bakery_items__)
+        }
+
+        seen: set[int] = set()
+        for name, cake in bakery.__bakery_items__.items():
+            if id(cake) in seen:
+                # alias
+                continue
+            seen.add(id(cake))
+
+            cake_type: Any = annotations.get(name)
+            if (cake_type is None or isinstance(cake_type, str)) and isinstance(
+                cake.__cake_recipe__, type
+            ):
+                cake_type = cake.__cake_recipe__
+            if cake_type is None or cake_type is Any or isinstance(cake_type, str):
+                continue
+
+            self.types.setdefault(cake_type, []).append(name)
+            for base in getattr(cake_type, "__mro__", ())[1:-1]:  # object is skipped
+                self.bases.setdefault(base, []).append(name)
+
+    def find(self, annotation: Any, *, exclude: str) -> list[str]:
+        """Cake names of annotated type (or its subclasses)."""
+        names: list[str] = [name for name in self.types.get(annotation, ()) if name != exclude]
+        if not names:
+            names = [name for name in self.bases.get(annotation, ()) if name != exclude]
+        return names
+
+
+def autowire_cake(bakery: type[Bakery], index: TypeIndex, name: str, cake: Cakeable[Any]) -> None:
+    """Pass bakery cakes as required recipe arguments which are not passed yet."""
+    if cake.__cake_baking_method__ not in AUTOWIRED_BAKING_METHODS:
+        return
+
+    # the cake may share its kwargs with others (e.g. copies)
+    kwargs: dict[str, Any] = dict(cake.__cake_recipe_kwargs__)
+    positional: int = len(cake.__cake_recipe_args__)
+    wired: dict[str, str] = {}
+    for parameter in recipe_parameters(cake.__cake_recipe__):
+        if parameter.kind in POSITIONAL_KINDS and positional:
+            positional -= 1
+            continue
+        if (
+            not parameter.required
+            or parameter.name in kwargs
+            # positional only and variadic parameters are not wired
+            or parameter.kind not in KEYWORD_KINDS
+        ):
+            continue
+
+        annotation: Any = parameter.annotation
+        if annotation is inspect.Parameter.empty or isinstance(annotation, str):
+            msg = (
+                f"{bakery.__qualname__}.{name}: cannot autowire parameter '{parameter.name}' "
+                f"of {cake.__cake_recipe__}: it's not annotated"
+            )
+            raise TypeError(msg)
+
+        found: list[str] = index.find(annotation, exclude=name)
+        if len(found) != 1:
+            reason: str = (
+                f"several cakes ({', '.join(found)}) match" if found else "no cake matches"
+            )
+            msg = (
+                f"{bakery.__qualname__}.{name}: cannot autowire parameter "
+                f"'{parameter.name}: {getattr(annotation, '__qualname__', annotation)}' "
+                f"of {cake.__cake_recipe__}: {reason}"
+            )
+            raise TypeError(msg)
+        if index.positions[found[0]] > index.positions[name]:
+            # it would be baked after (and unbaked before) the dependent cake
+            msg = (
+                f"{bakery.__qualname__}.{name}: cannot autowire parameter "
+                f"'{parameter.name}' of {cake.__cake_recipe__}: cake '{found[0]}' "
+                "is declared after it, declare it first"
+            )
+            raise TypeError(msg)
+
+        kwargs[parameter.name] = getattr(bakery, found[0])
+        wired[parameter.name] = found[0]
+
+    if wired:
+        cake._Pastry__cake_recipe_kwargs = kwargs  # type: ignore[attr-defined]
+        logger.debug(
+            f"{cake} is autowired: "
+            + ", ".join(f"{parameter}={dependency}" for parameter, dependency in wired.items())
+        )
+
+
+def autowire_bakery(bakery: type[Bakery]) -> None:
+    """Autowire bakery cakes and their anonymous cakes."""
+    index: TypeIndex = TypeIndex(bakery)
+    for name, cake in bakery.__bakery_items__.items():
+        if cake.__cake_undefined__:
+            continue
+        anon_cakes: list[Cakeable[Any]] = [cake]
+        while anon_cakes:
+            anon_cake: Cakeable[Any] = anon_cakes.pop()
+            autowire_cake(bakery, index, name, anon_cake)
+            if anon_cake.__cake_baking_method__ == BakingMethod.BAKE_NO_BAKE and not (
+                is_cake_or_piece(anon_cake.__cake_recipe__)
+            ):
+                # plain value is never walked (e.g. endless iterator)
+                continue
+            anon_cakes.extend(
+                item
+                for item in flatten(
+                    [
+                        anon_cake.__cake_recipe__,
+                        anon_cake.__cake_recipe_args__,
+                        anon_cake.__cake_recipe_kwargs__,
+                    ]
+                )
+                if is_cake(item) and item.__cake_anon__
+            )
@@ -7,14 +7,28 @@ from __future__ import annotations
 
 __all__ = ["Bakery"]
 
-from typing import Any, AsyncContextManager, ContextManager, Protocol, TypeVar
-
-from .baking import BakingMethod
-from .cake import Cake
+import os
+from contextlib import AsyncExitStack
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Coroutine,
+    Protocol,
+    TypeVar,
+)
+from weakref import WeakSet
+
+from .baking import SYNC_BAKING, BakingMethod
+from .cake import Cake, Pastry, fresh_pastry
+from .graph import BakeryGraph, bakery_graph, reset_bakery_graph
 from .stuff import _LOGGER as logger  # noqa: N811
 from .stuff import is_cake
 
 T = TypeVar("T", bound="Bakery")
+R = TypeVar("R")
 
 
 class Cakeable(Protocol, AsyncContextManager):
@@ -30,6 +44,8 @@ class Cakeable(Protocol, AsyncContextManager):
         _cake_baking_method: BakingMethod,
         **_cake_recipe_kwargs: Any,
     ) -> ContextManager[Cakeable]: ...
+    def __cake_swap__(self, other: Any) -> None: ...
+    def __cake_discard__(self) -> None: ...
 
 
 def replace_cakes(cakes: dict[str, ContextManager]) -> None:
@@ -44,12 +60,39 @@ def unreplace_cakes(cakes: dict[str, ContextManager]) -> None:
     cakes.clear()
 
 
+FORK_AWARE_BAKERIES: WeakSet[type[Bakery]] = WeakSet()
+
+# (bakery, event, cake name) callbacks, e.g. bakery.metrics
+# events: "opened", "closed" and "bake_failed"
+BAKERY_LISTENERS: list[Callable[[type[Bakery], str, str | None], None]] = []
+
+
+def notify_listeners(bakery: type[Bakery], event: str, cake_name: str | None = None) -> None:
+    for listener in BAKERY_LISTENERS:
+        listener(bakery, event, cake_name)
+
+
+def after_fork_in_child() -> None:
+    for bakery in list(FORK_AWARE_BAKERIES):
+        if bakery.__bakery_visitors__:
+            bakery.__bakery_after_fork__()
+
+
+if hasattr(os, "register_at_fork"):  # posix only
+    os.register_at_fork(after_in_child=after_fork_in_child)
+
+
 class Bakery:
     """Your bakery."""
 
     __bakery_visitors__: int
     __bakery_items__: dict[str, Cakeable]
     __bakery_replaced_cakes__: dict[str, ContextManager]
+    __bakery_graph__: BakeryGraph | None
+    __bakery_fork_aware__: bool
+    __bakery_forked__: bool
+    # ids of the cakes baked by the parent process
+    __bakery_inherited__: frozenset[int]
 
     def __init__(self, **kwargs: Any) -> None:
         cls = type(self)
@@ -77,11 +120,13 @@ class Bakery:
             cake_baking_method = BakingMethod.BAKE_NO_BAKE
             recipe_args: tuple = ()
             recipe_kwargs: dict = {}
+            cake_factory: bool = False
             if is_cake(item_value):
                 cake_recipe = item_value.__cake_recipe__
                 recipe_args = item_value.__cake_recipe_args__
                 recipe_kwargs = item_value.__cake_recipe_kwargs__
                 cake_baking_method = item_value.__cake_baking_method__
+                cake_factory = item_value.__cake_factory__
 
             cls.__bakery_replaced_cakes__[item_name] = cls.__bakery_items__[
                 item_name
@@ -90,6 +135,7 @@ class Bakery:
                 *recipe_args,
                 **recipe_kwargs,
                 _cake_baking_method=cake_baking_method,
+                _cake_factory=cake_factory,
             )
 
     async def __aenter__(self: T) -> T:
@@ -98,6 +144,12 @@ class Bakery:
     async def __aexit__(self, *_args: object) -> None:
         return await type(self).aclose()
 
+    def __enter__(self: T) -> T:
+        return type(self).open()
+
+    def __exit__(self, *_args: object) -> None:
+        return type(self).close()
+
     def __getattribute__(self, attr: str) -> Any:
         """If getattr(cls, attr) is cake, call it and return."""
         value: Any = super().__getattribute__(attr)
@@ -105,8 +157,21 @@ class Bakery:
             return value()
         return value
 
-    def __init_subclass__(cls, **kwargs: Any) -> None:
-        """Initialize bakery subclass."""
+    def __init_subclass__(
+        cls,
+        *,
+        fork_aware: bool = False,
+        autowire: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize bakery subclass.
+
+        Fork aware bakery opened in the parent process shares its fork safe cakes
+        with forked children. Other cakes are discarded in children and baked again
+        on bakery open.
+        Autowired bakery passes its cakes as required recipe arguments
+        by their type annotations.
+        """
         bakery_items: dict[str, Cakeable] = {}
         # Do filter __dict__, because iterating
         # over __annotations__ forces to annotate
@@ -127,6 +192,20 @@ class Bakery:
         cls.__bakery_items__ = bakery_items
         cls.__bakery_visitors__ = 0
         cls.__bakery_replaced_cakes__ = {}
+        cls.__bakery_graph__ = None
+        cls.__bakery_fork_aware__ = fork_aware
+        cls.__bakery_forked__ = False
+        cls.__bakery_inherited__ = frozenset()
+
+        if autowire:
+            from .autowire import autowire_bakery  # noqa: PLC0415
+
+            autowire_bakery(cls)
+
+        bakery_graph(cls).validate()
+
+        if fork_aware:
+            FORK_AWARE_BAKERIES.add(cls)
 
     @classmethod
     async def aopen(cls: type[T]) -> T:
@@ -136,7 +215,11 @@ class Bakery:
             # anyio lock required (on demand)
             return cls()
 
-        replace_cakes(cls.__bakery_replaced_cakes__)
+        if not cls.__bakery_forked__:
+            # replacements are inherited from the parent process otherwise
+            replace_cakes(cls.__bakery_replaced_cakes__)
+        # recipes could be replaced (or patched) since the last open
+        reset_bakery_graph(cls)
 
         missed_args: list[str] = [
             cake.__cake_name__ for cake in cls.__bakery_items__.values() if cake.__cake_undefined__
@@ -159,8 +242,19 @@ class Bakery:
 
             logger.error(msg)
             unreplace_cakes(cls.__bakery_replaced_cakes__)
+            reset_bakery_graph(cls)
             raise TypeError(msg)
 
+        if cls.__bakery_replaced_cakes__:
+            # replaced cakes could depend on anything
+            try:
+                bakery_graph(cls).validate()
+            except ValueError as exc:
+                logger.error(str(exc))
+                unreplace_cakes(cls.__bakery_replaced_cakes__)
+                reset_bakery_graph(cls)
+                raise
+
         cls.__bakery_visitors__ += 1
         # let's bake all your cakes
         cake: Cakeable | None = None
@@ -169,10 +263,13 @@ class Bakery:
                 await cake.__aenter__()
         except (Exception, BaseException) as exc:
             logger.error(f"{cake} cannot be baked: {exc}")
+            if cake is not None:
+                notify_listeners(cls, "bake_failed", cake.__cake_name__)
             await cls.aclose()
             raise exc from None
 
         logger.debug(f"Bakery '{cls.__qualname__}' is opened. Welcome!")
+        notify_listeners(cls, "opened")
         return cls()
 
     @classmethod
@@ -199,13 +296,21 @@ class Bakery:
             cls.__bakery_items__.values(),
         ):
             try:
-                await cake.__aexit__(exc_type, exc_value, traceback)
+                if id(cake) in cls.__bakery_inherited__:
+                    # the parent process owns it and unbakes it
+                    cake.__cake_discard__()
+                else:
+                    await cake.__aexit__(exc_type, exc_value, traceback)
             except (Exception, BaseException) as exc:  # noqa: PERF203
                 exceptions.append(exc)
 
         unreplace_cakes(cls.__bakery_replaced_cakes__)
+        reset_bakery_graph(cls)
+        cls.__bakery_forked__ = False
+        cls.__bakery_inherited__ = frozenset()
 
         logger.debug(f"Bakery '{cls.__qualname__}' is closed. Goodbye!")
+        notify_listeners(cls, "closed")
 
         if exceptions:
             # For now raise the first exception occurred.
@@ -214,3 +319,227 @@ class Bakery:
             # or use exception groups (python 3.11)
             # https://peps.python.org/pep-0654/
             raise exceptions[0]
+
+    @classmethod
+    def open(cls: type[T]) -> T:
+        """Open bakery without event loop.
+
+        Only synchronous recipes are allowed: coroutine functions, awaitables
+        and async context managers raise TypeError.
+        """
+        return run_sync(cls.aopen(), cls.__qualname__)
+
+    @classmethod
+    def close(
+        cls,
+        exc_type: type | None = None,
+        exc_value: Exception | None = None,
+        traceback: Any | None = None,
+    ) -> None:
+        """Close bakery opened without event loop."""
+        return run_sync(cls.aclose(exc_type, exc_value, traceback), cls.__qualname__)
+
+    @classmethod
+    def __bakery_after_fork__(cls) -> None:
+        """Discard fork unsafe cakes (and their dependents) in forked child.
+
+        Parent process still owns them. The bakery is considered closed
+        in the child: the next open bakes discarded cakes again.
+        Fork safe cakes are owned by the parent too: the child discards them on close.
+        """
+        graph: BakeryGraph = bakery_graph(cls)
+        unsafe: list[str] = []
+        for name, cake in graph.cakes.items():
+            if not cake.__cake_fork_safe__:
+                unsafe.append(name)
+                unsafe.extend(graph.dependents(name, transitive=True))
+
+        for name in reversed(graph.sorted(unsafe)):
+            graph.cakes[name].__cake_discard__()
+
+        # fork safe cakes are discarded (not unbaked) on close
+        cls.__bakery_inherited__ = frozenset(
+            id(cake)
+            for cake in graph.cakes.values()
+            if cake.__cake_baked__ and cake.__cake_baking_method__ != BakingMethod.BAKE_NO_BAKE
+        )
+        cls.__bakery_visitors__ = 0
+        cls.__bakery_forked__ = True
+        logger.debug(f"Bakery '{cls.__qualname__}' is forked (pid {os.getpid()})")
+
+    @classmethod
+    def __bakery_dependents__(cls, *cakes: Any) -> list[Cakeable]:
+        """Get opened bakery cakes with all their dependents in baking order."""
+        if not cls.__bakery_visitors__:
+            msg = f"Bakery '{cls.__qualname__}' is not opened. Open it first."
+            raise ValueError(msg)
+
+        graph: BakeryGraph = bakery_graph(cls)
+        names: dict[int, str] = {id(cake): name for name, cake in graph.cakes.items()}
+        cake: Any
+        for cake in cakes:
+            if id(cake) not in names:
+                msg = f"{cake} is not a '{cls.__qualname__}' cake"
+                raise ValueError(msg)
+
+        dependents: list[str] = [names[id(cake)] for cake in cakes]
+        for cake in cakes:
+            dependents.extend(graph.dependents(names[id(cake)], transitive=True))
+
+        return [graph.cakes[name] for name in graph.sorted(dependents)]
+
+    @classmethod
+    async def rebake(cls, *cakes: Any) -> None:
+        """Rebake cakes and all their dependents in opened bakery.
+
+        Fresh copies of them are baked first and only then take place
+        of the old ones, which are unbaked in reverse order.
+        If any copy cannot be baked, the old cakes are left as is.
+        Other cakes remain untouched.
+        """
+        swapped: list[tuple[Cakeable, Pastry[Any]]] = await cls.__bakery_bake_in__(
+            cls.__bakery_dependents__(*cakes), {}
+        )
+        logger.debug(
+            f"Bakery '{cls.__qualname__}' rebaked: " + ", ".join(str(cake) for cake, _ in swapped)
+        )
+        await unbake_swapped(swapped)
+
+    @classmethod
+    async def swap(
+        cls,
+        cake: Any,
+        new_cake: Any,
+        *,
+        drain: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None:
+        """Swap cake recipe in opened bakery.
+
+        New cake and fresh copies of all its dependents are baked first
+        and only then take place of the old ones. So cakes are never unbaked
+        in between. Old cakes are unbaked after `drain` is awaited.
+        """
+        swapped: list[tuple[Cakeable, Pastry[Any]]] = await cls.__bakery_swap_in__(
+            (cake, new_cake)
+        )
+        logger.debug(f"Bakery '{cls.__qualname__}': {cake} was swapped")
+
+        if drain is not None:
+            await drain()
+
+        await unbake_swapped(swapped)
+
+    @classmethod
+    async def __bakery_swap_in__(
+        cls,
+        *swaps: tuple[Any, Any],
+    ) -> list[tuple[Cakeable, Pastry[Any]]]:
+        """Bake new cakes (cake, new cake) and fresh copies of their dependents.
+
+        Then put them in place of the old ones. Returned pastries
+        keep the old baked cakes: swap them back or unbake them.
+        """
+        new_pastries: dict[int, Pastry[Any]] = {
+            id(cake): new_bakery_pastry(cake, new_cake) for cake, new_cake in swaps
+        }
+        return await cls.__bakery_bake_in__(
+            cls.__bakery_dependents__(*(cake for cake, _ in swaps)), new_pastries
+        )
+
+    @classmethod
+    async def __bakery_bake_in__(
+        cls,
+        swap_order: list[Cakeable],
+        new_pastries: dict[int, Pastry[Any]],
+    ) -> list[tuple[Cakeable, Pastry[Any]]]:
+        """Bake new pastries (by cake id) or fresh copies of the cakes in order.
+
+        Then put them in place of the old ones. On failure the old cakes
+        are back in place and the new ones are unbaked.
+        """
+        swapped: list[tuple[Cakeable, Pastry[Any]]] = []
+        swap_cake: Cakeable
+        for swap_cake in swap_order:
+            pastry: Pastry[Any] = new_pastries.get(id(swap_cake)) or fresh_pastry(swap_cake)
+            try:
+                await pastry.__aenter__()
+            except (Exception, BaseException) as exc:
+                logger.error(f"{swap_cake} cannot be baked: {exc}")
+                await pastry.__aexit__(None, None, None)
+                # swap back: old cakes are in place again, new ones are unbaked
+                for swapped_cake, swapped_pastry in reversed(swapped):
+                    swapped_cake.__cake_swap__(swapped_pastry)
+                    await swapped_pastry.__aexit__(None, None, None)
+                reset_bakery_graph(cls)
+                raise
+
+            swap_cake.__cake_swap__(pastry)
+            swapped.append((swap_cake, pastry))
+
+        reset_bakery_graph(cls)
+        return swapped
+
+    @classmethod
+    async def __bakery_swap_back__(cls, swapped: list[tuple[Cakeable, Pastry[Any]]]) -> None:
+        """Put old cakes back in place and unbake the swapped in ones."""
+        for cake, pastry in reversed(swapped):
+            cake.__cake_swap__(pastry)
+        reset_bakery_graph(cls)
+        await unbake_swapped(swapped)
+        logger.debug(f"Bakery '{cls.__qualname__}': swapped cakes are restored")
+
+
+def new_bakery_pastry(cake: Cakeable, new_cake: Any) -> Pastry[Any]:
+    """Pastry baked from new cake (or value) under the old cake name."""
+    if is_cake(new_cake):
+        pastry: Pastry[Any] = Pastry(
+            new_cake.__cake_recipe__,
+            *new_cake.__cake_recipe_args__,
+            _cake_baking_method=new_cake.__cake_baking_method__,
+            _cake_name=cake.__cake_name__,
+            **new_cake.__cake_recipe_kwargs__,
+        )
+        pastry._Pastry__cake_factory = new_cake.__cake_factory__  # type: ignore[attr-defined]
+        pastry._Pastry__cake_fork_safe = new_cake._Pastry__cake_fork_safe  # type: ignore[attr-defined]
+        return pastry
+    return Pastry(
+        new_cake,
+        _cake_baking_method=BakingMethod.BAKE_NO_BAKE,
+        _cake_name=cake.__cake_name__,
+    )
+
+
+async def unbake_swapped(swapped: list[tuple[Cakeable, Pastry[Any]]]) -> None:
+    """Unbake all swapped pastries in reverse order.
+
+    Every pastry is unbaked even if others fail: errors are chained.
+    """
+    async with AsyncExitStack() as stack:
+        for _, pastry in swapped:
+            stack.push_async_callback(pastry.__aexit__, None, None, None)
+
+
+def run_sync(coro: Coroutine[Any, Any, R], bakery_name: str) -> R:
+    """Run bakery coroutine without event loop.
+
+    Synchronous recipes never suspend the coroutine, so it is completed
+    by the very first step. Suspended coroutine waits for an event loop:
+    TypeError is thrown into it to unbake what is already baked.
+    """
+    token = SYNC_BAKING.set(True)
+    error: TypeError | None = None
+    try:
+        while True:
+            try:
+                if error is None:
+                    coro.send(None)
+                else:
+                    coro.throw(error)
+            except StopIteration as exc:
+                return exc.value  # type: ignore[no-any-return]
+            error = TypeError(
+                f"Bakery '{bakery_name}' cannot be baked without event loop: "
+                "some recipe is asynchronous. Use 'async with'."
+            )
+    finally:
+        SYNC_BAKING.reset(token)
@@ -1,7 +1,8 @@
 # isort: skip_file
-from typing import Any, TypeVar, Literal
+from typing import Any, Awaitable, Callable, TypeVar, Literal
 from typing_extensions import dataclass_transform
 
+from .graph import BakeryGraph
 from .stuff import Cakeable
 from .cake import __Cake__
 
@@ -11,12 +12,26 @@ def no_init_field(
     *,
     init: Literal[False] = False,
 ) -> Any: ...
+
 @dataclass_transform(kw_only_default=True, field_specifiers=(no_init_field, __Cake__))
 class Bakery:
     __bakery_visitors__: int
     __bakery_items__: dict[str, Cakeable[Any]]
+    __bakery_graph__: BakeryGraph | None
+    __bakery_fork_aware__: bool
+    __bakery_forked__: bool
+    __bakery_inherited__: frozenset[int]
+    def __init_subclass__(
+        cls,
+        *,
+        fork_aware: bool = False,
+        autowire: bool = False,
+        **kwargs: Any,
+    ) -> None: ...
     async def __aenter__(self: T) -> T: ...
     async def __aexit__(self, *_args: object) -> None: ...
+    def __enter__(self: T) -> T: ...
+    def __exit__(self, *_args: object) -> None: ...
     @classmethod
     async def aopen(cls: type[T]) -> T: ...
     @classmethod
@@ -24,3 +39,33 @@ class Bakery:
         cls,
         *_args: Any,
     ) -> None: ...
+    @classmethod
+    def open(cls: type[T]) -> T: ...
+    @classmethod
+    def close(
+        cls,
+        *_args: Any,
+    ) -> None: ...
+    @classmethod
+    def __bakery_after_fork__(cls) -> None: ...
+    @classmethod
+    async def rebake(cls, *cakes: Cakeable[Any]) -> None: ...
+    @classmethod
+    async def __bakery_swap_in__(
+        cls,
+        *swaps: tuple[Any, Any],
+    ) -> list[tuple[Cakeable[Any], Any]]: ...
+    @classmethod
+    async def __bakery_swap_back__(cls, swapped: list[tuple[Cakeable[Any], Any]]) -> None: ...
+    @classmethod
+    async def swap(
+        cls,
+        cake: Cakeable[Any],
+        new_cake: Any,
+        *,
+        drain: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None: ...
+
+BAKERY_LISTENERS: list[Callable[[type[Bakery], str, str | None], None]]
+
+def notify_listeners(bakery: type[Bakery], event: str, cake_name: str | None = None) -> None: ...
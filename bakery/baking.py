@@ -10,8 +10,8 @@ __all__ = [
     "determine_baking_method",
     "unbake",
 ]
+from contextvars import ContextVar
 from enum import IntEnum, auto
-from inspect import isawaitable, iscoroutinefunction
 from typing import Any, AsyncContextManager, ContextManager, Final, TypeVar
 
 from .stuff import _LOGGER as logger  # noqa: N811
@@ -32,6 +32,54 @@ class BakingMethod(IntEnum):
     BAKE_FROM_BUILTIN = auto()
     BAKE_FROM_CALL = auto()
     BAKE_NO_BAKE = auto()
+    # new methods are appended: values of existing ones never change
+    BAKE_FROM_ASYNC_GEN_FUNC = auto()
+    BAKE_FROM_GEN_FUNC = auto()
+
+
+# recipes requiring an event loop
+ASYNC_BAKING_METHODS: Final = frozenset(
+    (
+        BakingMethod.BAKE_FROM_CORO_FUNC,
+        BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC,
+        BakingMethod.BAKE_FROM_AWAITABLE,
+        BakingMethod.BAKE_FROM_ACM,
+    )
+)
+# generator is created on baking and required to unbake
+GENERATOR_BAKING_METHODS: Final = frozenset(
+    (
+        BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC,
+        BakingMethod.BAKE_FROM_GEN_FUNC,
+    )
+)
+# set while bakery is baked without event loop (Bakery.open/close)
+SYNC_BAKING: Final[ContextVar[bool]] = ContextVar("bakery_sync_baking", default=False)
+
+
+def is_coroutine_function(recipe: Any) -> bool:
+    # inspect is heavy to import, it's not required until the first cake
+    from inspect import iscoroutinefunction  # noqa: PLC0415
+
+    return iscoroutinefunction(recipe)
+
+
+def is_awaitable(recipe: Any) -> bool:
+    from inspect import isawaitable  # noqa: PLC0415
+
+    return isawaitable(recipe)
+
+
+def is_async_generator_function(recipe: Any) -> bool:
+    from inspect import isasyncgenfunction  # noqa: PLC0415
+
+    return isasyncgenfunction(recipe)
+
+
+def is_generator_function(recipe: Any) -> bool:
+    from inspect import isgeneratorfunction  # noqa: PLC0415
+
+    return isgeneratorfunction(recipe)
 
 
 BAKING_METHODS: Final = {
@@ -39,8 +87,10 @@ BAKING_METHODS: Final = {
     BakingMethod.BAKE_FROM_CM: lambda _recipe: isinstance(_recipe, ContextManager),
     BakingMethod.BAKE_FROM_ACM: lambda _recipe: isinstance(_recipe, AsyncContextManager),
     BakingMethod.BAKE_FROM_BUILTIN: lambda _recipe: isinstance(_recipe, BUILTIN_TYPES),
-    BakingMethod.BAKE_FROM_CORO_FUNC: lambda _recipe: iscoroutinefunction(_recipe),
-    BakingMethod.BAKE_FROM_AWAITABLE: lambda _recipe: isawaitable(_recipe),
+    BakingMethod.BAKE_FROM_CORO_FUNC: is_coroutine_function,
+    BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC: is_async_generator_function,
+    BakingMethod.BAKE_FROM_GEN_FUNC: is_generator_function,
+    BakingMethod.BAKE_FROM_AWAITABLE: is_awaitable,
     BakingMethod.BAKE_NO_BAKE: lambda _recipe: True,
 }
 
@@ -56,6 +106,8 @@ def determine_baking_method(recipe: Any) -> BakingMethod:
 
     for method in [
         BakingMethod.BAKE_FROM_CORO_FUNC,
+        BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC,
+        BakingMethod.BAKE_FROM_GEN_FUNC,
         BakingMethod.BAKE_FROM_AWAITABLE,
         BakingMethod.BAKE_FROM_ACM,
         BakingMethod.BAKE_FROM_CM,
@@ -101,6 +153,15 @@ async def bake_from_coro_func(recipe: Any, args: Any, kwargs: Any) -> Any:
     return await recipe(*replace_cakes(args), **replace_cakes(kwargs))
 
 
+async def bake_from_async_gen(generator: Any, _args: Any, _kwargs: Any) -> Any:
+    # generator is created with arguments beforehand: it's required to unbake
+    return await generator.__anext__()
+
+
+async def bake_from_gen(generator: Any, _args: Any, _kwargs: Any) -> Any:
+    return next(generator)
+
+
 async def bake_from_awaitable(recipe: Any, _args: Any, _kwargs: Any) -> Any:
     return await recipe
 
@@ -115,6 +176,8 @@ METHOD_2_HOW_TO_BAKE: Final = {
     BakingMethod.BAKE_FROM_CM: bake_from_cm,
     BakingMethod.BAKE_FROM_ACM: bake_from_acm,
     BakingMethod.BAKE_FROM_CORO_FUNC: bake_from_coro_func,
+    BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC: bake_from_async_gen,
+    BakingMethod.BAKE_FROM_GEN_FUNC: bake_from_gen,
     BakingMethod.BAKE_FROM_AWAITABLE: bake_from_awaitable,
     BakingMethod.BAKE_NO_BAKE: bake_no_bake,
 }
@@ -129,8 +192,22 @@ async def bake_recipe(
     cake_name: str,
 ) -> Any:
     if baking_method not in METHOD_2_HOW_TO_BAKE:
-        msg = f"{cake_name}: Unknown baking method '{baking_method}' " f"for recipe {recipe}"
+        msg = f"{cake_name}: Unknown baking method '{baking_method}' for recipe {recipe}"
         raise ValueError(msg)
+    if (
+        SYNC_BAKING.get()
+        and baking_method in ASYNC_BAKING_METHODS
+        # e.g. nested bakery is both sync and async context manager
+        and not isinstance(recipe, ContextManager)
+    ):
+        if baking_method == BakingMethod.BAKE_FROM_AWAITABLE and hasattr(recipe, "close"):
+            # coroutine is never awaited: avoid RuntimeWarning
+            recipe.close()
+        msg = (
+            f"{cake_name}: cannot be baked without event loop "
+            f"from asynchronous recipe {recipe} ({baking_method.name}). Use 'async with'."
+        )
+        raise TypeError(msg)
 
     return await METHOD_2_HOW_TO_BAKE[baking_method](
         recipe,
@@ -139,6 +216,44 @@ async def bake_recipe(
     )
 
 
+async def unbake_async_generator(generator: Any, exc_value: BaseException | None) -> None:
+    """Run async generator teardown (the code after yield)."""
+    try:
+        if exc_value is None:
+            await generator.__anext__()
+        else:
+            await generator.athrow(exc_value)
+    except StopAsyncIteration:
+        return
+    except BaseException as exc:
+        if exc is exc_value:
+            return
+        raise
+
+    await generator.aclose()
+    msg = f"Async generator {generator} didn't stop after the first yield"
+    raise RuntimeError(msg)
+
+
+def unbake_generator(generator: Any, exc_value: BaseException | None) -> None:
+    """Run generator teardown (the code after yield)."""
+    try:
+        if exc_value is None:
+            next(generator)
+        else:
+            generator.throw(exc_value)
+    except StopIteration:
+        return
+    except BaseException as exc:
+        if exc is exc_value:
+            return
+        raise
+
+    generator.close()
+    msg = f"Generator {generator} didn't stop after the first yield"
+    raise RuntimeError(msg)
+
+
 T = TypeVar("T")
 
 
@@ -0,0 +1,439 @@
+"""Cached cakes.
+
+Deterministic cakes (compiled tables, parsed schemas, indexes built from static files)
+are baked once and loaded from the local disk cache on the next process start.
+"""
+
+from __future__ import annotations
+
+__all__ = ["DiskCache", "cached"]
+
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+from contextlib import suppress
+from dataclasses import fields, is_dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import partial
+from pathlib import Path, PurePath
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any, Final, Iterable, Protocol, cast
+from uuid import UUID
+
+from .baking import BakingMethod
+from .cake import Cake
+from .stuff import _LOGGER as logger  # noqa: N811
+from .stuff import is_cake
+
+if TYPE_CHECKING:
+    from .stuff import Cakeable
+
+CACHE_SUFFIX: Final = ".cake"
+# types with deterministic repr
+SCALAR_TYPES: Final = (
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Enum,
+    PurePath,
+    date,
+    time,
+    timedelta,
+    Decimal,
+    UUID,
+)
+
+
+class Serializer(Protocol):
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: Any) -> Any: ...
+
+
+def default_cache_directory() -> Path:
+    directory: str | None = os.environ.get("BAKERY_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "fresh-bakery"
+
+
+def code_identity(code: CodeType) -> tuple[Any, ...]:
+    """Bytecode, names and constants (nested functions code too)."""
+    consts: list[Any] = []
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            consts.append(code_identity(const))
+        elif isinstance(const, frozenset):
+            # set order depends on hash seed
+            consts.append(sorted(map(repr, const)))
+        else:
+            consts.append(repr(const))
+    return (code.co_code, code.co_names, tuple(consts))
+
+
+def canonical(obj: Any) -> Any:
+    """Canonical form of recipe argument: equal arguments have equal forms.
+
+    Sets and dicts are sorted, so the form does not depend on hash seed
+    or insertion order. TypeError is raised for unknown types.
+    """
+    type_name: str = f"{type(obj).__module__}.{type(obj).__qualname__}"
+    if obj is None or isinstance(obj, SCALAR_TYPES):
+        return (type_name, repr(obj))
+    if isinstance(obj, (tuple, list)):
+        return (type_name, tuple(map(canonical, obj)))
+    if isinstance(obj, (set, frozenset)):
+        return (type_name, tuple(sorted(map(canonical, obj), key=repr)))
+    if isinstance(obj, dict):
+        items: Iterable[tuple[Any, Any]] = (
+            (canonical(key), canonical(value)) for key, value in obj.items()
+        )
+        return (type_name, tuple(sorted(items, key=repr)))
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return (
+            type_name,
+            canonical({field.name: getattr(obj, field.name) for field in fields(obj)}),
+        )
+
+    msg = f"{type_name} cannot be a cache key"
+    raise TypeError(msg)
+
+
+def class_identity(cls: type) -> tuple[Any, ...]:
+    """Code of the class methods (base classes too), builtin classes have none."""
+    identity: list[Any] = []
+    for base in cls.__mro__:
+        methods: list[tuple[str, Any]] = []
+        for name, member in sorted(vars(base).items()):
+            functions: tuple[Any, ...] = (
+                (member.fget, member.fset, member.fdel)
+                if isinstance(member, property)
+                else (getattr(member, "__func__", member),)
+            )
+            methods.extend(
+                (name, code_identity(function.__code__))
+                for function in functions
+                if isinstance(function, FunctionType)
+            )
+        if methods:
+            identity.append((f"{base.__module__}.{base.__qualname__}", tuple(methods)))
+    return tuple(identity)
+
+
+def function_form(function: FunctionType, seen: frozenset[int]) -> Any:
+    """Function code, defaults and closure values."""
+    closure: list[Any] = []
+    for cell in function.__closure__ or ():
+        try:
+            value: Any = cell.cell_contents
+        except ValueError:
+            # not assigned yet
+            value = None
+        closure.append(
+            recipe_form(value, seen)
+            if isinstance(value, (FunctionType, partial, type))
+            else canonical(value)
+        )
+    return (
+        code_identity(function.__code__),
+        canonical(function.__defaults__),
+        canonical(function.__kwdefaults__),
+        tuple(closure),
+    )
+
+
+def recipe_form(recipe: Any, seen: frozenset[int] = frozenset()) -> Any:
+    """Recipe import path, code and bound arguments.
+
+    TypeError is raised if the recipe cannot be identified.
+    """
+    path: str = (
+        f"{getattr(recipe, '__module__', '')}."
+        f"{getattr(recipe, '__qualname__', type(recipe).__qualname__)}"
+    )
+    if id(recipe) in seen:
+        # recursive closure
+        return path
+    seen |= {id(recipe)}
+
+    if isinstance(recipe, partial):
+        return (
+            path,
+            recipe_form(recipe.func, seen),
+            canonical(recipe.args),
+            canonical(recipe.keywords),
+        )
+    if isinstance(recipe, (MethodType, BuiltinFunctionType)):
+        owner: Any = recipe.__self__
+        if owner is None or isinstance(owner, ModuleType):
+            # builtin functions are bound to their modules
+            owner = None
+        else:
+            owner = recipe_form(owner, seen) if isinstance(owner, type) else canonical(owner)
+        return (
+            recipe_form(recipe.__func__, seen) if isinstance(recipe, MethodType) else path,
+            owner,
+        )
+    if isinstance(recipe, FunctionType):
+        return (path, function_form(recipe, seen))
+    if isinstance(recipe, type):
+        return (path, class_identity(recipe))
+    if not callable(recipe):
+        msg = f"{recipe!r} is not callable"
+        raise TypeError(msg)
+
+    # instance fields are arguments of its __call__
+    return (recipe_form(type(recipe), seen), canonical(recipe))
+
+
+def recipe_identity(recipe: Any) -> str:
+    """Recipe identity: import path, code and bound arguments.
+
+    Functions are identified by their code, constants, defaults and closures,
+    classes by the code of their methods, partials and bound methods
+    by their functions and bound arguments, callable instances
+    by their class and fields (dataclasses only).
+    Changed recipe code invalidates the cache, changed code it calls does not.
+    TypeError is raised if the recipe cannot be identified.
+    """
+    return hashlib.sha256(repr(recipe_form(recipe)).encode()).hexdigest()
+
+
+class DiskCache:
+    """Local disk cache of baked results.
+
+    Entries are evicted in least recently used order
+    when cache directory size exceeds 'max_size' bytes.
+    Entries are pickled unless another serializer (dumps/loads) is set.
+    Use 'memory_map' to load entries from memory-mapped files
+    (serializer 'loads' receives memoryview then).
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        max_size: int | None = None,
+        serializer: Serializer | None = None,
+        memory_map: bool = False,
+    ) -> None:
+        self.directory: Final = Path(directory) if directory else default_cache_directory()
+        self.max_size: Final = max_size
+        self.serializer: Final[Serializer] = serializer or cast("Serializer", pickle)
+        self.memory_map: Final = memory_map
+
+    def __repr__(self) -> str:
+        return f"DiskCache '{self.directory}'"
+
+    def key(self, recipe: Any, args: Any, kwargs: Any, *, version: str = "") -> str | None:
+        """Cache key of recipe baked with resolved arguments.
+
+        None if arguments cannot be keyed: only builtin scalars and containers,
+        enums, paths, dates, decimals, UUIDs and dataclasses can.
+        TypeError is raised if the recipe cannot be identified.
+        """
+        try:
+            arguments: bytes = repr(canonical((tuple(args), dict(kwargs)))).encode()
+        except TypeError as exc:
+            logger.debug(f"{self}: arguments of {recipe} cannot be hashed: {exc}")
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(recipe_identity(recipe).encode())
+        digest.update(version.encode())
+        digest.update(arguments)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        """Load cached value: (found, value)."""
+        path: Path = self.path(key)
+        try:
+            with path.open("rb") as file:
+                if self.memory_map:
+                    value: Any = self.serializer.loads(
+                        memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+                    )
+                else:
+                    value = self.serializer.loads(file.read())
+        except FileNotFoundError:
+            return False, None
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"{self}: entry '{key}' is broken and removed: {exc}")
+            path.unlink(missing_ok=True)
+            return False, None
+
+        # least recently used are evicted first
+        # (unless evicted by another process: the value is loaded anyway)
+        with suppress(FileNotFoundError):
+            os.utime(path)
+        return True, value
+
+    def store(self, key: str, value: Any) -> None:
+        try:
+            data: bytes = self.serializer.dumps(value)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"{self}: value cannot be cached: {exc}")
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # readers never see partially written entry: it is moved in place at once
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix=".tmp")
+        tmp_path: Path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            tmp_path.replace(self.path(key))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def __stats(self) -> list[tuple[Path, os.stat_result]]:
+        """Cache entries with their stats, least recently used first."""
+        if not self.directory.is_dir():
+            return []
+
+        stats: list[tuple[Path, os.stat_result]] = []
+        for entry in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stats.append((entry, entry.stat()))
+            except FileNotFoundError:  # noqa: PERF203
+                # removed by another process
+                continue
+        return sorted(stats, key=lambda item: item[1].st_mtime)
+
+    def entries(self) -> list[Path]:
+        """Cache entries, least recently used first."""
+        return [entry for entry, _ in self.__stats()]
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self.__stats())
+
+    def evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        stats: list[tuple[Path, os.stat_result]] = self.__stats()
+        size: int = sum(stat.st_size for _, stat in stats)
+        for entry, stat in stats:
+            if size <= self.max_size:
+                break
+            size -= stat.st_size
+            entry.unlink(missing_ok=True)
+            logger.debug(f"{self}: entry '{entry.stem}' is evicted")
+
+    def invalidate(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            entry.unlink(missing_ok=True)
+
+
+class CachedRecipe:
+    """Recipe of cached cake: load it from the cache or bake and store it."""
+
+    def __init__(
+        self,
+        recipe: Any,
+        *,
+        cache: DiskCache,
+        version: str,
+        name: str,
+    ) -> None:
+        self.recipe: Final = recipe
+        self.cache: Final = cache
+        self.version: Final = version
+        self.name: Final = name
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} '{self.name}'"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key, found, value = self.load(args, kwargs)
+        if not found:
+            value = self.recipe(*args, **kwargs)
+            self.store(key, value)
+        return value
+
+    def load(self, args: Any, kwargs: Any) -> tuple[str | None, bool, Any]:
+        """Cache key and cached value: (key, found, value)."""
+        key: str | None = self.cache.key(self.recipe, args, kwargs, version=self.version)
+        if key is None:
+            return None, False, None
+
+        found, value = self.cache.load(key)
+        if found:
+            logger.debug(f"{self} is loaded from {self.cache}")
+        return key, found, value
+
+    def store(self, key: str | None, value: Any) -> None:
+        if key is not None:
+            self.cache.store(key, value)
+
+
+class AsyncCachedRecipe(CachedRecipe):
+    """Cached recipe of coroutine function."""
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+        key, found, value = self.load(args, kwargs)
+        if not found:
+            value = await self.recipe(*args, **kwargs)
+            self.store(key, value)
+        return value
+
+
+def cached(cake: Any, *, cache: DiskCache | None = None, version: str = "") -> Any:
+    """Cache cake on the local disk.
+
+    The key is recipe identity (see 'recipe_identity') and resolved
+    arguments hash. Change 'version' to invalidate cached results
+    when something else the recipe depends on (e.g. files or functions
+    it calls) changes. Cake recipe must be a deterministic function
+    or coroutine function, TypeError is raised if it cannot be identified.
+    """
+    if not is_cake(cake):
+        cake = Cake(cake)
+
+    pastry: Cakeable[Any] = cake
+    if pastry.__cake_baking_method__ not in (
+        BakingMethod.BAKE_FROM_CALL,
+        BakingMethod.BAKE_FROM_CORO_FUNC,
+    ):
+        msg = (
+            f"{pastry}: cached cake recipe must be a function or a coroutine function, "
+            f"not {pastry.__cake_baking_method__.name}"
+        )
+        raise TypeError(msg)
+    try:
+        recipe_identity(pastry.__cake_recipe__)
+    except TypeError as exc:
+        msg = f"{pastry}: cached cake recipe cannot be identified: {exc}"
+        raise TypeError(msg) from exc
+
+    recipe_type: type[CachedRecipe] = (
+        AsyncCachedRecipe
+        if pastry.__cake_baking_method__ == BakingMethod.BAKE_FROM_CORO_FUNC
+        else CachedRecipe
+    )
+    recipe: CachedRecipe = recipe_type(
+        pastry.__cake_recipe__,
+        cache=cache or DiskCache(),
+        version=version,
+        name=getattr(pastry.__cake_recipe__, "__qualname__", repr(pastry.__cake_recipe__)),
+    )
+    if isinstance(recipe, AsyncCachedRecipe):
+        # the outer cake awaits the coroutine
+        return Cake(Cake(recipe, *pastry.__cake_recipe_args__, **pastry.__cake_recipe_kwargs__))
+    # sync recipe is baked without event loop too
+    return Cake(recipe, *pastry.__cake_recipe_args__, **pastry.__cake_recipe_kwargs__)
@@ -5,14 +5,26 @@ Book, recipes, etc.
 
 from __future__ import annotations
 
-__all__ = ["Cake", "Pastry", "__Cake__", "hand_made"]
+__all__ = [
+    "Cake",
+    "Pastry",
+    "__Cake__",
+    "autowired",
+    "factory",
+    "fork_safe",
+    "hand_made",
+    "lazy",
+]
 
 from contextlib import contextmanager
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import partial
+from time import perf_counter
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncContextManager,
+    AsyncIterator,
     Awaitable,
     Callable,
     ContextManager,
@@ -25,29 +37,45 @@ from typing import (
     overload,
 )
 
-from typing_extensions import ParamSpec, Self
-
-from .baking import BakingMethod, bake_recipe, check_baking_method, determine_baking_method
+from .baking import (
+    GENERATOR_BAKING_METHODS,
+    BakingMethod,
+    bake_recipe,
+    check_baking_method,
+    determine_baking_method,
+    unbake_async_generator,
+    unbake_generator,
+)
 from .piece_of_cake import PieceOfCake
 from .stuff import _LOGGER as logger  # noqa: N811
 from .stuff import (
+    Cakeable,
     CakeRecipe,
     assert_baked,
     flatten,
-    is_baked,
+    import_string,
     is_cake,
     is_cake_or_piece,
+    is_iterable,
+    is_mapping,
     is_piece_of_cake,
     recipe_format,
+    replace_cakes,
 )
 from .stuff.types import UNDEFINED
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from typing_extensions import ParamSpec, Self
+
 
 R = TypeVar("R")
 
+# discarded baked values and recipes are never garbage collected:
+# their finalizers (e.g. generator 'finally') must not run in forked child
+DISCARDED: Final[list[Any]] = []
+
 
 class Pastry(CakeRecipe, Generic[R]):
     """Pastry is a public cake interface with almost zero name collision.
@@ -75,7 +103,15 @@ class Pastry(CakeRecipe, Generic[R]):
         self.__cake_baking_method: BakingMethod = _cake_baking_method
         self.__cake_result: Any = None
         self.__cake_is_baked: bool = False
+        # recipe the cake was baked from (cakes and pieces are called)
+        self.__cake_baked_recipe: Any = None
+        # the last bake/unbake durations (seconds)
+        self.__cake_bake_duration: float | None = None
+        self.__cake_unbake_duration: float | None = None
         self.__cake_name: str = _cake_name
+        self.__cake_fork_safe: bool = False
+        # baked value is a constructor called on every access
+        self.__cake_factory: bool = False
 
         self.__cake_replaced: Pastry | None = None
 
@@ -86,6 +122,7 @@ class Pastry(CakeRecipe, Generic[R]):
 
         if self.__cake_baking_method == BakingMethod.BAKE_NO_BAKE:
             self.__cake_result = self.__cake_recipe
+            self.__cake_baked_recipe = self.__cake_recipe
             self.__cake_is_baked = True
 
     def __set_name__(self, _: Any, name: str) -> None:
@@ -107,6 +144,23 @@ class Pastry(CakeRecipe, Generic[R]):
     def __cake_baking_method__(self) -> BakingMethod:
         return self.__cake_baking_method
 
+    @property
+    def __cake_fork_safe__(self) -> bool:
+        # plain values have nothing to share with the parent process
+        return self.__cake_fork_safe or self.__cake_baking_method is BakingMethod.BAKE_NO_BAKE
+
+    @property
+    def __cake_factory__(self) -> bool:
+        return self.__cake_factory
+
+    @property
+    def __cake_bake_duration__(self) -> float | None:
+        return self.__cake_bake_duration
+
+    @property
+    def __cake_unbake_duration__(self) -> float | None:
+        return self.__cake_unbake_duration
+
     @property
     def __cake_recipe__(self) -> R:
         return self.__cake_recipe
@@ -129,6 +183,7 @@ class Pastry(CakeRecipe, Generic[R]):
         _cake_recipe: Any,
         *_cake_recipe_args: Any,
         _cake_baking_method: BakingMethod = BakingMethod.BAKE_AUTO,
+        _cake_factory: bool = False,
         **_cake_recipe_kwargs: Any,
     ) -> Iterator[Self]:
         if self.__cake_replaced:
@@ -147,8 +202,10 @@ class Pastry(CakeRecipe, Generic[R]):
         self.__cake_recipe_args = _cake_recipe_args  # type: ignore[misc]
         self.__cake_recipe_kwargs = _cake_recipe_kwargs  # type: ignore[misc]
         self.__cake_baking_method = _cake_baking_method
+        self.__cake_factory = _cake_factory
         self.__cake_is_baked = False
         self.__cake_result = None
+        self.__cake_baked_recipe = None
 
         new_recipe_fmt: str = recipe_format(self.__cake_recipe, self.__cake_baking_method)
 
@@ -161,6 +218,7 @@ class Pastry(CakeRecipe, Generic[R]):
             self.__cake_recipe_args = self.__cake_replaced.__cake_recipe_args__  # type: ignore[misc]
             self.__cake_recipe_kwargs = self.__cake_replaced.__cake_recipe_kwargs__  # type: ignore[misc]
             self.__cake_baking_method = self.__cake_replaced.__cake_baking_method__
+            self.__cake_factory = self.__cake_replaced.__cake_factory__
             self.__cake_replaced = None
             if is_replacement:
                 logger.debug(f"{self} was restored: {orig_recipe_fmt} <== {new_recipe_fmt}")
@@ -172,6 +230,66 @@ class Pastry(CakeRecipe, Generic[R]):
             )
             raise TypeError(msg)
 
+    def __cake_swap__(self, other: Pastry[Any]) -> None:
+        """Swap ingredients and baked state with other pastry.
+
+        Cake names are left as is.
+        """
+        (
+            self.__cake_recipe,  # type: ignore[misc]
+            other.__cake_recipe,  # type: ignore[misc]
+        ) = (other.__cake_recipe, self.__cake_recipe)
+        (
+            self.__cake_recipe_args,  # type: ignore[misc]
+            other.__cake_recipe_args,  # type: ignore[misc]
+        ) = (other.__cake_recipe_args, self.__cake_recipe_args)
+        (
+            self.__cake_recipe_kwargs,  # type: ignore[misc]
+            other.__cake_recipe_kwargs,  # type: ignore[misc]
+        ) = (other.__cake_recipe_kwargs, self.__cake_recipe_kwargs)
+        self.__cake_baking_method, other.__cake_baking_method = (
+            other.__cake_baking_method,
+            self.__cake_baking_method,
+        )
+        self.__cake_result, other.__cake_result = other.__cake_result, self.__cake_result
+        self.__cake_is_baked, other.__cake_is_baked = other.__cake_is_baked, self.__cake_is_baked
+        self.__cake_baked_recipe, other.__cake_baked_recipe = (
+            other.__cake_baked_recipe,
+            self.__cake_baked_recipe,
+        )
+        self.__cake_bake_duration, other.__cake_bake_duration = (
+            other.__cake_bake_duration,
+            self.__cake_bake_duration,
+        )
+        self.__cake_unbake_duration, other.__cake_unbake_duration = (
+            other.__cake_unbake_duration,
+            self.__cake_unbake_duration,
+        )
+        self.__cake_fork_safe, other.__cake_fork_safe = (
+            other.__cake_fork_safe,
+            self.__cake_fork_safe,
+        )
+        self.__cake_factory, other.__cake_factory = other.__cake_factory, self.__cake_factory
+
+    def __cake_discard__(self) -> None:
+        """Forget baked value without unbaking it.
+
+        The value (e.g. connection) is owned by somebody else,
+        like the parent process after fork. It is never garbage collected here,
+        so its finalizers (e.g. generator 'finally') never run.
+        """
+        for _recipe in self.__anon_recipes():
+            _recipe.__cake_discard__()
+
+        if not self.__cake_is_baked:
+            return
+
+        DISCARDED.append((self.__cake_result, self.__cake_baked_recipe))
+        self.__cake_is_baked = False
+        self.__cake_result = None
+        self.__cake_baked_recipe = None
+        logger.debug(f"{self} is discarded")
+
     def __repr__(self) -> str:
         name: str = self.__cake_name or "<anon>"
         return f"Cake '{name}'"
@@ -181,26 +299,34 @@ class Pastry(CakeRecipe, Generic[R]):
 
         'Copy cake' just sounds like 'cupcake'. And I like cupcakes ;)
         """
-        return Pastry(
+        pastry: Pastry[R] = Pastry(
             self.__cake_recipe,
             *list(self.__cake_recipe_args),
             _cake_baking_method=self.__cake_baking_method,
             _cake_name=self.__cake_name,
             **dict(self.__cake_recipe_kwargs),
         )
+        pastry.__cake_factory = self.__cake_factory
+        return pastry
 
     def __deepcopy__(self, memo: Any) -> Pastry[R]:
         """Deep copy with all ingredients and technologies."""
-        return Pastry(
+        pastry: Pastry[R] = Pastry(
             self.__cake_recipe,
             *deepcopy(self.__cake_recipe_args),
             _cake_baking_method=self.__cake_baking_method,
             _cake_name=self.__cake_name,
             **deepcopy(self.__cake_recipe_kwargs),
         )
+        pastry.__cake_factory = self.__cake_factory
+        return pastry
 
     def __call__(self) -> Any:
-        assert_baked(self)
+        if not self.__cake_is_baked:
+            # the hot path: baked value is requested on every cake access
+            assert_baked(self)
+        if self.__cake_factory:
+            return self.__cake_result()
         return self.__cake_result
 
     def __getattr__(self, piece_name: str) -> PieceOfCake:
@@ -223,6 +349,23 @@ class Pastry(CakeRecipe, Generic[R]):
         # explicit __getattr__ call to avoid collisions
         return PieceOfCake(self).__getattr__(piece_name)
 
+    def __anon_recipes(self) -> Iterator[Pastry]:
+        """Anonymous cakes of the recipe.
+
+        Plain values (no bake) are never walked: they could be consumed
+        (iterators) or be endless.
+        """
+        if self.__cake_baking_method == BakingMethod.BAKE_NO_BAKE and not is_cake_or_piece(
+            self.__cake_recipe
+        ):
+            return
+        _recipe: Any
+        for _recipe in flatten(
+            [self.__cake_recipe, self.__cake_recipe_args, self.__cake_recipe_kwargs]
+        ):
+            if is_cake(_recipe) and _recipe.__cake_anon__:
+                yield _recipe
+
     def __getitem__(self, piece_name: Any) -> PieceOfCake:
         return PieceOfCake(self).__getitem__(piece_name)
 
@@ -230,6 +373,7 @@ class Pastry(CakeRecipe, Generic[R]):
         if self.__cake_is_baked:
             return self.__cake_result
 
+        started_at: float = perf_counter()
         for recipe in flatten(
             [self.__cake_recipe_args, self.__cake_recipe_kwargs, self.__cake_recipe]
         ):
@@ -243,15 +387,32 @@ class Pastry(CakeRecipe, Generic[R]):
         if not self.__cake_baking_method:
             self.__cake_baking_method = determine_baking_method(recipe)
 
-        self.__cake_result = await bake_recipe(
-            recipe,
-            recipe_args=self.__cake_recipe_args,
-            recipe_kwargs=self.__cake_recipe_kwargs,
-            baking_method=self.__cake_baking_method,
-            cake_name=str(self),
-        )
+        if self.__cake_baking_method in GENERATOR_BAKING_METHODS:
+            # generator is baked and unbaked, so it's a baked recipe
+            recipe = recipe(
+                *replace_cakes(self.__cake_recipe_args),
+                **replace_cakes(self.__cake_recipe_kwargs),
+            )
+
+        if self.__cake_factory:
+            # dependencies are baked singletons: resolve them once
+            self.__cake_result = partial(
+                recipe,
+                *replace_cakes(self.__cake_recipe_args),
+                **replace_cakes(self.__cake_recipe_kwargs),
+            )
+        else:
+            self.__cake_result = await bake_recipe(
+                recipe,
+                recipe_args=self.__cake_recipe_args,
+                recipe_kwargs=self.__cake_recipe_kwargs,
+                baking_method=self.__cake_baking_method,
+                cake_name=str(self),
+            )
 
+        self.__cake_bake_duration = perf_counter() - started_at
         logger.debug(f"{self} is baked [{self.__cake_baking_method.name}]")
+        self.__cake_baked_recipe = recipe
         self.__cake_is_baked = True
         return self.__cake_result
 
@@ -263,24 +424,16 @@ class Pastry(CakeRecipe, Generic[R]):
     ) -> None:
         """Unbake anonymous recipes even if not self.__cake_is_baked.
 
-        Save recipe called value (recipe())
-        because it will be impossible to do it after recipe unbaked.
+        Recipe called value (recipe()) is saved on baking
+        because it will be impossible to get it after recipe unbaked
+        (or replaced).
         """
-        recipe: Any = self.__cake_recipe
-
-        is_cake_and_baked: bool = is_cake(recipe) and is_baked(recipe)
-        is_poc_and_baked: bool = is_piece_of_cake(recipe) and is_baked(recipe.cake)
-
-        if is_cake_and_baked or is_poc_and_baked:
-            recipe = recipe()
+        recipe: Any = self.__cake_baked_recipe
+        started_at: float = perf_counter()
 
-        _recipe: Any
-        for _recipe in flatten(
-            [self.__cake_recipe, self.__cake_recipe_args, self.__cake_recipe_kwargs]
-        ):
-            if is_cake(_recipe) and _recipe.__cake_anon__:
-                # unbake anonymous recipes only
-                await _recipe.__aexit__(exc_type, exc_value, traceback)
+        for _recipe in self.__anon_recipes():
+            # unbake anonymous recipes only
+            await _recipe.__aexit__(exc_type, exc_value, traceback)
 
         if not self.__cake_is_baked:
             return
@@ -294,13 +447,68 @@ class Pastry(CakeRecipe, Generic[R]):
             elif self.__cake_baking_method == BakingMethod.BAKE_FROM_ACM:
                 await recipe.__aexit__(exc_type, exc_value, traceback)
 
+            elif self.__cake_baking_method == BakingMethod.BAKE_FROM_GEN_FUNC:
+                unbake_generator(recipe, exc_value)
+
+            elif self.__cake_baking_method == BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC:
+                await unbake_async_generator(recipe, exc_value)
+
+        self.__cake_unbake_duration = perf_counter() - started_at
         logger.debug(f"{self} is unbaked")
 
         self.__cake_is_baked = False
+        self.__cake_baked_recipe = None
+
+
+def fresh_pastry(cake: Cakeable[R]) -> Pastry[R]:
+    """Copy cake with all its anonymous cakes to bake it once again.
+
+    Named cakes are not copied: the copy depends on the same ones.
+    """
+    baking_method: BakingMethod = cast(BakingMethod, cake.__cake_baking_method__)
+    if is_cake_or_piece(cake.__cake_recipe__):
+        # determined by the value baked from the cake (e.g. no bake): determine it again
+        baking_method = BakingMethod.BAKE_AUTO
+    pastry: Pastry[R] = Pastry(
+        fresh_anon_cakes(cake.__cake_recipe__),
+        *fresh_anon_cakes(cake.__cake_recipe_args__),
+        _cake_baking_method=baking_method,
+        _cake_name=cake.__cake_name__,
+        **fresh_anon_cakes(cake.__cake_recipe_kwargs__),
+    )
+    pastry._Pastry__cake_factory = cake.__cake_factory__  # type: ignore[attr-defined]
+    pastry._Pastry__cake_fork_safe = cake._Pastry__cake_fork_safe  # type: ignore[attr-defined]
+    return pastry
+
+
+def fresh_anon_cakes(obj: Any) -> Any:
+    """Replace all anonymous cakes with their fresh copies."""
+    res: Any
+
+    if is_mapping(obj):
+        res = copy(obj)
+        for key, value in obj.items():
+            res[fresh_anon_cakes(key)] = fresh_anon_cakes(value)
+
+    elif is_iterable(obj):
+        res = type(obj)(fresh_anon_cakes(item) for item in obj)
+
+    elif is_cake(obj) and obj.__cake_anon__:
+        res = fresh_pastry(obj)
+
+    elif is_piece_of_cake(obj) and is_cake(obj.cake) and obj.cake.__cake_anon__:
+        res = PieceOfCake(fresh_pastry(obj.cake))
+        res.pieces.extend(obj.pieces)
+
+    else:
+        res = obj
+
+    return res
 
 
 T = TypeVar("T")
-P = ParamSpec("P")
+if TYPE_CHECKING:
+    P = ParamSpec("P")
 
 
 def hand_made(cake: T, cake_baking_method: BakingMethod) -> T:
@@ -312,6 +520,88 @@ def hand_made(cake: T, cake_baking_method: BakingMethod) -> T:
     return cake
 
 
+@overload
+def autowired(
+    recipe: Callable[..., AsyncIterator[T]], *recipe_args: Any, **recipe_kwargs: Any
+) -> T: ...
+
+
+@overload
+def autowired(
+    recipe: Callable[..., Iterator[T]], *recipe_args: Any, **recipe_kwargs: Any
+) -> T: ...
+
+
+@overload
+def autowired(
+    recipe: Callable[..., Awaitable[T]], *recipe_args: Any, **recipe_kwargs: Any
+) -> T: ...
+
+
+@overload
+def autowired(recipe: Callable[..., T], *recipe_args: Any, **recipe_kwargs: Any) -> T: ...
+
+
+def autowired(recipe: Callable[..., T], *recipe_args: Any, **recipe_kwargs: Any) -> T:
+    """Cake with missing required arguments.
+
+    They are passed by autowired bakery (see Bakery 'autowire' argument).
+    """
+    return cast(T, Pastry(recipe, *recipe_args, **recipe_kwargs))
+
+
+def factory(cake: T) -> T:
+    """Transient cake: its value is constructed on every access.
+
+    Recipe must be a callable. Its dependencies (singleton cakes)
+    are resolved once on bake, so construction is just a recipe call.
+    """
+    if not is_cake(cake):
+        cake = Cake(cake)
+
+    pastry: Cakeable[Any] = cast("Cakeable[Any]", cake)
+    if pastry.__cake_baking_method__ != BakingMethod.BAKE_FROM_CALL:
+        msg = (
+            f"{pastry}: factory cake recipe must be a callable, "
+            f"not {pastry.__cake_baking_method__.name}"
+        )
+        raise TypeError(msg)
+
+    for dependency in flatten([pastry.__cake_recipe_args__, pastry.__cake_recipe_kwargs__]):
+        dependency_cake: Any = dependency.cake if is_piece_of_cake(dependency) else dependency
+        if is_cake(dependency_cake) and dependency_cake.__cake_factory__:
+            # it would be resolved once, not on every access
+            msg = f"{pastry}: factory cake cannot depend on another factory {dependency_cake}"
+            raise TypeError(msg)
+
+    cake._Pastry__cake_factory = True  # type: ignore[attr-defined]
+    return cake
+
+
+def fork_safe(cake: T) -> T:
+    """Fork safe cake.
+
+    Cake baked in the parent process is shared with forked children
+    of fork aware bakery. Use it for immutable data (settings, lookup tables),
+    not for connections and threads.
+    """
+    if not is_cake(cake):
+        cake = Cake(cake)
+
+    cake._Pastry__cake_fork_safe = True  # type: ignore[attr-defined]
+    return cake
+
+
+def lazy(path: str) -> Any:
+    """Lazy import: 'package.module:Object'.
+
+    Object (e.g. recipe) is imported when the cake is baked,
+    so its baking method is determined then too.
+    Mypy plugin knows the imported object type.
+    """
+    return Cake(import_string, path)
+
+
 @overload
 def Cake(recipe: Awaitable[T]) -> T: ...
 
@@ -324,6 +614,22 @@ def Cake(recipe: AsyncContextManager[T]) -> T: ...
 def Cake(recipe: ContextManager[T]) -> T: ...
 
 
+@overload
+def Cake(
+    recipe: Callable[P, AsyncIterator[T]],
+    *recipe_args: P.args,
+    **recipe_kwargs: P.kwargs,
+) -> T: ...
+
+
+@overload
+def Cake(
+    recipe: Callable[P, Iterator[T]],
+    *recipe_args: P.args,
+    **recipe_kwargs: P.kwargs,
+) -> T: ...
+
+
 @overload
 def Cake(
     recipe: Callable[P, Awaitable[T]],
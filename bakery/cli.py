@@ -0,0 +1,283 @@
+"""Bakery command line.
+
+Usage: python -m bakery <command> package.module:MyBakery
+"""
+
+from __future__ import annotations
+
+__all__ = ["main"]
+
+import argparse
+import asyncio
+import json
+import sys
+import types
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterator
+
+from .bakery import Bakery
+from .baking import BakingMethod
+from .export import export_dot, export_json, export_mermaid
+from .graph import BakeryGraph, bakery_graph
+from .snapshot import bakery_snapshot
+from .stuff import flatten, import_string, is_cake
+
+if TYPE_CHECKING:
+    from .stuff import Cakeable
+
+EXPORTERS: Final[dict[str, Callable[[type[Bakery]], str]]] = {
+    "dot": export_dot,
+    "mermaid": export_mermaid,
+    "json": export_json,
+}
+PERCENTILES: Final[tuple[float, ...]] = (50, 90, 99, 100)
+# recipe arguments are ignored
+NOT_CALLED_METHODS: Final = frozenset((BakingMethod.BAKE_FROM_BUILTIN, BakingMethod.BAKE_NO_BAKE))
+
+
+def import_bakery(path: str) -> type[Bakery]:
+    """Import bakery class by path."""
+    bakery: Any = import_string(path)
+    if not (isinstance(bakery, type) and issubclass(bakery, Bakery)):
+        msg = f"'{path}' is not a Bakery."
+        raise TypeError(msg)
+    return bakery
+
+
+def graph_command(args: argparse.Namespace) -> int:
+    """Export bakery graph. Bakery is not opened."""
+    sys.stdout.write(EXPORTERS[args.format](import_bakery(args.bakery)) + "\n")
+    return 0
+
+
+def snapshot_command(args: argparse.Namespace) -> int:
+    """Save bakery snapshot to load it with lazy imports."""
+    snapshot: str = json.dumps(bakery_snapshot(import_bakery(args.bakery)), indent=2)
+    if args.output:
+        Path(args.output).write_text(snapshot + "\n")
+    else:
+        sys.stdout.write(snapshot + "\n")
+    return 0
+
+
+def cake_with_anon_cakes(cake: Cakeable[Any]) -> Iterator[Cakeable[Any]]:
+    """The cake and all its (nested) anonymous cakes."""
+    cakes: list[Cakeable[Any]] = [cake]
+    while cakes:
+        anon_cake: Cakeable[Any] = cakes.pop()
+        yield anon_cake
+        cakes.extend(
+            item
+            for item in flatten(
+                [
+                    anon_cake.__cake_recipe__,
+                    anon_cake.__cake_recipe_args__,
+                    anon_cake.__cake_recipe_kwargs__,
+                ]
+            )
+            if is_cake(item) and item.__cake_anon__
+        )
+
+
+def check_bakery(bakery: type[Bakery]) -> tuple[list[str], list[str]]:
+    """Find bakery errors and warnings without opening the bakery."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    graph: BakeryGraph = bakery_graph(bakery)
+    warnings.extend(
+        f"'{name}' is undefined: pass it as {bakery.__qualname__}({name}=...)"
+        for name in graph.undefined
+    )
+    cycle: tuple[str, ...] = graph.cycle
+    if cycle:
+        errors.append(f"dependency cycle: {' -> '.join(cycle)}")
+
+    for name, cake in graph.cakes.items():
+        if cake.__cake_undefined__:
+            continue
+        for anon_cake in cake_with_anon_cakes(cake):
+            method: Any = anon_cake.__cake_baking_method__
+            recipe: Any = anon_cake.__cake_recipe__
+            if not isinstance(method, BakingMethod):
+                errors.append(f"'{name}': unknown baking method {method!r}")
+            elif method not in NOT_CALLED_METHODS:
+                continue
+            elif anon_cake.__cake_recipe_args__ or anon_cake.__cake_recipe_kwargs__:
+                warnings.append(
+                    f"'{name}': recipe {recipe!r} is not called, its arguments are ignored"
+                )
+            elif isinstance(recipe, (types.GeneratorType, types.AsyncGeneratorType)):
+                warnings.append(
+                    f"'{name}': recipe {recipe!r} is not bakeable, pass the function instead"
+                )
+    return errors, warnings
+
+
+def check_command(args: argparse.Namespace) -> int:
+    """Check bakery and print its startup layers. Bakery is not opened."""
+    try:
+        bakery: type[Bakery] = import_bakery(args.bakery)
+    except Exception as exc:  # noqa: BLE001
+        # e.g. dependency cycle is found on class creation
+        sys.stdout.write(f"error: cannot import '{args.bakery}': {exc}\n")
+        return 1
+
+    errors, warnings = check_bakery(bakery)
+    for error in errors:
+        sys.stdout.write(f"error: {error}\n")
+    for warning in warnings:
+        sys.stdout.write(f"warning: {warning}\n")
+    if errors:
+        return 1
+
+    graph: BakeryGraph = bakery_graph(bakery)
+    sys.stdout.write(
+        f"{bakery.__qualname__}: {len(graph)} cakes, {graph.depth} layers, "
+        f"up to {max(map(len, graph.layers), default=0)} cakes could be baked concurrently\n"
+    )
+    for index, layer in enumerate(graph.layers):
+        sys.stdout.write(f"layer {index} ({len(layer)}): {', '.join(layer)}\n")
+    if graph.depth:
+        sys.stdout.write(f"critical path: {' -> '.join(graph.critical_path())}\n")
+    return int(args.strict and bool(warnings))
+
+
+def parse_stub(stub: str) -> tuple[str, Any]:
+    """Parse NAME=VALUE stub: JSON literal or import path."""
+    name, sep, value = stub.partition("=")
+    if not sep or not name:
+        msg = f"Stub '{stub}' is not NAME=VALUE"
+        raise argparse.ArgumentTypeError(msg)
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, import_string(value)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    ordered: list[float] = sorted(values)
+    rank: int = max(int(len(ordered) * percent / 100 + 0.5) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+async def bench_bakery(
+    bakery: type[Bakery],
+    runs: int,
+    stubs: dict[str, Any] | None = None,
+) -> dict[str, list[float]]:
+    """Open and close bakery 'runs' times. Durations (seconds) by row name.
+
+    Bakery bakes cakes one by one: 'critical path' is the predicted
+    startup time if independent cakes were baked concurrently.
+    """
+    graph: BakeryGraph = bakery_graph(bakery)
+    durations: dict[str, list[float]] = {
+        "bake total": [],
+        "critical path": [],
+        "unbake total": [],
+        **{f"bake {name}": [] for name in graph.nodes},
+        **{f"unbake {name}": [] for name in graph.nodes},
+    }
+    for _ in range(runs):
+        started_at: float = perf_counter()
+        await bakery(**(stubs or {})).aopen()
+        durations["bake total"].append(perf_counter() - started_at)
+
+        started_at = perf_counter()
+        await bakery.aclose()
+        durations["unbake total"].append(perf_counter() - started_at)
+
+        weights: dict[str, float] = {}
+        for name, cake in graph.cakes.items():
+            weights[name] = cake.__cake_bake_duration__ or 0.0
+            durations[f"bake {name}"].append(weights[name])
+            durations[f"unbake {name}"].append(cake.__cake_unbake_duration__ or 0.0)
+        durations["critical path"].append(
+            sum(weights[name] for name in graph.critical_path(weights))
+        )
+    return durations
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    """Open and close bakery N times and print duration percentiles."""
+    import bakery as bakery_package  # noqa: PLC0415
+
+    bakery: type[Bakery] = import_bakery(args.bakery)
+    # logging is not benchmarked
+    logger: Any = bakery_package.logger
+    bakery_package.logger = None
+    try:
+        durations: dict[str, list[float]] = asyncio.run(
+            bench_bakery(bakery, args.runs, dict(args.stub))
+        )
+    finally:
+        bakery_package.logger = logger
+
+    width: int = max(map(len, durations))
+    sys.stdout.write(
+        f"{bakery.__qualname__}: {args.runs} runs, ms\n"
+        f"{'':<{width}}" + "".join(f"{f'p{p:g}':>10}" for p in PERCENTILES) + "\n"
+    )
+    for row, values in durations.items():
+        sys.stdout.write(
+            f"{row:<{width}}"
+            + "".join(f"{percentile(values, p) * 1000:>10.3f}" for p in PERCENTILES)
+            + "\n"
+        )
+    return 0
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m bakery",
+        description="Fresh bakery tools.",
+    )
+    commands: Any = parser.add_subparsers(dest="command", required=True)
+
+    graph_parser: argparse.ArgumentParser = commands.add_parser(
+        "graph",
+        help="export bakery dependency graph without opening the bakery",
+    )
+    graph_parser.add_argument("bakery", help="bakery import path, e.g. 'myapp.bakery:AppBakery'")
+    graph_parser.add_argument("--format", choices=list(EXPORTERS), default="dot")
+    graph_parser.set_defaults(command=graph_command)
+
+    snapshot_parser: argparse.ArgumentParser = commands.add_parser(
+        "snapshot",
+        help="save bakery snapshot to load it later without importing recipes",
+    )
+    snapshot_parser.add_argument("bakery", help="bakery import path")
+    snapshot_parser.add_argument("-o", "--output", help="snapshot file (stdout by default)")
+    snapshot_parser.set_defaults(command=snapshot_command)
+
+    check_parser: argparse.ArgumentParser = commands.add_parser(
+        "check",
+        help="validate bakery graph and print predicted startup layers",
+    )
+    check_parser.add_argument("bakery", help="bakery import path")
+    check_parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    check_parser.set_defaults(command=check_command)
+
+    bench_parser: argparse.ArgumentParser = commands.add_parser(
+        "bench",
+        help="open and close bakery N times and print bake/unbake percentiles",
+    )
+    bench_parser.add_argument("bakery", help="bakery import path")
+    bench_parser.add_argument("-n", "--runs", type=int, default=100)
+    bench_parser.add_argument(
+        "--stub",
+        type=parse_stub,
+        action="append",
+        default=[],
+        help="replace cake: NAME=VALUE, VALUE is a JSON literal or an import path",
+    )
+    bench_parser.set_defaults(command=bench_command)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args: argparse.Namespace = make_parser().parse_args(argv)
+    return int(args.command(args))
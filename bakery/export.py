@@ -0,0 +1,190 @@
+"""Bakery graph export.
+
+Draw your bakery: DOT, Mermaid or JSON.
+Nothing is baked while drawing.
+"""
+
+from __future__ import annotations
+
+__all__ = ["bakery_info", "export_dot", "export_json", "export_mermaid"]
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, Iterator
+
+from .bakery import Bakery
+from .graph import BakeryGraph, bakery_graph
+from .stuff import (
+    cake_bake_duration,
+    cake_baking_method,
+    cake_unbake_duration,
+    is_baked,
+    is_cake,
+    recipe_dependencies,
+)
+
+if TYPE_CHECKING:
+    from .stuff import Cakeable
+
+
+def sub_bakery(cake: Cakeable[Any]) -> tuple[type[Bakery], dict[str, Any]] | None:
+    """Get bakery class (and its keyword arguments) the cake is baked from."""
+    recipe: Any = cake
+    while is_cake(recipe) and (recipe is cake or recipe.__cake_anon__):
+        kwargs: dict[str, Any] = recipe.__cake_recipe_kwargs__
+        recipe = recipe.__cake_recipe__
+
+    if isinstance(recipe, type) and issubclass(recipe, Bakery):
+        return recipe, kwargs
+    return None
+
+
+def bakery_info(bakery: type[Bakery]) -> dict[str, Any]:
+    """Bakery graph annotated with baking methods and the last baking timings.
+
+    Sub-bakeries (cakes baked from bakery classes) are described
+    in 'bakeries' with 'bindings': sub-bakery cake => parent cakes it depends on.
+    """
+    graph: BakeryGraph = bakery_graph(bakery)
+    weights: dict[str, float] = {}
+    for name, cake in graph.cakes.items():
+        duration: float | None = cake_bake_duration(cake)
+        if duration is not None:
+            weights[name] = duration
+    critical_path: tuple[str, ...] = graph.critical_path(weights)
+
+    names: dict[int, str] = {id(cake): name for name, cake in graph.cakes.items()}
+    bakeries: dict[str, Any] = {}
+    for name, cake in graph.cakes.items():
+        found: tuple[type[Bakery], dict[str, Any]] | None = sub_bakery(cake)
+        if found is None:
+            continue
+        sub_bakery_cls, kwargs = found
+        bakeries[name] = {
+            **bakery_info(sub_bakery_cls),
+            "bindings": {
+                item_name: list(
+                    {
+                        names[id(dep)]: None
+                        for dep in recipe_dependencies(value)
+                        if id(dep) in names
+                    }
+                )
+                for item_name, value in kwargs.items()
+            },
+        }
+
+    return {
+        "bakery": bakery.__qualname__,
+        "nodes": [
+            {
+                "name": name,
+                "baking_method": cake_baking_method(cake).name,
+                "undefined": name in graph.undefined,
+                "baked": is_baked(cake),
+                "layer": graph.layer(name),
+                "bake_duration": cake_bake_duration(cake),
+                "unbake_duration": cake_unbake_duration(cake),
+                "critical": name in critical_path,
+            }
+            for name, cake in graph.cakes.items()
+        ],
+        "edges": [list(edge) for edge in graph.edges],
+        "critical_path": list(critical_path),
+        "bakeries": bakeries,
+    }
+
+
+def export_json(bakery: type[Bakery]) -> str:
+    return json.dumps(bakery_info(bakery), indent=2)
+
+
+def node_label(node: dict[str, Any]) -> list[str]:
+    label: list[str] = [node["name"], node["baking_method"]]
+    if node["undefined"]:
+        label.append("undefined")
+    for event in ("bake", "unbake"):
+        duration: float | None = node[f"{event}_duration"]
+        if duration is not None:
+            label.append(f"{event}: {duration * 1000:.3f} ms")
+    return label
+
+
+def walk_info(info: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Walk (prefix, sub-bakery name, info) of bakery and all its sub-bakeries."""
+    for name, sub_info in info["bakeries"].items():
+        yield prefix, name, sub_info
+        yield from walk_info(sub_info, f"{prefix}{name}.")
+
+
+def bindings(info: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, str]]:
+    """Edges from sub-bakery cakes to parent cakes."""
+    for parent_prefix, name, sub_info in walk_info(info, prefix):
+        for item_name, deps in sub_info["bindings"].items():
+            for dep in deps:
+                yield f"{parent_prefix}{name}.{item_name}", f"{parent_prefix}{dep}"
+
+
+def export_dot(bakery: type[Bakery]) -> str:
+    info: dict[str, Any] = bakery_info(bakery)
+
+    def dot_nodes(info: dict[str, Any], prefix: str, indent: str) -> Iterator[str]:
+        for node in info["nodes"]:
+            label: str = "\\n".join(node_label(node)).replace('"', '\\"')
+            style: str = ", color=red" if node["critical"] else ""
+            yield f'{indent}"{prefix}{node["name"]}" [label="{label}"{style}];'
+        for dependent, dependency in info["edges"]:
+            yield f'{indent}"{prefix}{dependent}" -> "{prefix}{dependency}";'
+        for name, sub_info in info["bakeries"].items():
+            yield f'{indent}subgraph "cluster_{prefix}{name}" {{'
+            yield f'{indent}    label="{prefix}{name}: {sub_info["bakery"]}";'
+            yield from dot_nodes(sub_info, f"{prefix}{name}.", indent + "    ")
+            yield f"{indent}}}"
+
+    lines: list[str] = [f'digraph "{info["bakery"]}" {{', "    node [shape=box];"]
+    lines.extend(dot_nodes(info, "", "    "))
+    lines.extend(
+        f'    "{dependent}" -> "{dependency}" [style=dashed];'
+        for dependent, dependency in bindings(info)
+    )
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def mermaid_id(name: str) -> str:
+    return re.sub(r"\W", "_", name)
+
+
+def export_mermaid(bakery: type[Bakery]) -> str:
+    info: dict[str, Any] = bakery_info(bakery)
+    critical: list[str] = []
+
+    def mermaid_nodes(info: dict[str, Any], prefix: str, indent: str) -> Iterator[str]:
+        for node in info["nodes"]:
+            node_id: str = mermaid_id(f"{prefix}{node['name']}")
+            label: str = "<br/>".join(node_label(node)).replace('"', "#quot;")
+            if node["critical"]:
+                critical.append(node_id)
+            yield f'{indent}{node_id}["{label}"]'
+        for dependent, dependency in info["edges"]:
+            yield (
+                f"{indent}{mermaid_id(prefix + dependent)} --> {mermaid_id(prefix + dependency)}"
+            )
+        for name, sub_info in info["bakeries"].items():
+            yield (
+                f"{indent}subgraph {mermaid_id(f'cluster_{prefix}{name}')}"
+                f'["{prefix}{name}: {sub_info["bakery"]}"]'
+            )
+            yield from mermaid_nodes(sub_info, f"{prefix}{name}.", indent + "    ")
+            yield f"{indent}end"
+
+    lines: list[str] = ["flowchart TD"]
+    lines.extend(mermaid_nodes(info, "", "    "))
+    lines.extend(
+        f"    {mermaid_id(dependent)} -.-> {mermaid_id(dependency)}"
+        for dependent, dependency in bindings(info)
+    )
+    if critical:
+        lines.append("    classDef critical stroke:#f00,stroke-width:2px")
+        lines.append(f"    class {','.join(critical)} critical")
+    return "\n".join(lines)
@@ -0,0 +1,52 @@
+"""FastAPI and Starlette integration.
+
+Bakeries are opened and closed by the application lifespan.
+Route dependencies are coroutine functions without parameters:
+nothing to introspect, nothing to run in the thread pool,
+just the baked value to return.
+"""
+
+from __future__ import annotations
+
+__all__ = ["bakery_lifespan", "depends", "provider"]
+
+from typing import Any, Callable, Final
+
+# re-exported: FastAPI apps take it from here
+from .lifespan import bakery_lifespan
+from .stuff import is_cake
+
+# cake -> its provider
+PROVIDERS: Final[dict[Any, Callable[[], Any]]] = {}
+
+
+def provider(cake: Any) -> Callable[[], Any]:
+    """Route dependency returning baked value of the cake.
+
+    The same callable is returned for the same cake,
+    so request dependency cache works across routes.
+    """
+    if not is_cake(cake):
+        msg = f"Cake expected, got {cake!r}"
+        raise TypeError(msg)
+    if cake in PROVIDERS:
+        return PROVIDERS[cake]
+
+    baked: Callable[[], Any] = cake.__call__
+
+    async def provide() -> Any:
+        return baked()
+
+    provide.__qualname__ = provide.__name__ = f"provide_{cake.__cake_name__ or 'anon'}"
+    PROVIDERS[cake] = provide
+    return provide
+
+
+def depends(cake: Any, *, use_cache: bool = True) -> Any:
+    """FastAPI Depends of the cake.
+
+    Annotated alias: ControllerDep = Annotated[Controller, depends(MyBakery.controller)].
+    """
+    from fastapi import Depends  # noqa: PLC0415
+
+    return Depends(provider(cake), use_cache=use_cache)
@@ -0,0 +1,223 @@
+"""Bakery dependency graph.
+
+Who depends on whom.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BakeryGraph", "bakery_graph"]
+
+from typing import TYPE_CHECKING, Any, Final, Iterable, Iterator, Mapping
+
+from .stuff import cake_dependencies
+
+if TYPE_CHECKING:
+    from .stuff import Cakeable
+
+
+class BakeryGraph:
+    """Bakery cakes dependency graph.
+
+    Nodes are cake names, edges go from dependent cake to its dependency.
+    Named cakes that do not belong to the bakery are not in the graph.
+    """
+
+    def __init__(self, name: str, cakes: Mapping[str, Cakeable[Any]]) -> None:
+        self.name: Final = name
+        names: dict[int, str] = {}
+        for cake_name, cake in cakes.items():
+            names.setdefault(id(cake), cake_name)
+
+        self.cakes: Final[dict[str, Cakeable[Any]]] = {
+            cake_name: cake for cake_name, cake in cakes.items() if names[id(cake)] == cake_name
+        }
+        self.nodes: Final[tuple[str, ...]] = tuple(self.cakes)
+        self.undefined: Final[tuple[str, ...]] = tuple(
+            cake_name for cake_name, cake in self.cakes.items() if cake.__cake_undefined__
+        )
+
+        self.__dependencies: Final[dict[str, tuple[str, ...]]] = {}
+        self.__dependents: Final[dict[str, list[str]]] = {node: [] for node in self.nodes}
+        for cake_name, cake in self.cakes.items():
+            deps: dict[str, None] = {
+                names[id(dep)]: None for dep in cake_dependencies(cake) if id(dep) in names
+            }
+            self.__dependencies[cake_name] = tuple(deps)
+            for dep in deps:
+                self.__dependents[dep].append(cake_name)
+
+        self.__order: tuple[str, ...] | None = None
+        self.__layers: tuple[tuple[str, ...], ...] | None = None
+
+    def __repr__(self) -> str:
+        return f"BakeryGraph '{self.name}'"
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.cakes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edges(self) -> tuple[tuple[str, str], ...]:
+        """(dependent, dependency) pairs."""
+        return tuple((node, dep) for node, deps in self.__dependencies.items() for dep in deps)
+
+    def dependencies(self, node: str, *, transitive: bool = False) -> tuple[str, ...]:
+        """Cakes the cake depends on."""
+        self.__check_node(node)
+        if not transitive:
+            return self.__dependencies[node]
+        return self.__walk([node], self.__dependencies)
+
+    def dependents(self, node: str, *, transitive: bool = False) -> tuple[str, ...]:
+        """Cakes that depend on the cake."""
+        self.__check_node(node)
+        if not transitive:
+            return tuple(self.__dependents[node])
+        return self.__walk([node], self.__dependents)
+
+    @property
+    def cycle(self) -> tuple[str, ...]:
+        """The first dependency cycle found (the first node is repeated at the end)."""
+        visited: set[str] = set()
+        node: str
+        for node in self.nodes:
+            if node in visited:
+                continue
+            visited.add(node)
+            path: list[str] = [node]
+            on_path: set[str] = {node}
+            # iterative DFS: long dependency chains never hit the recursion limit
+            stack: list[Iterator[str]] = [iter(self.__dependencies[node])]
+            while stack:
+                for dep in stack[-1]:
+                    if dep in on_path:
+                        return (*path[path.index(dep) :], dep)
+                    if dep not in visited:
+                        visited.add(dep)
+                        path.append(dep)
+                        on_path.add(dep)
+                        stack.append(iter(self.__dependencies[dep]))
+                        break
+                else:
+                    stack.pop()
+                    on_path.discard(path.pop())
+        return ()
+
+    def validate(self) -> None:
+        """Raise ValueError if graph has dependency cycle."""
+        cycle: tuple[str, ...] = self.cycle
+        if cycle:
+            msg = f"Bakery '{self.name}' has dependency cycle: {' -> '.join(cycle)}"
+            raise ValueError(msg)
+
+    @property
+    def layers(self) -> tuple[tuple[str, ...], ...]:
+        """Cakes grouped by layers.
+
+        Cakes of the same layer depend on cakes of previous layers only.
+        So they could be baked independently.
+        """
+        if self.__layers is None:
+            self.validate()
+            layer_of: dict[str, int] = {}
+            for node in self.order:
+                layer_of[node] = 1 + max(
+                    (layer_of[dep] for dep in self.__dependencies[node]), default=-1
+                )
+            layers: list[list[str]] = [[] for _ in range(max(layer_of.values(), default=-1) + 1)]
+            for node in self.nodes:
+                layers[layer_of[node]].append(node)
+            self.__layers = tuple(tuple(layer) for layer in layers)
+        return self.__layers
+
+    @property
+    def depth(self) -> int:
+        """The longest dependency chain length (layers count)."""
+        return len(self.layers)
+
+    def layer(self, node: str) -> int:
+        """Layer index of the cake."""
+        self.__check_node(node)
+        return next(index for index, layer in enumerate(self.layers) if node in layer)
+
+    @property
+    def order(self) -> tuple[str, ...]:
+        """Baking order: dependencies first, bakery order otherwise."""
+        if self.__order is None:
+            self.validate()
+            order: dict[str, None] = {}
+            node: str
+            for node in self.nodes:
+                if node in order:
+                    continue
+                # iterative post-order DFS, no cycles here
+                stack: list[tuple[str, Iterator[str]]] = [(node, iter(self.__dependencies[node]))]
+                while stack:
+                    for dep in stack[-1][1]:
+                        if dep not in order:
+                            stack.append((dep, iter(self.__dependencies[dep])))
+                            break
+                    else:
+                        order[stack.pop()[0]] = None
+            self.__order = tuple(order)
+        return self.__order
+
+    def critical_path(self, weights: Mapping[str, float] | None = None) -> tuple[str, ...]:
+        """The heaviest dependency chain (dependencies first).
+
+        Every cake weighs 1 if weights are not set at all
+        and 0 if only its weight is not set.
+        """
+        default_weight: float = 0.0 if weights else 1.0
+        weights = weights or {}
+        total: dict[str, float] = {}
+        heaviest_dep: dict[str, str | None] = {}
+        for node in self.order:
+            dep: str | None = max(self.__dependencies[node], key=total.__getitem__, default=None)
+            heaviest_dep[node] = dep
+            total[node] = weights.get(node, default_weight) + (total[dep] if dep else 0.0)
+
+        path: list[str] = []
+        last: str | None = max(self.nodes, key=total.__getitem__, default=None)
+        while last:
+            path.append(last)
+            last = heaviest_dep[last]
+        return tuple(reversed(path))
+
+    def sorted(self, nodes: Iterable[str]) -> tuple[str, ...]:
+        """Sort nodes in baking order."""
+        to_sort: set[str] = set(nodes)
+        return tuple(node for node in self.order if node in to_sort)
+
+    def __walk(self, nodes: list[str], edges: Mapping[str, Iterable[str]]) -> tuple[str, ...]:
+        found: dict[str, None] = {}
+        while nodes:
+            for next_node in edges[nodes.pop()]:
+                if next_node not in found:
+                    found[next_node] = None
+                    nodes.append(next_node)
+        return tuple(found)
+
+    def __check_node(self, node: str) -> None:
+        if node not in self.cakes:
+            msg = f"{self} has no cake '{node}'"
+            raise KeyError(msg)
+
+
+def bakery_graph(bakery: Any) -> BakeryGraph:
+    """Extract bakery dependency graph.
+
+    The graph is cached by bakery until `reset_bakery_graph` is called.
+    """
+    graph: BakeryGraph | None = getattr(bakery, "__bakery_graph__", None)
+    if graph is None:
+        graph = BakeryGraph(bakery.__qualname__, bakery.__bakery_items__)
+        bakery.__bakery_graph__ = graph
+    return graph
+
+
+def reset_bakery_graph(bakery: Any) -> None:
+    """Drop cached bakery graph: cake recipes were replaced."""
+    bakery.__bakery_graph__ = None
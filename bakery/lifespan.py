@@ -0,0 +1,35 @@
+"""Application lifespan.
+
+Framework agnostic: the lifespan is an async context manager factory
+taking the application, like Starlette, FastAPI and Litestar expect.
+"""
+
+from __future__ import annotations
+
+__all__ = ["bakery_lifespan"]
+
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, Callable
+
+if TYPE_CHECKING:
+    from .bakery import Bakery
+
+
+def bakery_lifespan(
+    *bakeries: type[Bakery] | Bakery,
+) -> Callable[[Any], AsyncContextManager[None]]:
+    """Application lifespan opening bakeries in order and closing them in reverse.
+
+    Pass bakery instance to open it with replaced cakes: MyBakery(settings=...).
+    """
+
+    @asynccontextmanager
+    async def lifespan(_app: Any) -> AsyncIterator[None]:
+        async with AsyncExitStack() as stack:
+            for bakery in bakeries:
+                await stack.enter_async_context(
+                    bakery() if isinstance(bakery, type) else bakery,
+                )
+            yield
+
+    return lifespan
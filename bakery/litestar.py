@@ -0,0 +1,81 @@
+"""Litestar plugin.
+
+Bakeries are opened and closed by the application lifespan.
+Cakes are registered as app dependencies: sync callables without
+parameters, which are never offloaded to the thread pool.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BakeryPlugin", "provide"]
+
+from typing import TYPE_CHECKING, Any, Mapping
+
+from litestar.di import Provide
+from litestar.plugins import InitPluginProtocol
+
+from .lifespan import bakery_lifespan
+from .stuff import is_cake
+
+if TYPE_CHECKING:
+    from litestar.config.app import AppConfig
+
+    from .bakery import Bakery
+
+
+def provide(cake: Any, *, use_cache: bool = False) -> Provide:
+    """Litestar dependency returning baked value of the cake.
+
+    Baked value is returned right away: no thread pool is required.
+    Set 'use_cache' to keep the first value for the application lifetime
+    (rebaked and swapped cakes are not seen then).
+    """
+    if not is_cake(cake):
+        msg = f"Cake expected, got {cake!r}"
+        raise TypeError(msg)
+
+    # bound method: no extra frame per request
+    return Provide(cake.__call__, use_cache=use_cache, sync_to_thread=False)
+
+
+class BakeryPlugin(InitPluginProtocol):
+    """Open bakeries in the app lifespan and provide their cakes.
+
+    All public cakes are registered as app dependencies by their names
+    unless 'dependencies' (name -> cake) are passed.
+    """
+
+    def __init__(
+        self,
+        *bakeries: type[Bakery] | Bakery,
+        dependencies: Mapping[str, Any] | None = None,
+        use_cache: bool = False,
+    ) -> None:
+        self.bakeries: tuple[type[Bakery] | Bakery, ...] = bakeries
+        self.dependencies: dict[str, Any] = (
+            dict(dependencies) if dependencies is not None else self.bakery_cakes()
+        )
+        self.use_cache: bool = use_cache
+
+    def bakery_cakes(self) -> dict[str, Any]:
+        cakes: dict[str, Any] = {}
+        for bakery in self.bakeries:
+            bakery_class: type[Bakery] = bakery if isinstance(bakery, type) else type(bakery)
+            for name, cake in bakery_class.__bakery_items__.items():
+                if name.startswith("_"):
+                    continue
+                if name in cakes and cakes[name] is not cake:
+                    msg = (
+                        f"Cake '{name}' of bakery '{bakery_class.__qualname__}' is already "
+                        "provided by another bakery. Pass dependencies explicitly."
+                    )
+                    raise ValueError(msg)
+                cakes[name] = cake
+        return cakes
+
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        app_config.lifespan.append(bakery_lifespan(*self.bakeries))
+        for name, cake in self.dependencies.items():
+            # explicit app dependencies win
+            app_config.dependencies.setdefault(name, provide(cake, use_cache=self.use_cache))
+        return app_config
@@ -0,0 +1,259 @@
+"""Bakery metrics.
+
+Pull-based registry: counters and histograms are updated on bakery events,
+gauges are read from bakeries on every scrape.
+Text exposition format is the Prometheus one, no client library is required.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BakeryMetrics", "MetricsRegistry"]
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, Iterator, Tuple
+
+from .bakery import BAKERY_LISTENERS, Bakery
+from .stuff import cake_bake_duration, cake_unbake_duration, is_baked
+
+if TYPE_CHECKING:
+    from .stuff import Cakeable
+
+Labels = Tuple[str, ...]
+# sample name suffix, labels (name, value), value
+Sample = Tuple[str, Tuple[Tuple[str, str], ...], float]
+
+DURATION_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metric:
+    """Metric family: name, help, type and label names."""
+
+    type: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Labels = ()) -> None:
+        self.name: Final = name
+        self.documentation: Final = documentation
+        self.labels: Final = labels
+
+    def labeled(self, values: Labels) -> tuple[tuple[str, str], ...]:
+        if len(values) != len(self.labels):
+            msg = f"Metric '{self.name}' expects labels {self.labels}, got {values}"
+            raise ValueError(msg)
+        return tuple(zip(self.labels, values))
+
+    def samples(self) -> Iterator[Sample]:
+        return iter(())
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Labels = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self.values: Final[dict[Labels, float]] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        if amount < 0:
+            msg = f"Counter '{self.name}' cannot be decreased"
+            raise ValueError(msg)
+        self.labeled(labels)
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in self.values.items():
+            yield "", self.labeled(labels), value
+
+
+class Histogram(Metric):
+    """Observed values counted in buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Labels = (),
+        buckets: Iterable[float] = DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets: Final[tuple[float, ...]] = (*sorted(buckets), float("inf"))
+        # labels -> bucket counts (not cumulative), sum
+        self.values: Final[dict[Labels, tuple[list[int], list[float]]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        self.labeled(labels)
+        counts, total = self.values.setdefault(labels, ([0] * len(self.buckets), [0.0]))
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, (counts, total) in self.values.items():
+            labeled: tuple[tuple[str, str], ...] = self.labeled(labels)
+            cumulative: int = 0
+            for bucket, count in zip(self.buckets, counts):
+                cumulative += count
+                yield "_bucket", (*labeled, ("le", format_value(bucket))), cumulative
+            yield "_sum", labeled, total[0]
+            yield "_count", labeled, cumulative
+
+
+class Gauge(Metric):
+    """Value read on every scrape."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Labels,
+        collect: Callable[[], Iterable[tuple[Labels, float]]],
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.collect: Final = collect
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in self.collect():
+            yield "", self.labeled(labels), value
+
+
+class MetricsRegistry:
+    """Metrics registry with text exposition."""
+
+    def __init__(self) -> None:
+        self.metrics: Final[dict[str, Metric]] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            msg = f"Metric '{metric.name}' is already registered"
+            raise ValueError(msg)
+        self.metrics[metric.name] = metric
+        return metric
+
+    def expose(self) -> str:
+        """Text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                formatted: str = ",".join(
+                    f'{name}="{escape_label(label)}"' for name, label in labels
+                )
+                lines.append(
+                    f"{metric.name}{suffix}{{{formatted}}} {format_value(value)}"
+                    if formatted
+                    else f"{metric.name}{suffix} {format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+class BakeryMetrics:
+    """Metrics of the bakeries tracked until 'stop' is called.
+
+    Opens, closes, bake failures and bake/unbake durations per cake
+    are recorded on bakery events. Visitors and baked cakes are read on scrape.
+    """
+
+    def __init__(
+        self,
+        *bakeries: type[Bakery],
+        registry: MetricsRegistry | None = None,
+        buckets: Iterable[float] = DURATION_BUCKETS,
+    ) -> None:
+        self.bakeries: Final[dict[type[Bakery], None]] = dict.fromkeys(bakeries)
+        self.registry: Final[MetricsRegistry] = registry or MetricsRegistry()
+        # bakeries closed after bake failure
+        self.failed: Final[set[type[Bakery]]] = set()
+        self.opens: Final = Counter("bakery_opens_total", "Bakery opens.", ("bakery",))
+        self.closes: Final = Counter("bakery_closes_total", "Bakery closes.", ("bakery",))
+        self.bake_failures: Final = Counter(
+            "bakery_bake_failures_total", "Cake bake failures.", ("bakery", "cake")
+        )
+        self.bake_seconds: Final = Histogram(
+            "bakery_cake_bake_seconds", "Cake bake duration.", ("bakery", "cake"), buckets
+        )
+        self.unbake_seconds: Final = Histogram(
+            "bakery_cake_unbake_seconds", "Cake unbake duration.", ("bakery", "cake"), buckets
+        )
+        for metric in (
+            self.opens,
+            self.closes,
+            self.bake_failures,
+            self.bake_seconds,
+            self.unbake_seconds,
+            Gauge("bakery_visitors", "Bakery visitors.", ("bakery",), self.visitors),
+            Gauge("bakery_baked_cakes", "Cakes currently baked.", ("bakery",), self.baked_cakes),
+        ):
+            self.registry.register(metric)
+        BAKERY_LISTENERS.append(self.on_event)
+
+    def stop(self) -> None:
+        """Stop tracking bakeries."""
+        if self.on_event in BAKERY_LISTENERS:
+            BAKERY_LISTENERS.remove(self.on_event)
+
+    def expose(self) -> str:
+        return self.registry.expose()
+
+    def on_event(self, bakery: type[Bakery], event: str, cake_name: str | None) -> None:
+        if bakery not in self.bakeries:
+            return
+
+        name: str = bakery.__qualname__
+        if event == "opened":
+            self.opens.inc(name)
+            self.observe_durations(self.bake_seconds, bakery, cake_bake_duration)
+        elif event == "closed":
+            self.closes.inc(name)
+            if bakery in self.failed:
+                # not every cake was baked: no fresh unbake durations
+                self.failed.discard(bakery)
+            else:
+                self.observe_durations(self.unbake_seconds, bakery, cake_unbake_duration)
+        elif event == "bake_failed" and cake_name is not None:
+            self.bake_failures.inc(name, cake_name)
+            self.failed.add(bakery)
+
+    def observe_durations(
+        self,
+        histogram: Histogram,
+        bakery: type[Bakery],
+        cake_duration: Callable[[Cakeable[Any]], float | None],
+    ) -> None:
+        for item_name, cake in bakery.__bakery_items__.items():
+            duration: float | None = cake_duration(cake)
+            if duration is not None:
+                histogram.observe(duration, bakery.__qualname__, item_name)
+
+    def visitors(self) -> Iterator[tuple[Labels, float]]:
+        for bakery in self.bakeries:
+            yield (bakery.__qualname__,), bakery.__bakery_visitors__
+
+    def baked_cakes(self) -> Iterator[tuple[Labels, float]]:
+        for bakery in self.bakeries:
+            yield (bakery.__qualname__,), sum(map(is_baked, bakery.__bakery_items__.values()))
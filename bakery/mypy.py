@@ -1,22 +1,90 @@
 """Bakery mypy plugin.
 
 Make cakeable all bakery items.
+Resolve lazy import paths to the real types.
 """
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Final
-
-from mypy.plugin import AttributeContext, Plugin
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from mypy.nodes import (
+    Decorator,
+    FuncBase,
+    Import,
+    ImportBase,
+    MypyFile,
+    StrExpr,
+    SymbolNode,
+    SymbolTableNode,
+    TypeInfo,
+    Var,
+)
+from mypy.plugin import AttributeContext, ClassDefContext, FunctionContext, Plugin
 from mypy.types import CallableType, Instance
 from mypy.types import Type as MypyType
 
+try:
+    from mypy.typeops import type_object_type
+except ImportError:  # mypy < 1.16
+    from mypy.checkmember import type_object_type  # type: ignore[attr-defined,no-redef]
+
 if TYPE_CHECKING:
     from mypy.options import Options
 
 BAKERY_FULLNAME: Final[str] = "bakery.bakery.Bakery"
 CAKEABLE_FULLNAME: Final[str] = "bakery.Cakeable"
+LAZY_FULLNAME: Final[str] = "bakery.cake.lazy"
+LAZY_CALL_RE: Final = re.compile(r"\blazy\(\s*[\"'](?P<path>[\w.:]+)[\"']")
+# mypy.build.PRI_MED
+DEPENDENCY_PRIORITY: Final[int] = 10
+BAKERY_METHODS: Final[frozenset[str]] = frozenset(
+    (
+        "aopen",
+        "aclose",
+        "open",
+        "close",
+        "rebake",
+        "swap",
+        "__aenter__",
+        "__aexit__",
+        "__enter__",
+        "__exit__",
+    )
+)
+
+
+def imports_bakery(imp: ImportBase) -> bool:
+    """`import bakery`, `from bakery import ...` or their submodules."""
+    module_names: list[str] = (
+        [module_name for module_name, _ in imp.ids]
+        if isinstance(imp, Import)
+        else [getattr(imp, "id", "")]
+    )
+    return any(
+        module_name == "bakery" or module_name.startswith("bakery.")
+        for module_name in module_names
+    )
+
+
+def split_path(path: str) -> tuple[str, list[str]]:
+    """Split import path like bakery.stuff.import_string does."""
+    module_name, sep, attrs = path.partition(":")
+    if not sep:
+        module_name, _, attrs = path.rpartition(".")
+    return module_name, attrs.split(".") if attrs else []
+
+
+def lazy_modules(source: str) -> dict[str, int]:
+    """Modules of lazy("package.module:Object") calls with their line numbers."""
+    modules: dict[str, int] = {}
+    for match in LAZY_CALL_RE.finditer(source):
+        module_name, _ = split_path(match.group("path"))
+        if module_name:
+            modules.setdefault(module_name, source.count("\n", 0, match.start()) + 1)
+    return modules
 
 
 def plugin(_: str) -> type[Plugin]:
@@ -29,19 +97,88 @@ class BakeryPlugin(Plugin):
 
     def __init__(self, options: Options) -> None:
         super().__init__(options)
-        if options.config_file is None:
-            return
-        # some manipulations on config_file
-        # some optimizations here
-        self.visible_modules: Final[tuple[str, ...]] = tuple(
-            str(path.with_suffix("")).replace("/", ".") for path in Path().rglob("*.py")
-        )
-
-    def get_class_attribute_hook(self, _fullname: str) -> Callable | None:
+        # class fullname -> whether it is a bakery subclass
+        # filled by the base class hook, classes of cached modules are looked up
+        self.bakery_classes: dict[str, bool] = {}
+
+    def is_bakery(self, class_fullname: str) -> bool:
+        """Whether the class is a bakery subclass (cached by class fullname)."""
+        is_bakery: bool | None = self.bakery_classes.get(class_fullname)
+        if is_bakery is None:
+            symbol: SymbolTableNode | None = self.lookup_fully_qualified(class_fullname)
+            info: SymbolNode | None = symbol.node if symbol is not None else None
+            is_bakery = (
+                isinstance(info, TypeInfo)
+                and info.fullname != BAKERY_FULLNAME
+                and info.has_base(BAKERY_FULLNAME)
+            )
+            self.bakery_classes[class_fullname] = is_bakery
+        return is_bakery
+
+    def get_base_class_hook(self, fullname: str) -> Callable | None:
+        """Collect bakery subclasses."""
+        if fullname == BAKERY_FULLNAME or self.is_bakery(fullname):
+            return self.base_class_hook
+        return None
+
+    def base_class_hook(self, ctx: ClassDefContext) -> None:
+        """Class is a bakery subclass."""
+        self.bakery_classes[ctx.cls.fullname] = True
+
+    def get_additional_deps(self, file: MypyFile) -> list[tuple[int, str, int]]:
+        """Lazily imported modules are still required for type checking."""
+        if not any(map(imports_bakery, file.imports)):
+            return []
+
+        try:
+            source: str = Path(file.path).read_text(encoding="utf-8")
+        except OSError:
+            return []
+        return [
+            (DEPENDENCY_PRIORITY, module_name, line)
+            for module_name, line in lazy_modules(source).items()
+            if module_name != file.fullname
+        ]
+
+    def get_function_hook(self, fullname: str) -> Callable | None:
+        """Get function hook."""
+        if fullname == LAZY_FULLNAME:
+            return self.lazy_hook
+        return None
+
+    def lazy_hook(self, ctx: FunctionContext) -> MypyType:
+        """Lazy import type is the type of imported object."""
+        if not ctx.args or not ctx.args[0] or not isinstance(ctx.args[0][0], StrExpr):
+            return ctx.default_return_type
+
+        path: str = ctx.args[0][0].value
+        module_name, attrs = split_path(path)
+        module: MypyFile | None = ctx.api.modules.get(module_name)  # type: ignore[attr-defined]
+        node: SymbolNode | None = module
+        for attr in attrs:
+            names: Any = getattr(node, "names", None)
+            node = names[attr].node if names is not None and attr in names else None
+
+        found: MypyType | None = None
+        if isinstance(node, TypeInfo):
+            found = type_object_type(node, ctx.api.named_type)  # type: ignore[attr-defined]
+        elif isinstance(node, Decorator):
+            found = node.var.type
+        elif isinstance(node, (FuncBase, Var)):
+            found = node.type
+
+        if found is None:
+            ctx.api.fail(f"Cannot find lazy import '{path}'", ctx.context)
+            return ctx.default_return_type
+        return found
+
+    def get_class_attribute_hook(self, fullname: str) -> Callable | None:
         """Get class attribute hook."""
         # fullname including attribute name
         # e.g. test_app.bakery.MyBakery.some_cake
-        # if _fullname.startswith(self.visible_modules):
+        class_fullname, _, attr = fullname.rpartition(".")
+        if attr in BAKERY_METHODS or not self.is_bakery(class_fullname):
+            return None
         return self.class_attribute_hook
 
     def class_attribute_hook(self, ctx: AttributeContext) -> MypyType:
@@ -49,15 +186,6 @@ class BakeryPlugin(Plugin):
         if not (isinstance(ctx.type, CallableType) and isinstance(ctx.type.ret_type, Instance)):
             return ctx.default_attr_type
 
-        for base in ctx.type.ret_type.type.bases:
-            if base.type.fullname == BAKERY_FULLNAME:
-                break
-        else:
-            return ctx.default_attr_type
-
-        if ctx.context.name in ("aopen", "aclose", "__aenter__", "__aexit__"):  # type: ignore[attr-defined]
-            return ctx.default_attr_type
-
         smth_inst: Instance = ctx.api.named_type(CAKEABLE_FULLNAME).copy_modified(  # type: ignore[attr-defined]
             args=(ctx.default_attr_type,),
         )
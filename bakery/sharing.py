@@ -0,0 +1,339 @@
+"""Shared cakes.
+
+Large read-only cakes (lookup tables, embeddings, tries) baked once per host.
+The first process bakes the cake into shared memory (or memory-mapped file),
+other processes attach to it without copying.
+"""
+
+from __future__ import annotations
+
+__all__ = ["SharedBuffer", "SharedRecipe", "shared"]
+
+import mmap
+import os
+import struct
+import sys
+import time
+from contextlib import suppress
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar, cast, overload
+
+from .baking import BakingMethod, bake_recipe
+from .cake import Cake, fork_safe
+from .stuff import _LOGGER as logger  # noqa: N811
+from .stuff import is_cake
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .stuff import Cakeable
+
+R = TypeVar("R")
+
+# data size + 1 is written after data, so zero means "not ready yet"
+HEADER: Final = struct.Struct("<Q")
+ATTACH_TIMEOUT: Final = 10.0
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """Attach to existing shared memory block, it's not ours to unlink."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+
+    shm: SharedMemory = SharedMemory(name)
+    if os.name == "posix":
+        # resource tracker would unlink the block on our exit otherwise
+        # https://github.com/python/cpython/issues/82300
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def unlink_shared_memory(shm: SharedMemory) -> None:
+    """Remove shared memory block left by somebody else."""
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # unlink unregisters the block, it was unregistered on attach
+        resource_tracker.register(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    # somebody else could remove it already
+    with suppress(FileNotFoundError):
+        shm.unlink()
+
+
+async def sleep(seconds: float) -> None:
+    """Sleep without blocking the event loop (asyncio or trio)."""
+    import asyncio  # noqa: PLC0415
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        import trio  # noqa: PLC0415
+
+        await trio.sleep(seconds)
+    else:
+        await asyncio.sleep(seconds)
+
+
+class SharedBuffer:
+    """Shared memory block (or memory-mapped file) with cake data.
+
+    Async context manager: attach to existing data or bake and share it.
+    The process that shared the data is the owner: it removes the data on exit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        bake: Callable[[], Any],
+        *,
+        path: str | os.PathLike[str] | None = None,
+        dumps: Callable[[Any], Any] | None = None,
+        loads: Callable[[memoryview], Any] | None = None,
+    ) -> None:
+        self.name: Final = name
+        self.path: Final = Path(path) if path is not None else None
+        self.owner_pid: int | None = None
+        self.__bake: Final = bake
+        self.__dumps: Final = dumps
+        self.__loads: Final = loads
+        self.__shm: SharedMemory | None = None
+        self.__mmap: mmap.mmap | None = None
+        self.__view: memoryview | None = None
+
+    def __repr__(self) -> str:
+        return f"SharedBuffer '{self.path or self.name}'"
+
+    @property
+    def is_owner(self) -> bool:
+        return self.owner_pid == os.getpid()
+
+    async def __aenter__(self) -> Any:
+        if not await self.__attach():
+            await self.__share()
+
+        view: memoryview = self.__view  # type: ignore[assignment]
+        return view if self.__loads is None else self.__loads(view)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        in_use: bool = False
+        try:
+            if self.__view is not None:
+                self.__view.release()
+            if self.__shm is not None:
+                self.__shm.close()
+            if self.__mmap is not None:
+                self.__mmap.close()
+        except BufferError:
+            # somebody still holds the data: it is left in place
+            logger.warning(f"{self} is still in use and cannot be closed or removed")
+            in_use = True
+
+        if self.is_owner and not in_use:
+            if self.__shm is not None:
+                self.__shm.unlink()
+            if self.path is not None:
+                self.path.unlink(missing_ok=True)
+            logger.debug(f"{self} is removed")
+
+        self.__view = None
+        self.__shm = None
+        self.__mmap = None
+        self.owner_pid = None
+
+    async def __share(self) -> None:
+        data: memoryview = memoryview(await self.__baked_data()).cast("B")
+        if self.path is not None:
+            self.__share_file(data)
+        else:
+            await self.__share_memory(data)
+
+    async def __baked_data(self) -> Any:
+        data: Any = await self.__bake()
+        return data if self.__dumps is None else self.__dumps(data)
+
+    async def __attach(self) -> bool:
+        if self.path is not None:
+            return self.__attach_file()
+
+        try:
+            shm: SharedMemory = attach_shared_memory(self.name)
+        except FileNotFoundError:
+            return False
+        view: memoryview | None = await self.__wait_ready(shm)
+        if view is None:
+            return False
+        self.__shm = shm
+        self.__view = view
+        logger.debug(f"{self} is attached")
+        return True
+
+    def __attach_file(self) -> bool:
+        path: Path = self.path  # type: ignore[assignment]
+        try:
+            with path.open("rb") as file:
+                # empty file cannot be mapped
+                if os.fstat(file.fileno()).st_size:
+                    self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return False
+        self.__view = memoryview(self.__mmap if self.__mmap is not None else b"")
+        logger.debug(f"{self} is attached")
+        return True
+
+    async def __wait_ready(self, shm: SharedMemory) -> memoryview | None:
+        """Wait for the owner to finish writing the data.
+
+        The block is removed if it is not ready in time (the owner died while writing).
+        """
+        buf: memoryview = shm.buf  # type: ignore[assignment]
+        deadline: float = time.monotonic() + ATTACH_TIMEOUT
+        while True:
+            (size,) = HEADER.unpack_from(buf)
+            if size:
+                return buf[HEADER.size : HEADER.size + size - 1].toreadonly()
+            if time.monotonic() > deadline:
+                shm.close()
+                unlink_shared_memory(shm)
+                logger.warning(f"{self} is not ready in {ATTACH_TIMEOUT} seconds and is removed")
+                return None
+            await sleep(0.001)
+
+    async def __share_memory(self, data: memoryview) -> None:
+        while True:
+            try:
+                shm: SharedMemory = SharedMemory(
+                    self.name, create=True, size=HEADER.size + max(data.nbytes, 1)
+                )
+                break
+            except FileExistsError:
+                # somebody was faster (or left a stale block, it is shared again then)
+                if await self.__attach():
+                    return
+
+        buf: memoryview = shm.buf  # type: ignore[assignment]
+        buf[HEADER.size : HEADER.size + data.nbytes] = data
+        HEADER.pack_into(buf, 0, data.nbytes + 1)
+        self.__shm = shm
+        self.__view = buf[HEADER.size : HEADER.size + data.nbytes].toreadonly()
+        self.owner_pid = os.getpid()
+        logger.debug(f"{self} is shared ({data.nbytes} bytes)")
+
+    def __share_file(self, data: memoryview) -> None:
+        path: Path = self.path  # type: ignore[assignment]
+        tmp_path: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        try:
+            # atomic "create if not exists"
+            os.link(tmp_path, path)
+        except FileExistsError:
+            self.__attach_file()
+            return
+        finally:
+            tmp_path.unlink()
+
+        self.owner_pid = os.getpid()
+        self.__attach_file()
+        logger.debug(f"{self} is shared ({data.nbytes} bytes)")
+
+
+class SharedRecipe:
+    """Recipe of shared cake: bake it with resolved arguments on demand."""
+
+    def __init__(
+        self,
+        name: str,
+        recipe: Any,
+        baking_method: BakingMethod,
+        **options: Any,
+    ) -> None:
+        self.name: Final = name
+        self.recipe: Final = recipe
+        self.baking_method: Final = baking_method
+        self.options: Final = options
+
+    def __repr__(self) -> str:
+        return f"SharedRecipe '{self.name}'"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> SharedBuffer:
+        async def bake() -> Any:
+            return await bake_recipe(
+                self.recipe,
+                recipe_args=args,
+                recipe_kwargs=kwargs,
+                baking_method=self.baking_method,
+                cake_name=self.name,
+            )
+
+        return SharedBuffer(self.name, bake, **self.options)
+
+
+@overload
+def shared(
+    cake: Any,
+    name: str,
+    *,
+    path: str | os.PathLike[str] | None = None,
+    dumps: Callable[[Any], Any] | None = None,
+    loads: None = None,
+) -> memoryview: ...
+
+
+@overload
+def shared(
+    cake: Any,
+    name: str,
+    *,
+    path: str | os.PathLike[str] | None = None,
+    dumps: Callable[[Any], Any] | None = None,
+    loads: Callable[[memoryview], R],
+) -> R: ...
+
+
+def shared(
+    cake: Any,
+    name: str,
+    *,
+    path: str | os.PathLike[str] | None = None,
+    dumps: Callable[[Any], Any] | None = None,
+    loads: Callable[[memoryview], Any] | None = None,
+) -> Any:
+    """Share cake data between processes.
+
+    Cake recipe (function or coroutine function) is called only if nobody
+    has shared the data yet. Its result must support buffer protocol
+    (bytes, array, numpy array) or be converted by 'dumps'.
+    Shared cake is baked to read-only memoryview or to 'loads' result.
+
+    Data is placed in shared memory block 'name' or in memory-mapped file 'path'.
+    """
+    if not is_cake(cake):
+        cake = Cake(cake)
+
+    pastry: Cakeable[Any] = cake
+    if pastry.__cake_baking_method__ not in (
+        BakingMethod.BAKE_FROM_CALL,
+        BakingMethod.BAKE_FROM_CORO_FUNC,
+    ):
+        msg = (
+            f"{pastry}: shared cake recipe must be a function or a coroutine function, "
+            f"not {pastry.__cake_baking_method__.name}"
+        )
+        raise TypeError(msg)
+
+    recipe: SharedRecipe = SharedRecipe(
+        name,
+        pastry.__cake_recipe__,
+        cast(BakingMethod, pastry.__cake_baking_method__),
+        path=path,
+        dumps=dumps,
+        loads=loads,
+    )
+    # the data is read-only, so forked children could use it too
+    return fork_safe(
+        Cake(Cake(recipe, *pastry.__cake_recipe_args__, **pastry.__cake_recipe_kwargs__))
+    )
@@ -0,0 +1,226 @@
+"""Bakery snapshot.
+
+Analyzed bakery structure (cakes, baking methods, recipe import paths, graph)
+saved to a file. Loaded bakery imports recipe modules lazily: only when
+the cake is baked.
+"""
+
+from __future__ import annotations
+
+__all__ = ["bakery_snapshot", "load_snapshot", "restore_bakery", "save_snapshot"]
+
+import json
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from .bakery import Bakery
+from .baking import BakingMethod
+from .cake import Cake, __Cake__, factory, fork_safe, hand_made, lazy
+from .graph import BakeryGraph, bakery_graph
+from .piece_of_cake import PieceAttr, PieceOfCake
+from .stuff import import_string, is_cake, is_piece_of_cake, is_undefined
+
+if TYPE_CHECKING:
+    import os
+
+    from .stuff import Cakeable
+
+SNAPSHOT_FORMAT: Final = 1
+PRIMITIVES: Final = (type(None), bool, int, float, str)
+
+
+def object_path(obj: Any) -> str | None:
+    """Import path of module level object (class, function)."""
+    module: Any = getattr(obj, "__module__", None)
+    qualname: Any = getattr(obj, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str) or "<" in qualname:
+        return None
+
+    path: str = f"{module}:{qualname}"
+    try:
+        found: bool = import_string(path) is obj
+    except (ImportError, AttributeError):
+        return None
+    return path if found else None
+
+
+def is_lazy_import(cake: Cakeable[Any]) -> bool:
+    return (
+        cake.__cake_anon__
+        and cake.__cake_recipe__ is import_string
+        and len(cake.__cake_recipe_args__) == 1
+        and not cake.__cake_recipe_kwargs__
+    )
+
+
+class SnapshotEncoder:
+    def __init__(self, graph: BakeryGraph) -> None:
+        self.names: Final = {id(cake): name for name, cake in graph.cakes.items()}
+
+    def cake(self, cake: Cakeable[Any], name: str = "") -> dict[str, Any]:
+        return {
+            "name": name,
+            "recipe": self.value(cake.__cake_recipe__),
+            "args": [self.value(arg) for arg in cake.__cake_recipe_args__],
+            "kwargs": {key: self.value(arg) for key, arg in cake.__cake_recipe_kwargs__.items()},
+            "baking_method": cake.__cake_baking_method__.name,
+            "fork_safe": cake.__cake_fork_safe__,
+            "factory": cake.__cake_factory__,
+        }
+
+    def value(self, value: Any) -> Any:  # noqa: C901, PLR0911
+        if isinstance(value, PRIMITIVES):
+            return value
+        if is_undefined(value):
+            return {"undefined": True}
+        if is_cake(value):
+            if is_lazy_import(value):
+                return {"import": value.__cake_recipe_args__[0]}
+            if value.__cake_anon__:
+                return {"anon": self.cake(value)}
+            if id(value) in self.names:
+                return {"cake": self.names[id(value)]}
+            msg = f"{value} belongs to another bakery and cannot be snapshotted"
+            raise ValueError(msg)
+        if is_piece_of_cake(value):
+            return {
+                "piece": self.value(value.cake),
+                "marks": [
+                    ["attr" if isinstance(piece, PieceAttr) else "item", self.value(piece.mark)]
+                    for piece in value.pieces
+                ],
+            }
+        if type(value) in (list, tuple):
+            return {type(value).__name__: [self.value(item) for item in value]}
+        if type(value) is dict:
+            return {"dict": [[self.value(key), self.value(item)] for key, item in value.items()]}
+
+        path: str | None = object_path(value)
+        if path is None:
+            msg = f"{value!r} cannot be snapshotted: it's neither a literal nor importable"
+            raise ValueError(msg)
+        return {"import": path}
+
+
+class SnapshotDecoder:
+    def __init__(self) -> None:
+        self.cakes: Final[dict[str, Any]] = {}
+
+    def cake(self, data: dict[str, Any]) -> Any:
+        baking_method: BakingMethod = BakingMethod[data["baking_method"]]
+        recipe_data: Any = data["recipe"]
+        if isinstance(recipe_data, dict) and recipe_data.get("undefined"):
+            cake: Any = __Cake__()
+        else:
+            recipe: Any = self.value(recipe_data)
+            if baking_method is BakingMethod.BAKE_NO_BAKE and is_cake(recipe):
+                # the value is required right now
+                recipe = import_string(recipe_data["import"])
+            cake = Cake(
+                recipe,
+                *(self.value(arg) for arg in data["args"]),
+                **{key: self.value(arg) for key, arg in data["kwargs"].items()},
+            )
+            if baking_method is not BakingMethod.BAKE_AUTO:
+                # don't determine baking method once again
+                cake = hand_made(cake, baking_method)
+
+        if data["fork_safe"]:
+            cake = fork_safe(cake)
+        if data.get("factory"):
+            cake = factory(cake)
+        return cake
+
+    def value(self, data: Any) -> Any:  # noqa: PLR0911
+        if isinstance(data, PRIMITIVES):
+            return data
+
+        kind, value = next(iter(data.items()))
+        if kind == "anon":
+            return self.cake(value)
+        if kind == "cake":
+            return self.cakes[value]
+        if kind == "piece":
+            piece: Any = PieceOfCake(self.value(value))
+            for mark_kind, mark_data in data["marks"]:
+                mark: Any = self.value(mark_data)
+                piece = piece[mark] if mark_kind == "item" else getattr(piece, mark)
+            return piece
+        if kind == "list":
+            return [self.value(item) for item in value]
+        if kind == "tuple":
+            return tuple(self.value(item) for item in value)
+        if kind == "dict":
+            return {self.value(key): self.value(item) for key, item in value}
+        if kind == "import":
+            # lazy import: module is imported when the cake is baked
+            return lazy(value)
+
+        msg = f"Unknown snapshot value: {data}"
+        raise ValueError(msg)
+
+
+def bakery_snapshot(bakery: type[Bakery]) -> dict[str, Any]:
+    """Bakery structure: cakes with their recipes, baking methods and graph.
+
+    Recipes and other objects are saved as import paths.
+    Bakery must be closed.
+    """
+    if bakery.__bakery_visitors__:
+        msg = f"Bakery '{bakery.__qualname__}' is opened. Close it first."
+        raise ValueError(msg)
+
+    graph: BakeryGraph = bakery_graph(bakery)
+    encoder: SnapshotEncoder = SnapshotEncoder(graph)
+    cakes: list[dict[str, Any]] = []
+    for name, cake in bakery.__bakery_items__.items():
+        if name in graph:
+            cakes.append(encoder.cake(cake, name))
+        else:
+            cakes.append({"name": name, "alias": encoder.names[id(cake)]})
+
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "bakery": bakery.__qualname__,
+        "module": bakery.__module__,
+        "fork_aware": bakery.__bakery_fork_aware__,
+        "cakes": cakes,
+        "edges": [list(edge) for edge in graph.edges],
+        "order": list(graph.order),
+    }
+
+
+def restore_bakery(snapshot: dict[str, Any]) -> type[Bakery]:
+    """Create bakery class from its snapshot. Nothing is imported yet."""
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        msg = f"Unsupported bakery snapshot format: {snapshot.get('format')}"
+        raise ValueError(msg)
+
+    decoder: SnapshotDecoder = SnapshotDecoder()
+    for data in snapshot["cakes"]:
+        if "alias" in data:
+            decoder.cakes[data["name"]] = decoder.cakes[data["alias"]]
+        else:
+            decoder.cakes[data["name"]] = decoder.cake(data)
+
+    def exec_body(namespace: dict[str, Any]) -> None:
+        namespace.update(decoder.cakes)
+        namespace["__module__"] = snapshot["module"]
+        namespace["__qualname__"] = snapshot["bakery"]
+
+    bakery: Any = types.new_class(
+        snapshot["bakery"].rpartition(".")[2],
+        (Bakery,),
+        {"fork_aware": snapshot["fork_aware"]},
+        exec_body,
+    )
+    return bakery  # type: ignore[no-any-return]
+
+
+def save_snapshot(bakery: type[Bakery], path: str | os.PathLike[str]) -> None:
+    Path(path).write_text(json.dumps(bakery_snapshot(bakery), indent=2))
+
+
+def load_snapshot(path: str | os.PathLike[str]) -> type[Bakery]:
+    return restore_bakery(json.loads(Path(path).read_text()))
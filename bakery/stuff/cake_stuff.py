@@ -3,11 +3,13 @@ from __future__ import annotations
 __all__ = [
     "anon_cake",
     "assert_baked",
+    "cake_bake_duration",
     "cake_baking_method",
     "cake_name",
     "cake_recipe",
     "cake_recipe_args",
     "cake_recipe_kwargs",
+    "cake_unbake_duration",
     "is_baked",
     "is_cake",
     "is_cake_or_piece",
@@ -72,6 +74,14 @@ def cake_baking_method(cake: Cakeable) -> IntEnum:
     return cake.__cake_baking_method__
 
 
+def cake_bake_duration(cake: Cakeable) -> float | None:
+    return cake.__cake_bake_duration__
+
+
+def cake_unbake_duration(cake: Cakeable) -> float | None:
+    return cake.__cake_unbake_duration__
+
+
 def recipe_format(recipe: Any, method: IntEnum) -> str:
     fmt: str
     if recipe is UNDEFINED:
@@ -7,7 +7,6 @@ __all__ = [
     "_LOGGER",
 ]
 
-from datetime import datetime
 from functools import partial
 from typing import Any, Callable, Final, Protocol
 
@@ -61,6 +60,8 @@ class DefaultLogger:
     @staticmethod
     def _log(level: str, message: str) -> None:
         """Log it."""
+        from datetime import datetime  # noqa: PLC0415
+
         print(  # noqa: T201
             f"{datetime.now().isoformat(sep=' ', timespec='milliseconds')} | {level} | {message}"  # noqa: DTZ005
         )
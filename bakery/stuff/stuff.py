@@ -2,15 +2,20 @@ from __future__ import annotations
 
 __all__ = [
     "BUILTIN_TYPES",
+    "cake_dependencies",
     "flatten",
+    "import_string",
     "is_iterable",
     "is_mapping",
+    "recipe_dependencies",
     "replace_cakes",
 ]
 
 import types
 from copy import copy
+from importlib import import_module
 from typing import (
+    TYPE_CHECKING,
     Any,
     Final,
     Iterable,
@@ -18,10 +23,11 @@ from typing import (
     Mapping,
 )
 
-from typing_extensions import TypeGuard
+from .cake_stuff import is_cake, is_cake_or_piece, is_piece_of_cake
+from .types import Cakeable, CakeRecipe, FictionalPiece
 
-from .cake_stuff import is_cake_or_piece
-from .types import CakeRecipe, FictionalPiece
+if TYPE_CHECKING:
+    from typing_extensions import TypeGuard
 
 
 def is_iterable(
@@ -72,6 +78,64 @@ def flatten(
             yield _item
 
 
+def cake_dependencies(cake: Cakeable[Any]) -> Iterator[Cakeable[Any]]:
+    """Iterate over named cakes the cake depends on.
+
+    Anonymous cakes and pieces of cake are looked through,
+    so only named cakes are yielded (maybe several times).
+    Plain values (no bake) are never walked: they are not baked
+    and could be consumed (iterators) or be endless.
+    """
+    # baking imports stuff
+    from ..baking import BakingMethod  # noqa: PLC0415, TID252
+
+    recipe: Any = cake.__cake_recipe__
+    if cake.__cake_baking_method__ == BakingMethod.BAKE_NO_BAKE and not is_cake_or_piece(recipe):
+        return
+    yield from recipe_dependencies(
+        [recipe, cake.__cake_recipe_args__, cake.__cake_recipe_kwargs__]
+    )
+
+
+def recipe_dependencies(obj: Any) -> Iterator[Cakeable[Any]]:
+    """Iterate over named cakes found in any (nested) object."""
+    for item in flatten([obj]):
+        if is_piece_of_cake(item):
+            yield from _piece_dependencies(item)
+        elif is_cake(item):
+            yield from _named_cakes(item)
+
+
+def _named_cakes(cake: Cakeable[Any]) -> Iterator[Cakeable[Any]]:
+    if cake.__cake_anon__:
+        yield from cake_dependencies(cake)
+    else:
+        yield cake
+
+
+def _piece_dependencies(piece: Any) -> Iterator[Cakeable[Any]]:
+    if is_cake(piece.cake):
+        yield from _named_cakes(piece.cake)
+    for mark in piece.pieces:
+        if is_piece_of_cake(mark.mark):
+            yield from _piece_dependencies(mark.mark)
+
+
+def import_string(path: str) -> Any:
+    """Import object by path: 'package.module:Object' or 'package.module.Object'."""
+    module_name, sep, attrs = path.partition(":")
+    if not sep:
+        module_name, _, attrs = path.rpartition(".")
+    if not module_name or not attrs:
+        msg = f"Cannot import '{path}'. Use 'package.module:Object' format."
+        raise ValueError(msg)
+
+    obj: Any = import_module(module_name)
+    for attr in attrs.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
 def replace_cakes(obj: Any) -> Any:
     """Replace all objects."""
     res: Any
@@ -7,7 +7,6 @@ __all__ = [
     "is_undefined",
 ]
 
-from inspect import Signature
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -20,11 +19,21 @@ from typing import (
 if TYPE_CHECKING:
     import types
     from enum import IntEnum
+    from inspect import Signature
+
+
+class EmptySignature:
+    """Empty signature (inspect is imported on demand)."""
+
+    def __get__(self, _instance: Any, _owner: Any = None) -> Signature:
+        from inspect import Signature  # noqa: PLC0415
+
+        return Signature()
 
 
 class CakeRecipe:
     # for fastapi Depends
-    __signature__ = Signature()
+    __signature__ = EmptySignature()
 
     def __call__(self) -> Any:
         raise NotImplementedError
@@ -32,7 +41,7 @@ class CakeRecipe:
 
 class FictionalPiece:
     # for fastapi Depends
-    __signature__ = Signature()
+    __signature__ = EmptySignature()
 
     def __call__(self) -> Any:
         raise NotImplementedError
@@ -73,6 +82,18 @@ class Cakeable(Protocol[T_co]):
     @property
     def __cake_baking_method__(self) -> IntEnum: ...
 
+    @property
+    def __cake_fork_safe__(self) -> bool: ...
+
+    @property
+    def __cake_factory__(self) -> bool: ...
+
+    @property
+    def __cake_bake_duration__(self) -> float | None: ...
+
+    @property
+    def __cake_unbake_duration__(self) -> float | None: ...
+
     @property
     def __cake_recipe__(self) -> Any: ...
 
@@ -82,6 +103,8 @@ class Cakeable(Protocol[T_co]):
     @property
     def __cake_recipe_kwargs__(self) -> dict: ...
 
+    def __cake_discard__(self) -> None: ...
+
     async def __aenter__(self) -> T_co: ...
 
     async def __aexit__(
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import os
 import warnings
+from contextlib import asynccontextmanager
 from inspect import Parameter, Signature
-from typing import TYPE_CHECKING, Any, AsyncIterator, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Final,
+    Iterator,
+    Mapping,
+    Type,
+    TypeVar,
+)
+from unittest import mock
+from weakref import WeakSet
 
 import pytest
 
 from . import Bakery as _Bakery
 from . import (
+    BakingMethod,
     Cake,
     Cakeable,
     cake_baking_method,
@@ -19,14 +34,48 @@ from . import (
     is_cake,
     unbake,
 )
+from .cake import fresh_pastry, hand_made
+from .graph import reset_bakery_graph
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
+    from .cake import Pastry
+
 Bakery = Type[_Bakery]
+T = TypeVar("T")
+
+# mock cakes marked by 'cached_mock' (the marks do not keep them alive)
+CACHED_MOCKS: Final[WeakSet[Any]] = WeakSet()
+# baked copies of cached mocks: (scope, mock) -> baked pastry
+MOCK_CACHE: Final[dict[tuple[str, Any], Pastry[Any]]] = {}
+
+
+def cached_mock(cake: T) -> T:
+    """Mark mock cake to be baked once per fixture scope.
+
+    Baked value is kept alive across tests of the same scope
+    until 'reset_mock_cache' is awaited.
+    """
+    if not is_cake(cake):
+        msg: str = f"Cake expected, got {cake!r}"
+        raise TypeError(msg)
+
+    CACHED_MOCKS.add(cake)
+    return cake
+
+
+async def reset_mock_cache(scope: str | None = None) -> None:
+    """Unbake cached mocks of the scope (all scopes by default).
+
+    Unbaked mocks are dropped from the cache: it keeps no references to them.
+    """
+    key: tuple[str, Any]
+    for key in [key for key in MOCK_CACHE if scope is None or key[0] == scope]:
+        await unbake(MOCK_CACHE.pop(key))
 
 
-def fixture_factory(mocker_name: str) -> Any:
+def fixture_factory(mocker_name: str, scope: str = "function") -> Any:
     """Create bakery mock fixtures by mocker name."""
 
     async def mocker(**kwargs: Any) -> AsyncIterator[BakeryMock]:
@@ -34,7 +83,7 @@ def fixture_factory(mocker_name: str) -> Any:
             msg: str = "Please, pass mocker fixture."
             raise ValueError(msg)
 
-        mock: BakeryMock = BakeryMock(next(iter(kwargs.values())))
+        mock: BakeryMock = BakeryMock(next(iter(kwargs.values())), scope=scope)
         yield mock
         await mock.stopall()
 
@@ -50,24 +99,77 @@ def fixture_factory(mocker_name: str) -> Any:
 
 
 bakery_mock = pytest.fixture()(fixture_factory("mocker"))
-class_bakery_mock = pytest.fixture(scope="class")(fixture_factory("class_mocker"))
-module_bakery_mock = pytest.fixture(scope="module")(fixture_factory("module_mocker"))
-package_bakery_mock = pytest.fixture(scope="package")(fixture_factory("package_mocker"))
-session_bakery_mock = pytest.fixture(scope="session")(fixture_factory("session_mocker"))
+class_bakery_mock = pytest.fixture(scope="class")(fixture_factory("class_mocker", "class"))
+module_bakery_mock = pytest.fixture(scope="module")(fixture_factory("module_mocker", "module"))
+package_bakery_mock = pytest.fixture(scope="package")(
+    fixture_factory("package_mocker", "package"),
+)
+session_bakery_mock = pytest.fixture(scope="session")(
+    fixture_factory("session_mocker", "session"),
+)
+
+
+def worker_id() -> str:
+    """Current pytest-xdist worker id ('gw0', 'gw1', ...) or 'master' without workers."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def worker_bakery(
+    bakery: Bakery,
+    params: Callable[[str], Mapping[str, Any]] | None = None,
+    *,
+    sync: bool = True,
+) -> Any:
+    """Create session fixture baking the bakery once per pytest-xdist worker.
+
+    Every xdist worker runs its own session, so the bakery is baked once
+    per worker and reused by all its tests. 'params' gets worker id
+    and returns bakery keyword arguments (e.g. a per-worker database name).
+
+    The fixture is sync by default, so that it works with any async plugin
+    (e.g. pytest-trio has no session-scoped fixtures). It opens the bakery
+    without event loop: asynchronous cakes raise TypeError on setup.
+    Pass 'sync=False' to get async fixture for the plugins
+    with session-scoped event loop (e.g. pytest-asyncio).
+    """
+    if not issubclass(bakery, _Bakery):
+        msg: str = f"{bakery} is not a Bakery."
+        raise TypeError(msg)
+
+    def worker_params() -> Mapping[str, Any]:
+        return params(worker_id()) if params is not None else {}
+
+    if sync:
+
+        def baked_bakery() -> Iterator[_Bakery]:
+            with bakery(**worker_params()) as baked:
+                yield baked
+
+        return pytest.fixture(scope="session")(baked_bakery)
+
+    async def async_baked_bakery() -> AsyncIterator[_Bakery]:
+        async with bakery(**worker_params()) as baked:
+            yield baked
+
+    return pytest.fixture(scope="session")(async_baked_bakery)
 
 
 class BakeryMock:
     """Toy bakery."""
 
-    def __init__(self, mocker: MockerFixture) -> None:
+    def __init__(self, mocker: MockerFixture, *, scope: str = "function") -> None:
         self._mocker_: MockerFixture = mocker
+        self._scope_: str = scope
         self._cake_mocks_: dict[str, Cakeable[Any]] = {}
         self._bakery_: Bakery | None = None
         self._children_: list[BakeryMock] = []
+        self._rebake_: bool = False
+        self._patchers_: list[Any] = []
+        self._swapped_: list[tuple[Cakeable[Any], Pastry[Any]]] = []
 
     def __copy__(self) -> BakeryMock:
         """Copy bakery mock."""
-        mock_copy: BakeryMock = BakeryMock(self._mocker_)
+        mock_copy: BakeryMock = BakeryMock(self._mocker_, scope=self._scope_)
         self._children_.append(mock_copy)
         return mock_copy
 
@@ -77,53 +179,106 @@ class BakeryMock:
         bakery: Bakery,
         cake: Cakeable[Any],
         new_recipe: Cakeable[Any],
-    ) -> None:
-        """Patch cake recipe."""
+    ) -> Any:
+        """Create cake recipe patcher (not started)."""
         if not all((is_cake(cake), is_cake(new_recipe), issubclass(bakery, _Bakery))):
             raise ValueError
 
         new_cake: Cakeable[Any] = new_recipe
-        self._mocker_.patch.multiple(
+        if new_cake in CACHED_MOCKS:
+            # already baked: nothing to bake on open
+            value: Any = await self._cached_value(new_cake)
+            return mock.patch.multiple(
+                cake,
+                _Pastry__cake_recipe=value,
+                _Pastry__cake_recipe_args=(),
+                _Pastry__cake_recipe_kwargs={},
+                _Pastry__cake_baking_method=BakingMethod.BAKE_NO_BAKE,
+                _Pastry__cake_result=value,
+                # factory value is a constructor
+                _Pastry__cake_factory=new_cake.__cake_factory__,
+            )
+
+        return mock.patch.multiple(
             cake,
             _Pastry__cake_recipe=cake_recipe(new_cake),
             _Pastry__cake_recipe_args=cake_recipe_args(new_cake),
             _Pastry__cake_recipe_kwargs=cake_recipe_kwargs(new_cake),
             _Pastry__cake_baking_method=cake_baking_method(new_cake),
             _Pastry__cake_result=await new_cake.__aenter__(),
+            _Pastry__cake_factory=new_cake.__cake_factory__,
         )
 
+    async def _cached_value(self, new_cake: Cakeable[Any]) -> Any:
+        """Baked value of the cached mock in the mock scope."""
+        key: tuple[str, Any] = (self._scope_, new_cake)
+        if key not in MOCK_CACHE:
+            pastry: Pastry[Any] = fresh_pastry(new_cake)
+            await pastry.__aenter__()
+            MOCK_CACHE[key] = pastry
+        # baked value as is: factory cake value is a constructor
+        return await MOCK_CACHE[key].__aenter__()
+
+    async def _cake_swaps(self, bakery: Bakery) -> list[tuple[Cakeable[Any], Cakeable[Any]]]:
+        """Bakery cakes with their mocks."""
+        swaps: list[tuple[Cakeable[Any], Cakeable[Any]]] = []
+        for name, new_cake in self._cake_mocks_.items():
+            if new_cake in CACHED_MOCKS:
+                value: Any = await self._cached_value(new_cake)
+                value_cake: Cakeable[Any] = hand_made(value, BakingMethod.BAKE_NO_BAKE)
+                value_cake._Pastry__cake_factory = new_cake.__cake_factory__  # type: ignore[attr-defined]
+                swaps.append((getattr(bakery, name), value_cake))
+            else:
+                swaps.append((getattr(bakery, name), new_cake))
+        return swaps
+
     async def _patch(self, bakery: Bakery) -> None:
-        """Start bakery `bakery` patching."""
+        """Start bakery `bakery` patching.
+
+        All replacements are applied in one pass. If bakery is already opened
+        and 'rebake' is set, only mocked cakes and their dependents are baked
+        (see `isolated`), otherwise mocked cakes alone are patched.
+        """
         if not issubclass(bakery, _Bakery):
             msg: str = f"{bakery} is not a Bakery."
             raise TypeError(msg)
 
-        cake_name: str
-        new_recipe: Any
-
-        for cake_name, new_recipe in self._cake_mocks_.items():
-            # patch bakery itself
-            await self._patch_cake(
-                bakery=bakery,
-                cake=getattr(bakery, cake_name),
-                new_recipe=new_recipe,
+        if self._rebake_ and bakery.__bakery_visitors__:
+            self._swapped_ = await bakery.__bakery_swap_in__(
+                *await self._cake_swaps(bakery),
             )
+        else:
+            patchers: list[Any] = [
+                await self._patch_cake(
+                    bakery=bakery,
+                    cake=getattr(bakery, cake_name),
+                    new_recipe=new_recipe,
+                )
+                for cake_name, new_recipe in self._cake_mocks_.items()
+            ]
+            for patcher in patchers:
+                patcher.start()
+                self._patchers_.append(patcher)
+            # opened bakery graph is stale otherwise
+            reset_bakery_graph(bakery)
 
         await bakery.aopen()
         self._bakery_ = bakery
 
-    async def patch(self, bakery: Bakery) -> None:
+    async def patch(self, bakery: Bakery, *, rebake: bool = False) -> None:
         """Check if bakery set and start patching."""
         if self._bakery_ is not None:
             msg: str = f"Old bakery {self._bakery_} is still set. Close it first."
             raise ValueError(msg)
+        self._rebake_ = rebake
         return await self._patch(bakery)
 
-    def __call__(self, bakery: Bakery) -> BakeryMock:
+    def __call__(self, bakery: Bakery, *, rebake: bool = False) -> BakeryMock:
         if self._bakery_ is not None:
             msg: str = f"Old bakery {self._bakery_} is still set. Close it first."
             raise ValueError(msg)
         self._bakery_ = bakery
+        self._rebake_ = rebake
         return self
 
     async def __aenter__(self) -> None:
@@ -135,20 +290,57 @@ class BakeryMock:
     async def __aexit__(self, *_args: object) -> None:
         return await self.reset()
 
+    @asynccontextmanager
+    async def isolated(self, bakery: Bakery) -> AsyncIterator[None]:
+        """Isolated view of the bakery baked once (e.g. per session).
+
+        Mocked cakes and fresh copies of their dependents are baked
+        and put in place of the baked ones. Other cakes are reused as is.
+        Baked cakes are back in place on exit, nothing is rebaked.
+        """
+        if not issubclass(bakery, _Bakery):
+            msg: str = f"{bakery} is not a Bakery."
+            raise TypeError(msg)
+        if not bakery.__bakery_visitors__:
+            msg = f"Bakery '{bakery.__qualname__}' is not opened. Open it once first."
+            raise ValueError(msg)
+
+        swapped: list[tuple[Cakeable[Any], Any]] = await bakery.__bakery_swap_in__(
+            *await self._cake_swaps(bakery),
+        )
+        try:
+            yield
+        finally:
+            await bakery.__bakery_swap_back__(swapped)
+
     async def reset(self) -> None:
         """Stop patching."""
-        if self._bakery_:
-            await self._bakery_.aclose()
+        bakery: Bakery | None = self._bakery_
+        if bakery:
+            if self._swapped_:
+                await bakery.__bakery_swap_back__(self._swapped_)
+                self._swapped_ = []
+            await bakery.aclose()
             self._bakery_ = None
+        self._rebake_ = False
 
-        self._mocker_.stopall()
+        # only own patches: other mocker patches are left alone
+        while self._patchers_:
+            self._patchers_.pop().stop()
+            if bakery is not None:
+                # still opened bakery graph is stale otherwise
+                reset_bakery_graph(bakery)
 
     def __setattr__(self, attr: str, value: Any) -> None:
         if attr in (
             "_mocker_",
+            "_scope_",
             "_cake_mocks_",
             "_bakery_",
             "_children_",
+            "_rebake_",
+            "_patchers_",
+            "_swapped_",
         ):
             return super().__setattr__(attr, value)
 
@@ -162,11 +354,16 @@ class BakeryMock:
         self._cake_mocks_[attr] = value
         return None
 
+    async def reset_cache(self) -> None:
+        """Unbake cached mocks of the mock scope."""
+        await reset_mock_cache(self._scope_)
+
     async def stopall(self) -> None:
         """Reset mocker and clear piece mocks."""
         await self.reset()
         for cake in self._cake_mocks_.values():
-            await unbake(cake)
+            if cake not in CACHED_MOCKS:
+                await unbake(cake)
 
         for child in self._children_:
             await child.stopall()
@@ -0,0 +1,85 @@
+"""Route dependency overhead benchmark.
+
+Usage: python -m benchmarks.dependency_overhead [--calls 100000] [--max-ratio 3]
+
+Compares the cost of resolving a dependency the way the framework does it
+(calling an async dependency and awaiting the result) for:
+plain global, bakery provider (bakery.fastapi.provider) and raw cake.
+Exit code is 1 if the provider is more than --max-ratio times slower than the global.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from time import perf_counter_ns
+from typing import Any, Callable
+
+import bakery
+from bakery import Bakery, Cake
+from bakery.fastapi import provider
+
+
+class Controller:
+    pass
+
+
+CONTROLLER: Controller = Controller()
+
+
+async def global_dependency() -> Controller:
+    return CONTROLLER
+
+
+class BenchBakery(Bakery):
+    controller: Controller = Cake(Controller)
+
+
+def resolve_ns(dependency: Callable[[], Any], calls: int) -> float:
+    """Mean time of awaiting the dependency (nanoseconds). No event loop is involved."""
+    started_at: int = perf_counter_ns()
+    for _ in range(calls):
+        try:  # noqa: SIM105
+            dependency().send(None)
+        except StopIteration:  # noqa: PERF203
+            pass
+    return (perf_counter_ns() - started_at) / calls
+
+
+def raw_cake_ns(calls: int) -> float:
+    """Cake called directly (sync dependency)."""
+    cake: Any = BenchBakery.controller
+    started_at: int = perf_counter_ns()
+    for _ in range(calls):
+        cake()
+    return (perf_counter_ns() - started_at) / calls
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--max-ratio", type=float, default=None)
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    bakery.logger = None
+    BenchBakery.open()
+    try:
+        global_ns: float = resolve_ns(global_dependency, args.calls)
+        provider_ns: float = resolve_ns(provider(BenchBakery.controller), args.calls)
+        cake_ns: float = raw_cake_ns(args.calls)
+    finally:
+        BenchBakery.close()
+
+    sys.stdout.write(
+        f"plain global: {global_ns:.0f} ns\n"
+        f"bakery provider: {provider_ns:.0f} ns ({provider_ns / global_ns:.2f}x)\n"
+        f"raw cake call (sync, runs in thread pool under FastAPI): {cake_ns:.0f} ns\n"
+    )
+    if args.max_ratio is not None and provider_ns > global_ns * args.max_ratio:
+        sys.stdout.write(f"provider overhead regression: > {args.max_ratio}x\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
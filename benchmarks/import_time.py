@@ -0,0 +1,90 @@
+"""Import time benchmark.
+
+Usage: python -m benchmarks.import_time [--runs 20] [--max-ms 50]
+
+Every run imports bakery in a fresh interpreter with `-X importtime`.
+Exit code is 1 if median import time exceeds --max-ms.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# modules that `import bakery` must not import
+HEAVY_MODULES = (
+    "datetime",
+    "hashlib",
+    "inspect",
+    "json",
+    "mmap",
+    "multiprocessing",
+    "pickle",
+    "typing_extensions",
+)
+
+
+def import_time_us(module: str = "bakery") -> int:
+    """Cumulative import time of the module in a fresh interpreter (microseconds)."""
+    stderr: str = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    msg = f"'{module}' is not found in importtime output"
+    raise RuntimeError(msg)
+
+
+def imported_modules(module: str = "bakery") -> set[str]:
+    """Modules imported by the module in a fresh interpreter."""
+    stdout: str = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            (
+                f"import sys; before = set(sys.modules); import {module}; "
+                "print('\\n'.join(set(sys.modules) - before))"
+            ),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(stdout.split())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    timings: list[int] = [import_time_us() for _ in range(args.runs)]
+    median_ms: float = statistics.median(timings) / 1000
+    sys.stdout.write(
+        f"import bakery: median {median_ms:.1f} ms, "
+        f"min {min(timings) / 1000:.1f} ms, max {max(timings) / 1000:.1f} ms "
+        f"({args.runs} runs)\n"
+    )
+
+    heavy: list[str] = sorted(
+        name for name in imported_modules() if name.partition(".")[0] in HEAVY_MODULES
+    )
+    if heavy:
+        sys.stdout.write(f"heavy modules imported: {', '.join(heavy)}\n")
+        return 1
+    if args.max_ms is not None and median_ms > args.max_ms:
+        sys.stdout.write(f"import time regression: {median_ms:.1f} ms > {args.max_ms} ms\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Mypy plugin benchmark.
+
+Usage: python -m benchmarks.mypy_plugin [--modules 200] [--vendored 2000] [--max-ratio 1.5]
+
+Generates a project with bakeries and plain classes (plus vendored files
+mypy never checks) and type checks it from scratch with and without
+the bakery plugin. Exit code is 1 if the plugin makes the run
+more than --max-ratio times slower.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+CAKES_PER_BAKERY: int = 10
+
+BAKERY_MODULE: str = """\
+from bakery import Bakery, Cake
+
+
+class Bakery{index}(Bakery):
+{cakes}
+
+
+class Plain{index}:
+{attributes}
+
+
+def use_{index}() -> None:
+{uses}
+"""
+
+
+def generate_project(root: Path, modules: int, vendored: int) -> list[str]:
+    """Write generated project. Return paths of the modules to check."""
+    package: Path = root / "app"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    paths: list[str] = []
+    for index in range(modules):
+        source: str = BAKERY_MODULE.format(
+            index=index,
+            cakes="\n".join(f"    cake_{n}: int = Cake({n})" for n in range(CAKES_PER_BAKERY)),
+            attributes="\n".join(f"    attr_{n}: int = {n}" for n in range(CAKES_PER_BAKERY)),
+            uses="\n".join(
+                f"    Bakery{index}.cake_{n}()\n    Plain{index}.attr_{n} + 1"
+                for n in range(CAKES_PER_BAKERY)
+            ),
+        )
+        path: Path = package / f"module_{index}.py"
+        path.write_text(source)
+        paths.append(str(path))
+
+    # e.g. virtualenv or vendored code in the working directory
+    vendor: Path = root / "vendor"
+    vendor.mkdir()
+    for index in range(vendored):
+        (vendor / f"vendored_{index}.py").write_text("VALUE = 1\n")
+    return paths
+
+
+def mypy_run_s(root: Path, paths: list[str], *, plugin: bool) -> float:
+    """Time of type checking from scratch (seconds)."""
+    from mypy import api  # noqa: PLC0415
+
+    config: Path = root / ("plugin.ini" if plugin else "plain.ini")
+    config.write_text("[mypy]\nplugins = bakery.mypy\n" if plugin else "[mypy]\n")
+    started_at: float = perf_counter()
+    stdout, stderr, status = api.run(
+        [*paths, "--config-file", str(config), "--no-incremental", "--cache-dir", os.devnull]
+    )
+    elapsed: float = perf_counter() - started_at
+    if status == 2:  # noqa: PLR2004
+        raise RuntimeError(stderr or stdout)
+    return elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=200)
+    parser.add_argument("--vendored", type=int, default=2000)
+    parser.add_argument("--max-ratio", type=float, default=None)
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    cwd: Path = Path.cwd()
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root: Path = Path(tmp)
+        paths: list[str] = generate_project(root, args.modules, args.vendored)
+        os.chdir(root)
+        try:
+            results["plain"] = mypy_run_s(root, paths, plugin=False)
+            results["plugin"] = mypy_run_s(root, paths, plugin=True)
+        finally:
+            os.chdir(cwd)
+
+    ratio: float = results["plugin"] / results["plain"]
+    sys.stdout.write(
+        f"{args.modules} modules, {args.vendored} vendored files\n"
+        f"mypy: {results['plain']:.2f} s\n"
+        f"mypy with bakery plugin: {results['plugin']:.2f} s ({ratio:.2f}x)\n"
+    )
+    if args.max_ratio is not None and ratio > args.max_ratio:
+        sys.stdout.write(f"mypy plugin overhead regression: > {args.max_ratio}x\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
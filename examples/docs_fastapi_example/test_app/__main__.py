@@ -5,7 +5,7 @@ import random
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Final, Literal, Mapping
 
-from fastapi import Depends, FastAPI
+from fastapi import FastAPI
 from loguru import logger
 from pydantic import BaseModel, Field, PostgresDsn
 from pydantic_settings import BaseSettings
@@ -13,6 +13,7 @@ from typing_extensions import Annotated, Self
 
 import bakery
 from bakery import Bakery, Cake
+from bakery.fastapi import depends
 
 # ruff: noqa: S311
 
@@ -144,7 +145,7 @@ MY_APP: Final = FastAPI(lifespan=lifespan)
 # Finally, an example of how you can use your dependencies
 @MY_APP.get("/person/random/")
 async def create_person(
-    inversed_controller: Annotated[ServiceController, Depends(MainBakeryIOC.controller)],
+    inversed_controller: Annotated[ServiceController, depends(MainBakeryIOC.controller)],
 ) -> PersonOut | None:
     """Fetch random person from the «database»."""
     person_id: int = random.randint(10**1, 10**6)
@@ -5,9 +5,9 @@ https://docs.litestar.dev/latest/usage/dependency-injection.html
 from typing import Any, List, Protocol, runtime_checkable
 
 from litestar import Controller, Litestar, Router, get
-from litestar.di import Provide
 
 from bakery import Bakery, Cake
+from bakery.litestar import BakeryPlugin, provide
 
 
 class Database:
@@ -48,14 +48,14 @@ class DatabaseProto(Protocol):
 class MyController(Controller):
     path = "/controller"
     # on the controller
-    dependencies = {"controller_dependency": Provide(MyBakery.list_fn)}
+    dependencies = {"controller_dependency": provide(MyBakery.list_fn)}
 
     # on the route handler
     @get(
         path="/handler",
         dependencies={
-            "local_dependency": Provide(MyBakery.int_fn),
-            "x2_multiplier": Provide(MyBakery.x2_multiplier),
+            "local_dependency": provide(MyBakery.int_fn),
+            "x2_multiplier": provide(MyBakery.x2_multiplier),
         },
     )
     async def my_route_handler(
@@ -77,23 +77,13 @@ class MyController(Controller):
 
 my_router = Router(
     path="/router",
-    dependencies={"router_dependency": Provide(MyBakery.dict_fn)},
+    dependencies={"router_dependency": provide(MyBakery.dict_fn)},
     route_handlers=[MyController],
 )
 
 
-async def on_startup() -> None:
-    await MyBakery.aopen()
-
-
-async def on_shutdown() -> None:
-    await MyBakery.aclose()
-
-
-# on the app
+# on the app: bakery is opened and closed by the app lifespan
 app = Litestar(
     route_handlers=[my_router],
-    dependencies={"database": Provide(MyBakery.database)},
-    on_startup=[on_startup],
-    on_shutdown=[on_shutdown],
+    plugins=[BakeryPlugin(MyBakery, dependencies={"database": MyBakery.database})],
 )
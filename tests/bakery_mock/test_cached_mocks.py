@@ -0,0 +1,131 @@
+"""Test cached mocks baked once per fixture scope."""
+
+from __future__ import annotations
+
+import gc
+from typing import Any, AsyncIterator, Iterator
+from weakref import ReferenceType, ref
+
+import pytest
+
+from bakery import Bakery, Cake, factory
+from bakery.testbakery import (
+    CACHED_MOCKS,
+    MOCK_CACHE,
+    BakeryMock,
+    cached_mock,
+    reset_mock_cache,
+)
+
+EVENTS: list[str] = []
+
+
+def fake_database() -> Iterator[dict[str, int]]:
+    EVENTS.append("open")
+    yield {}
+    EVENTS.append("close")
+
+
+class Repository:
+    def __init__(self, database: dict[str, int]) -> None:
+        self.database: dict[str, int] = database
+
+
+class MyBakery(Bakery):
+    database: dict[str, int] = Cake(dict)
+    repository: Repository = Cake(Repository, database)
+
+
+FAKE_DATABASE: dict[str, int] = cached_mock(Cake(fake_database))
+
+
+@pytest.fixture
+async def cached_bakery_mock(bakery_mock: BakeryMock) -> AsyncIterator[BakeryMock]:
+    """Bakery mock with cached mocks of the test only."""
+    yield bakery_mock
+    await reset_mock_cache()
+    EVENTS.clear()
+
+
+async def test_cached_mock(cached_bakery_mock: BakeryMock) -> None:
+    cached_bakery_mock.database = cached_mock(Cake(fake_database))
+    async with cached_bakery_mock(MyBakery):
+        MyBakery().database["visits"] = 1
+        assert MyBakery().repository.database is MyBakery().database
+
+    assert EVENTS == ["open"]
+
+
+async def test_cached_mock_reused(cached_bakery_mock: BakeryMock) -> None:
+    cached_bakery_mock.database = cached_mock(Cake(fake_database))
+    async with cached_bakery_mock(MyBakery):
+        MyBakery().database["visits"] = 1
+
+    async with cached_bakery_mock(MyBakery):
+        assert MyBakery().database == {"visits": 1}
+
+    async with MyBakery(), cached_bakery_mock(MyBakery, rebake=True):
+        assert MyBakery().repository.database == {"visits": 1}
+
+    assert EVENTS == ["open"]  # baked once
+
+
+async def test_reset_cache(cached_bakery_mock: BakeryMock) -> None:
+    cached_bakery_mock.database = cached_mock(Cake(fake_database))
+    async with cached_bakery_mock(MyBakery):
+        pass
+
+    await cached_bakery_mock.reset_cache()
+    assert EVENTS == ["open", "close"]
+    assert not MOCK_CACHE
+
+    async with cached_bakery_mock(MyBakery):
+        assert not MyBakery().database  # baked again
+
+    await reset_mock_cache()
+    assert EVENTS == ["open", "close", "open", "close"]
+
+
+async def test_cached_factory_mock(cached_bakery_mock: BakeryMock) -> None:
+    cached_bakery_mock.database = cached_mock(factory(Cake(dict)))
+    async with cached_bakery_mock(MyBakery):
+        assert MyBakery().database is not MyBakery().database
+
+    async with MyBakery(), cached_bakery_mock(MyBakery, rebake=True):
+        assert MyBakery().database is not MyBakery().database
+
+
+def test_cached_mock_of_not_cake() -> None:
+    with pytest.raises(TypeError, match="Cake expected"):
+        cached_mock(42)  # type: ignore[arg-type]
+
+
+def test_cached_mock_not_kept_alive() -> None:
+    cake: dict[str, int] = cached_mock(Cake(dict))
+    assert cake in CACHED_MOCKS
+    cake_ref: ReferenceType[Any] = ref(cake)
+    del cake
+    gc.collect()
+    assert cake_ref() is None
+
+
+async def test_module_cached_mock(bakery_mock: BakeryMock) -> None:
+    bakery_mock.database = FAKE_DATABASE
+    async with bakery_mock(MyBakery):
+        MyBakery().database["visits"] = 1
+
+    assert EVENTS == ["open"]
+
+
+async def test_module_cached_mock_reused(bakery_mock: BakeryMock) -> None:
+    """Runs after 'test_module_cached_mock': the mock is baked by it."""
+    bakery_mock.database = FAKE_DATABASE
+    async with bakery_mock(MyBakery):
+        assert MyBakery().database == {"visits": 1}
+
+    assert EVENTS == ["open"]
+    await reset_mock_cache()
+    assert EVENTS == ["open", "close"]
+    assert not MOCK_CACHE
+    assert FAKE_DATABASE in CACHED_MOCKS  # still marked
+    EVENTS.clear()
@@ -0,0 +1,90 @@
+"""Test isolated view of the bakery baked once."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from bakery import Bakery, Cake
+
+if TYPE_CHECKING:
+    from bakery.testbakery import BakeryMock
+
+BAKED: list[str] = []
+
+
+@dataclass
+class Schema:
+    name: str
+
+    def __post_init__(self) -> None:
+        BAKED.append(f"schema {self.name}")
+
+
+@dataclass
+class Repository:
+    dsn: str
+    schema: Schema
+
+    def __post_init__(self) -> None:
+        BAKED.append(f"repository {self.dsn}")
+
+
+class MyBakery(Bakery):
+    dsn: str = Cake("real://")
+    schema: Schema = Cake(Schema, "expensive")
+    repository: Repository = Cake(Repository, dsn, schema)
+
+
+@pytest.fixture(scope="module")
+def baked_bakery() -> Iterator[None]:
+    # baked once per module (per session in real life)
+    with MyBakery():
+        yield
+
+
+@pytest.mark.usefixtures("baked_bakery")
+@pytest.mark.parametrize("dsn", ["first://", "second://"])
+async def test_isolated(bakery_mock: BakeryMock, dsn: str) -> None:
+    schema: Schema = MyBakery().schema
+    repository: Repository = MyBakery().repository
+    BAKED.clear()
+
+    bakery_mock.dsn = Cake(dsn)
+    async with bakery_mock.isolated(MyBakery):
+        assert MyBakery().dsn == dsn
+        assert MyBakery().repository.dsn == dsn
+        # reused
+        assert MyBakery().schema is schema
+        assert MyBakery().repository.schema is schema
+
+    assert [f"repository {dsn}"] == BAKED
+    assert MyBakery().dsn == "real://"
+    assert MyBakery().repository is repository
+
+
+@pytest.mark.usefixtures("baked_bakery")
+async def test_isolated_bake_error(bakery_mock: BakeryMock) -> None:
+    def broken() -> Schema:
+        raise RuntimeError
+
+    repository: Repository = MyBakery().repository
+    bakery_mock.dsn = Cake("mocked://")
+    bakery_mock.schema = Cake(broken)
+    with pytest.raises(RuntimeError):
+        async with bakery_mock.isolated(MyBakery):
+            pass
+
+    assert MyBakery().dsn == "real://"
+    assert MyBakery().repository is repository
+
+
+async def test_isolated_not_opened(bakery_mock: BakeryMock) -> None:
+    class ClosedBakery(Bakery):
+        dsn: str = Cake("real://")
+
+    with pytest.raises(ValueError, match="is not opened"):
+        async with bakery_mock.isolated(ClosedBakery):
+            pass
@@ -1,7 +1,15 @@
 """Test mock after open."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from bakery import Bakery, Cake
-from bakery.testbakery import BakeryMock
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from bakery.testbakery import BakeryMock
 
 
 async def test_mock_after_open(bakery_mock: BakeryMock) -> None:
@@ -33,3 +41,40 @@ async def test_mock_after_open(bakery_mock: BakeryMock) -> None:
         assert my_pc.manufacturer == "Intel"
         assert MyPC.manufacturer() == "Intel"
         assert MyPC().manufacturer == "Intel"
+
+
+async def test_mock_after_open_rebake(bakery_mock: BakeryMock) -> None:
+    class MyPC(Bakery):
+        core_num: int = Cake(4)
+        manufacturer: str = Cake("Intel")
+        cores: list[int] = Cake(list, Cake(range, core_num))
+        label: str = Cake(str, manufacturer)
+
+    bakery_mock.core_num = Cake(2)
+
+    async with MyPC() as my_pc:
+        label: str = my_pc.label
+        async with bakery_mock(MyPC, rebake=True):
+            assert MyPC().core_num == 2
+            assert MyPC().cores == [0, 1]  # dependent is rebaked
+            assert MyPC().label is label  # not affected
+
+        assert MyPC().core_num == 4
+        assert MyPC().cores == [0, 1, 2, 3]
+        assert MyPC.__bakery_visitors__ == 1
+
+
+async def test_reset_keeps_other_patches(bakery_mock: BakeryMock, mocker: MockerFixture) -> None:
+    class MyPC(Bakery):
+        core_num: int = Cake(4)
+
+    class Disk:
+        size: int = 1
+
+    mocker.patch.object(Disk, "size", 2)
+    bakery_mock.core_num = Cake(5)
+    async with bakery_mock(MyPC):
+        assert MyPC().core_num == 5
+
+    assert MyPC.core_num.__cake_recipe__ == 4
+    assert Disk.size == 2
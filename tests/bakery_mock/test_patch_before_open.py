@@ -1,6 +1,6 @@
 """Test patch before open."""
 
-from bakery import Bakery, Cake
+from bakery import Bakery, Cake, factory
 from bakery.testbakery import BakeryMock
 
 
@@ -53,3 +53,35 @@ async def test_bakery_patch_before_open_no_mock() -> None:
         assert my_pc.manufacturer == "Intel"
         assert MyPC.manufacturer() == "Intel"
         assert MyPC().manufacturer == "Intel"
+
+
+class Visits:
+    def __init__(self) -> None:
+        self.count: int = 0
+
+
+class VisitsBakery(Bakery):
+    visits: Visits = factory(Cake(Visits))
+    shared_visits: Visits = Cake(Visits)
+
+
+async def test_bakery_patch_factory(bakery_mock: BakeryMock) -> None:
+    fake_visits: Visits = Visits()
+    bakery_mock.visits = Cake(fake_visits)
+    bakery_mock.shared_visits = factory(Cake(Visits))
+
+    async with bakery_mock(VisitsBakery):
+        bakery: VisitsBakery = VisitsBakery()
+        assert bakery.visits is fake_visits
+        assert bakery.shared_visits is not bakery.shared_visits
+
+    async with VisitsBakery() as bakery:
+        assert bakery.visits is not bakery.visits
+        assert bakery.shared_visits is bakery.shared_visits
+
+        # swapped in the opened bakery
+        bakery_mock.visits = Cake(fake_visits)
+        bakery_mock.shared_visits = factory(Cake(Visits))
+        async with bakery_mock(VisitsBakery, rebake=True):
+            assert bakery.visits is fake_visits
+            assert bakery.shared_visits is not bakery.shared_visits
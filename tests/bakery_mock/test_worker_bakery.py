@@ -0,0 +1,83 @@
+"""Test bakery baked once per xdist worker."""
+
+from __future__ import annotations
+
+import pytest
+
+from bakery import Bakery, Cake
+from bakery.testbakery import worker_bakery, worker_id
+
+BAKED: list[str] = []
+
+
+class Database:
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        BAKED.append(name)
+
+
+class WorkerBakery(Bakery):
+    database_name: str = Cake("test")
+    database: Database = Cake(Database, database_name)
+
+
+async def connect(name: str) -> Database:
+    return Database(name)
+
+
+class AsyncWorkerBakery(Bakery):
+    database_name: str = Cake("test")
+    database: Database = Cake(connect, database_name)
+
+
+worker_database = worker_bakery(
+    WorkerBakery,
+    lambda worker: {"database_name": Cake(f"test_{worker}")},
+)
+
+
+@pytest.mark.usefixtures("worker_database")
+def test_worker_bakery() -> None:
+    assert WorkerBakery().database.name == f"test_{worker_id()}"
+    assert [f"test_{worker_id()}"] == BAKED
+
+
+def test_worker_bakery_reused(worker_database: WorkerBakery) -> None:
+    assert worker_database.database is WorkerBakery().database
+    assert [f"test_{worker_id()}"] == BAKED  # baked once per worker
+
+
+def test_sync_async_cake() -> None:
+    fixture = worker_bakery(AsyncWorkerBakery)
+    baked_bakery = getattr(fixture, "__wrapped__", fixture)()
+    with pytest.raises(TypeError, match="cannot be baked without event loop"):
+        next(baked_bakery)
+
+    assert not AsyncWorkerBakery.__bakery_visitors__
+
+
+async def test_async_cake() -> None:
+    fixture = worker_bakery(
+        AsyncWorkerBakery,
+        lambda worker: {"database_name": Cake(f"async_{worker}")},
+        sync=False,
+    )
+    baked_bakery = getattr(fixture, "__wrapped__", fixture)()
+    baked: AsyncWorkerBakery = await baked_bakery.__anext__()
+    assert baked.database.name == f"async_{worker_id()}"
+
+    await baked_bakery.aclose()
+    assert not AsyncWorkerBakery.__bakery_visitors__
+
+
+def test_worker_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert worker_id() == "gw3"
+
+    monkeypatch.delenv("PYTEST_XDIST_WORKER")
+    assert worker_id() == "master"
+
+
+def test_not_a_bakery() -> None:
+    with pytest.raises(TypeError, match="is not a Bakery"):
+        worker_bakery(Database)  # type: ignore[arg-type]
@@ -0,0 +1,155 @@
+"""Test autowired bakery."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AsyncIterator
+from unittest import mock
+
+import pytest
+
+from bakery import Bakery, Cake, autowired
+from bakery.autowire import RECIPE_PARAMETERS
+
+
+@dataclass
+class Settings:
+    dsn: str = "db://"
+
+
+class Database:
+    def __init__(self, settings: Settings) -> None:
+        self.dsn: str = settings.dsn
+
+
+class Cache:
+    pass
+
+
+class RedisCache(Cache):
+    pass
+
+
+@dataclass
+class Service:
+    database: Database
+    cache: Cache
+    name: str = "service"
+
+
+async def open_session(database: Database) -> AsyncIterator[str]:
+    yield f"session over {database.dsn}"
+
+
+def connect(settings: Settings) -> Database:
+    return Database(settings)
+
+
+async def test_autowire() -> None:
+    class MyBakery(Bakery, autowire=True):
+        settings: Settings = Cake(Settings)
+        database: Database = autowired(Database)
+        cache: RedisCache = Cake(RedisCache)
+        service: Service = autowired(Service, name="explicit")
+        session: str = autowired(open_session)
+
+    assert MyBakery.service.__cake_recipe_kwargs__ == {
+        "database": MyBakery.database,
+        "cache": MyBakery.cache,
+        "name": "explicit",
+    }
+
+    async with MyBakery() as bakery:
+        assert bakery.service.database is bakery.database
+        assert bakery.service.cache is bakery.cache
+        assert bakery.service.name == "explicit"
+        assert bakery.session == "session over db://"
+
+
+async def test_signature_is_inspected_once() -> None:
+    class MyBakery(Bakery, autowire=True):
+        settings: Settings = Cake(Settings)
+        database: Database = autowired(Database)
+
+    with mock.patch("inspect.signature", side_effect=AssertionError):
+        for _ in range(2):
+            async with MyBakery() as bakery:
+                assert bakery.database.dsn == "db://"
+
+        class OtherBakery(Bakery, autowire=True):
+            settings: Settings = Cake(Settings, dsn="other://")
+            database: Database = autowired(Database)
+
+    async with OtherBakery() as other:
+        assert other.database.dsn == "other://"
+    assert Database in RECIPE_PARAMETERS
+
+
+async def test_autowire_replaced_cake() -> None:
+    class MyBakery(Bakery, autowire=True):
+        settings: Settings = Cake(Settings)
+        database: Database = autowired(Database)
+
+    async with MyBakery(settings=Settings("test://")) as bakery:
+        assert bakery.database.dsn == "test://"
+
+
+def test_no_cake_matches() -> None:
+    with pytest.raises(TypeError, match="parameter 'cache: Cache' .* no cake matches"):
+
+        class MyBakery(Bakery, autowire=True):
+            settings: Settings = Cake(Settings)
+            database: Database = autowired(Database)
+            service: Service = autowired(Service)
+
+
+def test_several_cakes_match() -> None:
+    with pytest.raises(TypeError, match=r"several cakes \(main, replica\) match"):
+
+        class MyBakery(Bakery, autowire=True):
+            main: Settings = Cake(Settings)
+            replica: Settings = Cake(Settings)
+            database: Database = autowired(Database)
+
+
+def test_explicit_bakery_is_not_autowired() -> None:
+    class MyBakery(Bakery):
+        settings: Settings = Cake(Settings)
+        database: Database = autowired(Database)
+
+    assert not MyBakery.database.__cake_recipe_kwargs__
+
+
+def test_dependency_declared_after() -> None:
+    with pytest.raises(TypeError, match="cake 'settings' is declared after it, declare it first"):
+
+        class MyBakery(Bakery, autowire=True):
+            database: Database = autowired(Database)
+            settings: Settings = Cake(Settings)
+
+
+async def test_unhashable_recipe() -> None:
+    class DatabaseFactory:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, settings: Settings) -> Database:
+            return Database(settings)
+
+    class MyBakery(Bakery, autowire=True):
+        settings: Settings = Cake(Settings)
+        database: Database = autowired(DatabaseFactory())
+
+    async with MyBakery() as bakery:
+        assert bakery.database.dsn == "db://"
+
+
+async def test_function_recipe_annotations() -> None:
+    # cake types are known from the annotations only (postponed evaluation)
+    class MyBakery(Bakery, autowire=True):
+        settings: Settings = Cake(Settings)
+        database: Database = autowired(connect)
+        cache: Cache = Cake(Cache)
+        service: Service = autowired(Service)
+
+    async with MyBakery() as bakery:
+        assert bakery.service.database is bakery.database
@@ -0,0 +1,73 @@
+"""Test `python -m bakery bench`."""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any
+
+import pytest
+
+from bakery import Bakery, Cake
+from bakery.cli import bench_bakery, main, parse_stub, percentile
+
+OPENED: list[str] = []
+
+
+def connect(dsn: str) -> str:
+    OPENED.append(dsn)
+    return f"connection to {dsn}"
+
+
+class BenchBakery(Bakery):
+    dsn: str = Cake("db://")
+    connection: str = Cake(connect, dsn)
+
+
+STUB_DSN: str = "stub://"
+
+
+async def test_bench_bakery() -> None:
+    OPENED.clear()
+    durations: dict[str, list[float]] = await bench_bakery(BenchBakery, 3, {"dsn": "fake://"})
+    assert OPENED == ["fake://"] * 3
+    assert list(durations) == [
+        "bake total",
+        "critical path",
+        "unbake total",
+        "bake dsn",
+        "bake connection",
+        "unbake dsn",
+        "unbake connection",
+    ]
+    assert all(len(values) == 3 for values in durations.values())
+    assert all(
+        path <= total for path, total in zip(durations["critical path"], durations["bake total"])
+    )
+    assert not BenchBakery.__bakery_visitors__
+
+
+def test_bench_command(capsys: Any) -> None:
+    OPENED.clear()
+    stub: str = "dsn=tests.test_bakery_bench:STUB_DSN"
+    assert main(["bench", "tests.test_bakery_bench:BenchBakery", "-n", "2", "--stub", stub]) == 0
+    lines: list[str] = capsys.readouterr().out.splitlines()
+    assert lines[0] == "BenchBakery: 2 runs, ms"
+    assert lines[1].split() == ["p50", "p90", "p99", "p100"]
+    assert [line.split()[-5] for line in lines[2:5]] == ["total", "path", "total"]
+    assert OPENED == ["stub://"] * 2
+
+
+def test_parse_stub() -> None:
+    assert parse_stub('dsn="db://"') == ("dsn", "db://")
+    assert parse_stub("timeout=3") == ("timeout", 3)
+    assert parse_stub("cake=tests.test_bakery_bench:STUB_DSN") == ("cake", "stub://")
+    with pytest.raises(argparse.ArgumentTypeError, match="is not NAME=VALUE"):
+        parse_stub("dsn")
+
+
+def test_percentile() -> None:
+    values: list[float] = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([1.0], 50) == 1.0
@@ -0,0 +1,70 @@
+"""Test `python -m bakery check`."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bakery import Bakery, Cake, __Cake__, hand_made
+from bakery.cli import check_bakery, main
+
+
+class Settings:
+    def __init__(self, dsn: str) -> None:
+        self.dsn: str = dsn
+
+
+class AppBakery(Bakery):
+    dsn: str = Cake("db://")
+    timeout: int = Cake(5)
+    settings: Settings = Cake(Settings, dsn)
+    client: Any = Cake(tuple, Cake(list, [dsn, timeout]))
+
+
+def numbers() -> Any:
+    yield 1
+
+
+class BrokenBakery(Bakery):
+    token: str = __Cake__()
+    bad: Any = hand_made(Cake(list), "raw")  # type: ignore[arg-type]
+    number: int = Cake(5, 6)  # type: ignore[call-overload]
+    numbers: list[int] = Cake(list, Cake(numbers()))
+
+
+def test_check_command(capsys: Any) -> None:
+    assert main(["check", "tests.test_bakery_check:AppBakery"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "AppBakery: 4 cakes, 2 layers, up to 2 cakes could be baked concurrently",
+        "layer 0 (2): dsn, timeout",
+        "layer 1 (2): settings, client",
+        "critical path: dsn -> settings",
+    ]
+
+
+def test_check_bakery() -> None:
+    errors, warnings = check_bakery(BrokenBakery)
+    assert errors == ["'bad': unknown baking method 'raw'"]
+    assert len(warnings) == 3
+    assert warnings[0] == "'token' is undefined: pass it as BrokenBakery(token=...)"
+    assert warnings[1] == "'number': recipe 5 is not called, its arguments are ignored"
+    assert warnings[2].startswith("'numbers': recipe <generator object")
+
+
+def test_check_command_errors(capsys: Any) -> None:
+    assert main(["check", "tests.test_bakery_check:BrokenBakery"]) == 1
+    assert capsys.readouterr().out.startswith("error: 'bad': unknown baking method")
+
+    assert main(["check", "tests.test_bakery_check:Missing"]) == 1
+    assert capsys.readouterr().out.startswith("error: cannot import")
+
+
+def test_check_command_strict() -> None:
+    class WarnedBakery(Bakery):
+        number: int = Cake(5, 6)  # type: ignore[call-overload]
+
+    globals()["WarnedBakery"] = WarnedBakery
+    try:
+        assert main(["check", "tests.test_bakery_check:WarnedBakery"]) == 0
+        assert main(["check", "tests.test_bakery_check:WarnedBakery", "--strict"]) == 1
+    finally:
+        del globals()["WarnedBakery"]
@@ -0,0 +1,83 @@
+"""Test bakery graph export."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from bakery import Bakery, Cake, __Cake__, bakery_info, export_dot, export_mermaid
+from bakery.cli import main
+
+from .bakery_di.test_bakery_into_bakery import AppBakery
+
+
+class SmallBakery(Bakery):
+    name: str = __Cake__()
+    greeting: str = Cake("Hello, {}!".format, name)
+    length: int = Cake(len, greeting)
+    constant: int = Cake(42)
+
+
+async def test_bakery_info_timings() -> None:
+    info: dict[str, Any] = bakery_info(SmallBakery)
+    assert info["bakery"] == "SmallBakery"
+    assert info["critical_path"] == ["name", "greeting", "length"]
+    assert info["nodes"][0] == {
+        "name": "name",
+        "baking_method": "BAKE_NO_BAKE",
+        "undefined": True,
+        "baked": True,
+        "layer": 0,
+        "bake_duration": None,
+        "unbake_duration": None,
+        "critical": True,
+    }
+
+    async with SmallBakery(name="bakery"):
+        info = bakery_info(SmallBakery)
+        assert all(node["baked"] for node in info["nodes"])
+
+    info = bakery_info(SmallBakery)
+    nodes: dict[str, Any] = {node["name"]: node for node in info["nodes"]}
+    assert nodes["greeting"]["baking_method"] == "BAKE_FROM_CALL"
+    assert nodes["greeting"]["bake_duration"] > 0
+    assert nodes["greeting"]["unbake_duration"] > 0
+    assert not nodes["constant"]["critical"]
+
+
+def test_sub_bakeries_export() -> None:
+    info: dict[str, Any] = bakery_info(AppBakery)
+    assert list(info["bakeries"]) == ["auth_bakery", "client_bakery", "adapter_bakery"]
+    assert info["bakeries"]["auth_bakery"]["bakery"] == "AuthBakery"
+    assert info["bakeries"]["auth_bakery"]["bindings"] == {
+        "username": ["username"],
+        "password": ["password"],
+    }
+    assert info["bakeries"]["client_bakery"]["bindings"] == {
+        "base_url": ["http_base_url"],
+        "auth": ["auth_bakery"],
+    }
+
+    dot: str = export_dot(AppBakery)
+    assert dot.startswith('digraph "AppBakery" {')
+    assert 'subgraph "cluster_auth_bakery" {' in dot
+    assert '"auth_bakery.auth" -> "auth_bakery.username";' in dot
+    assert '"auth_bakery.username" -> "username" [style=dashed];' in dot
+
+    mermaid: str = export_mermaid(AppBakery)
+    assert mermaid.startswith("flowchart TD")
+    assert 'subgraph cluster_auth_bakery["auth_bakery: AuthBakery"]' in mermaid
+    assert "auth_bakery_username -.-> username" in mermaid
+
+
+def test_graph_command(capsys: Any) -> None:
+    assert (
+        main(["graph", "tests.bakery_di.test_bakery_into_bakery:AppBakery", "--format", "json"])
+        == 0
+    )
+    assert json.loads(capsys.readouterr().out) == bakery_info(AppBakery)
+
+    with pytest.raises(TypeError, match="is not a Bakery"):
+        main(["graph", "tests.bakery_di.misc:Auth"])
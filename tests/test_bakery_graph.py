@@ -0,0 +1,157 @@
+"""Test bakery dependency graph."""
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Iterator
+
+import pytest
+
+from bakery import Bakery, BakeryGraph, Cake, __Cake__, bakery_graph
+
+
+def join(*args: Any) -> str:
+    return "".join(map(str, args))
+
+
+class MyBakery(Bakery):
+    host: str = Cake("localhost")
+    port: int = Cake(5432)
+    user: str = __Cake__()
+    url: str = Cake(join, host, ":", port)
+    dsn: str = Cake(join, user, "@", url)
+    settings: dict = Cake({"dsn": dsn, "options": [port]})
+    dsn_len: int = Cake(Cake(len, settings["dsn"]))
+    unrelated: int = Cake(42)
+
+
+def test_graph_structure() -> None:
+    graph: BakeryGraph = bakery_graph(MyBakery)
+
+    assert graph.nodes == (
+        "host",
+        "port",
+        "user",
+        "url",
+        "dsn",
+        "settings",
+        "dsn_len",
+        "unrelated",
+    )
+    assert graph.undefined == ("user",)
+    assert "dsn" in graph
+    assert "missing" not in graph
+    assert len(graph) == 8
+    assert set(graph.edges) == {
+        ("url", "host"),
+        ("url", "port"),
+        ("dsn", "user"),
+        ("dsn", "url"),
+        ("settings", "dsn"),
+        ("settings", "port"),
+        ("dsn_len", "settings"),
+    }
+    assert graph.dependencies("dsn") == ("user", "url")
+    assert set(graph.dependencies("dsn", transitive=True)) == {"user", "url", "host", "port"}
+    assert graph.dependents("port") == ("url", "settings")
+    assert set(graph.dependents("host", transitive=True)) == {"url", "dsn", "settings", "dsn_len"}
+
+    assert graph.layers == (
+        ("host", "port", "user", "unrelated"),
+        ("url",),
+        ("dsn",),
+        ("settings",),
+        ("dsn_len",),
+    )
+    assert graph.depth == 5
+    assert graph.layer("dsn") == 2
+    assert graph.cycle == ()
+
+    with pytest.raises(KeyError, match="has no cake 'missing'"):
+        graph.dependents("missing")
+
+
+def test_graph_aliases_and_foreign_cakes() -> None:
+    class OtherBakery(Bakery):
+        value: int = Cake(1)
+
+    class AliasBakery(Bakery):
+        value: int = Cake(OtherBakery.value)
+        alias: int = value
+        doubled: int = Cake(lambda x: x * 2, alias)
+
+    graph: BakeryGraph = bakery_graph(AliasBakery)
+    assert graph.nodes == ("value", "doubled")
+    assert graph.edges == (("doubled", "value"),)
+
+
+async def test_cycle_on_open() -> None:
+    class CycleBakery(Bakery):
+        first: str = __Cake__()
+        second: str = Cake(join, first, "!")
+
+    with pytest.raises(ValueError, match="dependency cycle: first -> second -> first"):
+        await CycleBakery(first=Cake(join, CycleBakery.second)).aopen()
+
+    assert not CycleBakery.__bakery_visitors__
+    assert bakery_graph(CycleBakery).cycle == ()
+
+    async with CycleBakery(first=Cake("first")) as bakery:
+        assert bakery.second == "first!"
+
+
+async def test_rebake_replaced_dependency_order() -> None:
+    class ReplacedBakery(Bakery):
+        first: str = __Cake__()
+        second: str = Cake("second")
+
+    async with ReplacedBakery(first=Cake(join, ReplacedBakery.second, "!")) as bakery:
+        await ReplacedBakery.swap(ReplacedBakery.second, "swapped")
+        assert bakery.first == "swapped!"
+
+
+async def test_graph_cache() -> None:
+    class CachedBakery(Bakery):
+        first: str = __Cake__()
+        second: str = Cake("second")
+
+    graph: BakeryGraph = bakery_graph(CachedBakery)
+    assert bakery_graph(CachedBakery) is graph
+    assert graph.dependencies("first") == ()
+
+    async with CachedBakery(first=Cake(join, CachedBakery.second)):
+        assert bakery_graph(CachedBakery).dependencies("first") == ("second",)
+
+        await CachedBakery.swap(CachedBakery.first, Cake("first"))
+        assert bakery_graph(CachedBakery).dependencies("first") == ()
+
+    assert bakery_graph(CachedBakery).dependencies("first") == ()
+
+
+def test_long_chain() -> None:
+    chain: list[Any] = [Cake(0)]
+    for _ in range(5000):
+        chain.append(Cake(join, chain[-1]))
+    # dependents first: every node is visited with the whole chain below
+    cakes: dict[str, Any] = {
+        f"cake_{index}": cake for index, cake in reversed(list(enumerate(chain)))
+    }
+    # validated on subclassing
+    graph: BakeryGraph = bakery_graph(type("LongBakery", (Bakery,), cakes))
+
+    assert graph.cycle == ()
+    assert graph.order == tuple(reversed(cakes))
+    assert graph.depth == len(cakes)
+
+
+async def test_plain_values_not_walked() -> None:
+    class PlainBakery(Bakery):
+        items: Iterator[int] = Cake(iter([1, 2, 3]))
+        ids: Iterator[int] = Cake(count())  # endless
+        first: int = Cake(next, ids)
+
+    assert bakery_graph(PlainBakery).dependencies("first") == ("ids",)
+
+    async with PlainBakery() as bakery:
+        assert list(bakery.items) == [1, 2, 3]
+        assert bakery.first == 0
@@ -0,0 +1,104 @@
+"""Test bakery metrics."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from bakery import Bakery, BakeryMetrics, Cake, MetricsRegistry
+from bakery.metrics import Counter, Histogram
+
+FAIL: list[bool] = []
+
+
+def connect(dsn: str) -> str:
+    if FAIL:
+        raise ConnectionError(dsn)
+    return dsn
+
+
+class MetricsBakery(Bakery):
+    dsn: str = Cake("db://")
+    connection: str = Cake(connect, dsn)
+
+
+@pytest.fixture
+def metrics() -> Iterator[BakeryMetrics]:
+    bakery_metrics: BakeryMetrics = BakeryMetrics(MetricsBakery)
+    yield bakery_metrics
+    bakery_metrics.stop()
+
+
+async def test_metrics(metrics: BakeryMetrics) -> None:
+    async with MetricsBakery(), MetricsBakery():
+        exposed: str = metrics.expose()
+        assert 'bakery_visitors{bakery="MetricsBakery"} 2' in exposed
+        assert 'bakery_baked_cakes{bakery="MetricsBakery"} 2' in exposed
+
+    FAIL.append(True)
+    try:
+        with pytest.raises(ConnectionError):
+            await MetricsBakery.aopen()
+    finally:
+        FAIL.clear()
+
+    exposed = metrics.expose()
+    assert 'bakery_opens_total{bakery="MetricsBakery"} 1' in exposed
+    assert 'bakery_closes_total{bakery="MetricsBakery"} 2' in exposed
+    assert 'bakery_bake_failures_total{bakery="MetricsBakery",cake="connection"} 1' in exposed
+    assert 'bakery_cake_bake_seconds_count{bakery="MetricsBakery",cake="dsn"} 1' in exposed
+    assert 'bakery_cake_unbake_seconds_count{bakery="MetricsBakery",cake="dsn"} 1' in exposed
+    assert (
+        'bakery_cake_bake_seconds_bucket{bakery="MetricsBakery",cake="dsn",le="+Inf"} 1' in exposed
+    )
+    assert 'bakery_visitors{bakery="MetricsBakery"} 0' in exposed
+    assert 'bakery_baked_cakes{bakery="MetricsBakery"} 0' in exposed
+    assert "# TYPE bakery_cake_bake_seconds histogram" in exposed
+
+
+async def test_untracked_bakery(metrics: BakeryMetrics) -> None:
+    class OtherBakery(Bakery):
+        number: int = Cake(1)
+
+    async with OtherBakery():
+        pass
+    assert "OtherBakery" not in metrics.expose()
+
+    metrics.stop()
+    async with MetricsBakery():
+        pass
+    assert "bakery_opens_total{" not in metrics.expose()
+
+
+def test_registry() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    counter: Counter = Counter("requests_total", "Requests.", ("path",))
+    histogram: Histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+    registry.register(counter)
+    registry.register(histogram)
+    counter.inc('/a"b\\c\n')
+    counter.inc('/a"b\\c\n', amount=2)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.expose().splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a\\"b\\\\c\\n"} 3',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.6",
+        "latency_seconds_count 3",
+    ]
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("requests_total", "Requests."))
+    with pytest.raises(ValueError, match="cannot be decreased"):
+        counter.inc("/", amount=-1)
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc()
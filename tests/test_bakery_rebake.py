@@ -0,0 +1,111 @@
+"""Test bakery rebake."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from typing_extensions import Self
+
+from bakery import Bakery, Cake, is_baked
+
+
+class Counter:
+    created: int = 0
+
+    def __init__(self, *_args: Any, **_kwargs: Any) -> None:
+        type(self).created += 1
+        self.version: int = type(self).created
+
+
+async def test_rebake_dependents_only() -> None:
+    settings_values: list[str] = ["first", "second"]
+
+    class SettingsCounter(Counter):
+        created = 0
+
+    class ClientCounter(Counter):
+        created = 0
+
+    class UnrelatedCounter(Counter):
+        created = 0
+
+    class MyBakery(Bakery):
+        settings: SettingsCounter = Cake(SettingsCounter)
+        url: str = Cake(lambda _: settings_values.pop(0), settings)
+        client: ClientCounter = Cake(Cake(ClientCounter, url=url))
+        client_version: int = Cake(client.version)
+        unrelated: UnrelatedCounter = Cake(UnrelatedCounter)
+
+    async with MyBakery() as bakery:
+        assert bakery.url == "first"
+        assert bakery.client_version == 1
+        unrelated: UnrelatedCounter = bakery.unrelated
+
+        await MyBakery.rebake(MyBakery.url)
+
+        assert bakery.settings.version == 1
+        assert bakery.url == "second"
+        assert bakery.client_version == 2
+        assert bakery.unrelated is unrelated
+        assert UnrelatedCounter.created == 1
+
+    assert not is_baked(MyBakery.client)
+
+
+async def test_rebake_closed_bakery() -> None:
+    class MyBakery(Bakery):
+        value: int = Cake(1)
+
+    with pytest.raises(ValueError, match="is not opened"):
+        await MyBakery.rebake(MyBakery.value)
+
+
+async def test_rebake_foreign_cake() -> None:
+    class OtherBakery(Bakery):
+        value: int = Cake(1)
+
+    class MyBakery(Bakery):
+        value: int = Cake(1)
+
+    async with MyBakery():
+        with pytest.raises(ValueError, match="is not a 'test_rebake_foreign_cake.<locals>"):
+            await MyBakery.rebake(OtherBakery.value)
+
+
+async def test_rebake_failed() -> None:
+    urls: list[str] = ["primary"]
+
+    class Client:
+        def __init__(self, url: str) -> None:
+            self.url: str = url
+            self.opened: bool = False
+
+        def __enter__(self) -> Self:
+            self.opened = True
+            return self
+
+        def __exit__(self, *_args: object) -> None:
+            self.opened = False
+
+    class MyBakery(Bakery):
+        url: str = Cake(urls.pop)
+        client: Client = Cake(Cake(Client, url))
+
+    async with MyBakery() as bakery:
+        client: Client = bakery.client
+
+        with pytest.raises(IndexError):
+            await MyBakery.rebake(MyBakery.url)
+
+        # old cakes are in place and still baked
+        assert bakery.url == "primary"
+        assert bakery.client is client
+        assert client.opened
+
+        urls.append("replica")
+        await MyBakery.rebake(MyBakery.url)
+        assert bakery.client.url == "replica"
+        assert not client.opened
+
+    assert not is_baked(MyBakery.client)
@@ -0,0 +1,90 @@
+"""Test bakery snapshot."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from bakery import (
+    Bakery,
+    BakingMethod,
+    Cake,
+    __Cake__,
+    bakery_graph,
+    bakery_snapshot,
+    fork_safe,
+    load_snapshot,
+    restore_bakery,
+    save_snapshot,
+)
+from bakery.cli import main
+
+from .bakery_di.misc import CPU, Auth, HttpClient
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class ClientBakery(Bakery, fork_aware=True):
+    username: str = __Cake__()
+    settings: dict[str, Any] = fork_safe(Cake({"url": "http://bakery", "cores": [4, 8]}))
+    auth: Auth = Cake(Auth, username=username, password="secret")  # noqa: S106
+    client: HttpClient = Cake(Cake(HttpClient, settings["url"], auth=auth))
+    cpu: CPU = Cake(CPU, settings["cores"][1], manufacturer=min("b", "a"))
+    same_cpu: CPU = cpu
+
+
+def test_snapshot_structure() -> None:
+    snapshot: dict[str, Any] = bakery_snapshot(ClientBakery)
+    assert snapshot["bakery"] == "ClientBakery"
+    assert snapshot["fork_aware"]
+    assert snapshot["order"] == list(bakery_graph(ClientBakery).order)
+    cakes: dict[str, Any] = {cake["name"]: cake for cake in snapshot["cakes"]}
+    assert cakes["auth"]["recipe"] == {"import": "tests.bakery_di.misc:Auth"}
+    assert cakes["auth"]["kwargs"]["username"] == {"cake": "username"}
+    assert cakes["same_cpu"] == {"name": "same_cpu", "alias": "cpu"}
+    assert cakes["settings"]["fork_safe"]
+
+
+async def test_restored_bakery_imports_lazily(monkeypatch: Any) -> None:
+    snapshot: dict[str, Any] = json.loads(json.dumps(bakery_snapshot(ClientBakery)))
+    monkeypatch.delitem(sys.modules, "tests.bakery_di.misc")
+
+    restored: Any = restore_bakery(snapshot)
+    assert "tests.bakery_di.misc" not in sys.modules
+    assert restored.__qualname__ == "ClientBakery"
+    assert restored.__bakery_fork_aware__
+    assert restored.same_cpu is restored.cpu
+    assert restored.auth.__cake_baking_method__ == BakingMethod.BAKE_FROM_CALL
+    assert bakery_graph(restored).edges == bakery_graph(ClientBakery).edges
+
+    async with restored(username="baker") as bakery:
+        assert "tests.bakery_di.misc" in sys.modules
+        assert bakery.auth.username == "baker"
+        assert bakery.client.connected
+        assert bakery.client.base_url == "http://bakery"
+        assert bakery.cpu.core_num == 8
+        assert bakery.cpu.manufacturer == "a"
+
+    assert not ClientBakery.__bakery_visitors__
+
+
+def test_snapshot_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "bakery.json"
+    save_snapshot(ClientBakery, path)
+    assert bakery_snapshot(load_snapshot(path)) == bakery_snapshot(ClientBakery)
+
+    output: Path = tmp_path / "cli.json"
+    assert main(["snapshot", "tests.test_bakery_snapshot:ClientBakery", "-o", str(output)]) == 0
+    assert json.loads(output.read_text()) == bakery_snapshot(ClientBakery)
+
+
+def test_not_importable_recipe() -> None:
+    class LocalBakery(Bakery):
+        value: int = Cake(lambda: 42)
+
+    with pytest.raises(ValueError, match="cannot be snapshotted"):
+        bakery_snapshot(LocalBakery)
@@ -0,0 +1,154 @@
+"""Test cake swap in opened bakery."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from typing_extensions import Self
+
+from bakery import Bakery, Cake, fork_safe, is_baked
+
+
+class Connection:
+    def __init__(self, url: str) -> None:
+        self.url: str = url
+        self.opened: bool = False
+
+    def __enter__(self) -> Self:
+        assert not self.opened
+        self.opened = True
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        assert self.opened
+        self.opened = False
+
+
+class Repository:
+    def __init__(self, connection: Connection) -> None:
+        self.connection: Connection = connection
+
+
+def broken_connection(_url: str) -> Connection:
+    msg = "broken"
+    raise RuntimeError(msg)
+
+
+async def test_swap_cake() -> None:
+    class MyBakery(Bakery):
+        url: str = Cake("primary")
+        connection: Connection = Cake(Cake(Connection, url))
+        repository: Repository = Cake(Repository, connection)
+        repository_url: str = Cake(connection.url)
+
+    async with MyBakery() as bakery:
+        old_connection: Connection = bakery.connection
+        old_repository: Repository = bakery.repository
+        assert old_connection.opened
+
+        def drain() -> Any:
+            # old cakes are still baked while new ones are in place
+            assert old_connection.opened
+            assert bakery.connection.opened
+            return checkpoint()
+
+        await MyBakery.swap(MyBakery.url, "replica", drain=drain)
+
+        assert not old_connection.opened
+        assert bakery.url == "replica"
+        assert bakery.connection.url == bakery.repository_url == "replica"
+        assert bakery.connection.opened
+        assert bakery.repository is not old_repository
+        assert bakery.repository.connection is bakery.connection
+
+        new_connection: Connection = bakery.connection
+
+    assert not new_connection.opened
+    assert not is_baked(MyBakery.connection)
+
+
+async def test_swap_failed() -> None:
+    class MyBakery(Bakery):
+        url: str = Cake("primary")
+        connection: Connection = Cake(Cake(Connection, url))
+        repository: Repository = Cake(Repository, connection)
+
+    async with MyBakery() as bakery:
+        connection: Connection = bakery.connection
+        repository: Repository = bakery.repository
+
+        with pytest.raises(RuntimeError, match="broken"):
+            await MyBakery.swap(MyBakery.connection, Cake(Cake(broken_connection, "replica")))
+
+        assert bakery.connection is connection
+        assert bakery.repository is repository
+        assert connection.opened
+
+    assert not connection.opened
+
+
+async def test_swap_state() -> None:
+    class MyBakery(Bakery):
+        url: str = Cake("primary")
+        connection: Connection = fork_safe(Cake(Cake(Connection, url)))
+
+    async with MyBakery():
+        await MyBakery.rebake(MyBakery.connection)
+        # the old connection is unbaked, the fresh one is in place
+        assert MyBakery.connection.__cake_unbake_duration__ is None
+        assert MyBakery.connection.__cake_fork_safe__
+
+        await MyBakery.swap(MyBakery.connection, Cake(Connection, "replica"))
+        # fresh pastry state, not the old one
+        assert MyBakery.connection.__cake_unbake_duration__ is None
+        assert not MyBakery.connection.__cake_fork_safe__
+
+
+async def test_swap_dependent_fork_safe() -> None:
+    class MyBakery(Bakery):
+        url: str = Cake("primary")
+        connection: Connection = fork_safe(Cake(Cake(Connection, url)))
+
+    async with MyBakery():
+        await MyBakery.swap(MyBakery.url, "replica")
+        # the dependent is baked again from its fresh copy
+        assert MyBakery.connection.__cake_fork_safe__
+        await MyBakery.rebake(MyBakery.url)
+        assert MyBakery.connection.__cake_fork_safe__
+
+    assert MyBakery.connection.__cake_fork_safe__
+
+
+async def test_unbake_swapped_errors() -> None:
+    class PrimaryOnly(Connection):
+        def __exit__(self, *args: object) -> None:
+            super().__exit__(*args)
+            if self.url == "primary":
+                msg = "cannot close"
+                raise RuntimeError(msg)
+
+    class MyBakery(Bakery):
+        url: str = Cake("primary")
+        connection: Connection = Cake(Cake(Connection, url))
+        primary_only: PrimaryOnly = Cake(Cake(PrimaryOnly, url))
+
+    async with MyBakery() as bakery:
+        old_connection: Connection = bakery.connection
+        with pytest.raises(RuntimeError, match="cannot close"):
+            await MyBakery.swap(MyBakery.url, "replica")
+        # unbaked even though the cake unbaked before failed
+        assert not old_connection.opened
+        assert bakery.connection.opened
+
+
+async def test_swap_closed_bakery() -> None:
+    class MyBakery(Bakery):
+        url: str = Cake("primary")
+
+    with pytest.raises(ValueError, match="is not opened"):
+        await MyBakery.swap(MyBakery.url, "replica")
+
+
+async def checkpoint() -> None:
+    """Do nothing."""
@@ -0,0 +1,269 @@
+"""Test cached cakes."""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from bakery import Bakery, Cake, DiskCache, cached
+from bakery.caching import recipe_identity
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class JsonSerializer:
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def loads(self, data: memoryview) -> Any:
+        return json.loads(bytes(data))
+
+
+COMPILED: list[list[str]] = []
+
+
+def compile_words(words: list[str], *, upper: bool = False) -> dict[str, int]:
+    COMPILED.append(words)
+    return {word.upper() if upper else word: len(word) for word in words}
+
+
+@dataclass
+class Loader:
+    table: str
+
+    def __call__(self) -> str:
+        return self.table
+
+
+async def test_cached_cake(tmp_path: Path) -> None:
+    cache: DiskCache = DiskCache(tmp_path)
+    COMPILED.clear()
+
+    class MyBakery(Bakery):
+        words: list[str] = Cake(["bake", "cake"])
+        index: dict[str, int] = cached(Cake(compile_words, words, upper=True), cache=cache)
+        other: dict[str, int] = cached(Cake(compile_words, ["pie"]), cache=cache)
+
+    async with MyBakery() as bakery:
+        assert bakery.index == {"BAKE": 4, "CAKE": 4}
+        assert bakery.other == {"pie": 3}
+
+    async with MyBakery() as bakery:
+        assert bakery.index == {"BAKE": 4, "CAKE": 4}
+
+    assert len(COMPILED) == 2
+    assert len(cache.entries()) == 2
+
+    async with MyBakery(words=["pie"]) as bakery:
+        assert bakery.index == {"PIE": 3}
+    assert len(COMPILED) == 3
+
+    cache.clear()
+    assert not cache.entries()
+
+
+async def test_cache_version_and_eviction(tmp_path: Path) -> None:
+    cache: DiskCache = DiskCache(
+        tmp_path,
+        max_size=20,
+        serializer=JsonSerializer(),
+        memory_map=True,
+    )
+
+    async def compile_index(word: str) -> dict[str, Any]:
+        return {word: len(word)}
+
+    key: str | None = cache.key(compile_index, ("cake",), {})
+    assert key is not None
+    assert key != cache.key(compile_index, ("cake",), {}, version="2")
+    assert key != cache.key(compile_index, ("pie",), {})
+    assert cache.key(compile_index, (lambda: None,), {}) is None
+    assert cache.key(compile_index, (object(),), {}) is None
+
+    class MyBakery(Bakery):
+        index: dict[str, Any] = cached(Cake(compile_index, "cake"), cache=cache)
+        long_index: dict[str, Any] = cached(Cake(compile_index, "cheesecake"), cache=cache)
+
+    async with MyBakery() as bakery:
+        assert bakery.index == {"cake": 4}
+
+    # the first entry is evicted
+    assert cache.entries() == [cache.path(cache.key(compile_index, ("cheesecake",), {}) or "")]
+    assert cache.load(cache.key(compile_index, ("cheesecake",), {}) or "") == (
+        True,
+        {"cheesecake": 10},
+    )
+
+
+def test_cached_recipe_is_function() -> None:
+    with pytest.raises(TypeError, match="must be a function or a coroutine function"):
+        cached(Cake({"a": 1}))
+
+
+def test_recipe_identity() -> None:
+    def scale(value: int) -> int:
+        return value * 2
+
+    def other_scale(value: int) -> int:
+        return value * 3
+
+    def nested_scale(value: int) -> Any:
+        return lambda: value * 2
+
+    def other_nested_scale(value: int) -> Any:
+        return lambda: value * 3
+
+    def name(value: str) -> bool:
+        return value in {"cake", "pie"}
+
+    def other_name(value: str) -> bool:
+        return value in {"cake", "tart"}
+
+    # the same bytecode, different constants and nested code
+    for recipe, other_recipe in (
+        (scale, other_scale),
+        (nested_scale, other_nested_scale),
+        (name, other_name),
+    ):
+        other_recipe.__qualname__ = recipe.__qualname__
+        assert recipe_identity(recipe) != recipe_identity(other_recipe)
+
+
+def load(table: str, *, limit: int = 10) -> str:
+    return f"{table}[:{limit}]"
+
+
+def test_bound_recipe_identity() -> None:
+    def loader(table: str) -> Any:
+        return lambda: load(table)
+
+    class Table:
+        def __init__(self) -> None:
+            self.rows: int = 1
+
+    class OtherTable:
+        def __init__(self) -> None:
+            self.rows: int = 2
+
+    OtherTable.__qualname__ = Table.__qualname__
+    for recipe, other_recipe in (
+        (partial(load, "users"), partial(load, "orders")),
+        (partial(load, "users"), partial(load, "users", limit=5)),
+        (loader("users"), loader("orders")),
+        (Loader("users"), Loader("orders")),
+        (Loader("users").__call__, Loader("orders").__call__),
+        (Table, OtherTable),  # changed class code
+    ):
+        assert recipe_identity(recipe) != recipe_identity(other_recipe)
+
+    assert recipe_identity(partial(load, "users")) == recipe_identity(partial(load, "users"))
+    assert recipe_identity(len) == recipe_identity(len)
+
+
+async def test_partial_recipes(tmp_path: Path) -> None:
+    cache: DiskCache = DiskCache(tmp_path)
+
+    class MyBakery(Bakery):
+        users: str = cached(Cake(partial(load, "users")), cache=cache)
+        orders: str = cached(Cake(partial(load, "orders")), cache=cache)
+
+    async with MyBakery() as bakery:
+        assert bakery.users == "users[:10]"
+        assert bakery.orders == "orders[:10]"
+
+    async with MyBakery() as bakery:
+        assert bakery.users == "users[:10]"
+        assert bakery.orders == "orders[:10]"
+    assert len(cache.entries()) == 2
+
+
+def test_unidentified_recipe() -> None:
+    class Compiler:
+        def __call__(self, words: list[str]) -> dict[str, int]:
+            return {word: len(word) for word in words}
+
+    with pytest.raises(TypeError, match="cached cake recipe cannot be identified"):
+        cached(Cake(Compiler(), ["cake"]))
+    with pytest.raises(TypeError, match="cached cake recipe cannot be identified"):
+        cached(Cake(partial(load, object())))  # type: ignore[arg-type]
+
+
+def test_canonical_key(tmp_path: Path) -> None:
+    cache: DiskCache = DiskCache(tmp_path)
+
+    def key(*args: Any, **kwargs: Any) -> str | None:
+        return cache.key(len, args, kwargs)
+
+    # set order depends on hash seed
+    script: str = (
+        "from bakery import DiskCache; "
+        "print(DiskCache().key(len, ({f'word_{i}' for i in range(100)},), {'mode': 'a'}))"
+    )
+    keys: set[str] = {
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(keys) == 1
+
+    assert key({"a": 1, "b": 2}) == key({"b": 2, "a": 1})
+    assert key(a=1, b=2) == key(b=2, a=1)
+    assert len({key(1), key(1.0), key(True), key("1"), key((1,)), key([1])}) == 6  # noqa: FBT003
+
+
+def test_concurrent_eviction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache: DiskCache = DiskCache(tmp_path, max_size=100)
+    cache.store("first", "value")
+    cache.store("second", "value")
+    # temporary files are moved in place
+    assert set(tmp_path.iterdir()) == {cache.path("first"), cache.path("second")}
+
+    def evicted(path: Path) -> None:
+        cache.path("first").unlink()
+        raise FileNotFoundError(path)
+
+    # evicted by another process right after loading
+    monkeypatch.setattr(os, "utime", evicted)
+    assert cache.load("first") == (True, "value")
+    assert cache.load("first") == (False, None)
+    assert cache.entries() == [cache.path("second")]
+
+
+@pytest.mark.filterwarnings("error")
+def test_sync_open(tmp_path: Path) -> None:
+    cache: DiskCache = DiskCache(tmp_path)
+    COMPILED.clear()
+
+    async def compile_index(word: str) -> dict[str, int]:
+        return {word: len(word)}
+
+    class SyncBakery(Bakery):
+        index: dict[str, int] = cached(Cake(compile_words, ["cake"]), cache=cache)
+
+    class AsyncBakery(Bakery):
+        index: dict[str, int] = cached(Cake(compile_index, "cake"), cache=cache)
+
+    for _ in range(2):
+        with SyncBakery() as bakery:
+            assert bakery.index == {"cake": 4}
+    assert len(COMPILED) == 1
+
+    with pytest.raises(TypeError, match="cannot be baked without event loop"):
+        AsyncBakery.open()
+    # coroutine is closed: no "never awaited" warning on garbage collection
+    del AsyncBakery
+    gc.collect()
@@ -1,7 +1,7 @@
 """Test bakery methods."""
 
 from dataclasses import dataclass
-from typing import Any, Generator
+from typing import Any, AsyncGenerator, Generator
 from uuid import UUID, uuid4
 
 import pytest
@@ -112,7 +112,8 @@ async def test_cake_methods() -> None:
 async def test_cake_baking_auto_method_priority() -> None:
     """Test auto baking priority.
 
-    BAKE_FROM_CORO_FUNC > BAKE_FROM_AWAITABLE > BAKE_FROM_ACM > BAKE_FROM_CM >BAKE_FROM_BUILTIN
+    BAKE_FROM_CORO_FUNC > BAKE_FROM_ASYNC_GEN_FUNC > BAKE_FROM_GEN_FUNC > BAKE_FROM_AWAITABLE
+    > BAKE_FROM_ACM > BAKE_FROM_CM > BAKE_FROM_BUILTIN
     > BAKE_FROM_CALL
     """
 
@@ -179,6 +180,58 @@ async def test_cake_baking_auto_method_priority() -> None:
         assert cmp.synccm_vs_call == "enter"
 
 
+async def test_cake_generator_functions() -> None:
+    """Test bake from (async) generator functions with teardown."""
+    events: list[str] = []
+
+    def connect(dsn: str) -> Generator[str, None, None]:
+        events.append("connect")
+        yield f"connection to {dsn}"
+        events.append("disconnect")
+
+    async def open_session(connection: str) -> AsyncGenerator[str, None]:
+        events.append("open session")
+        yield f"session over {connection}"
+        events.append("close session")
+
+    class MyBakery(Bakery):
+        """My bakery."""
+
+        dsn: str = Cake("db://")
+        connection: str = Cake(connect, dsn)
+        session: str = Cake(open_session, connection)
+
+    assert MyBakery.connection.__cake_baking_method__ == BakingMethod.BAKE_FROM_GEN_FUNC
+    assert MyBakery.session.__cake_baking_method__ == BakingMethod.BAKE_FROM_ASYNC_GEN_FUNC
+
+    async with MyBakery() as bakery:
+        assert bakery.session == "session over connection to db://"
+        assert events == ["connect", "open session"]
+
+    assert events == ["connect", "open session", "close session", "disconnect"]
+
+    # baked again with fresh generators
+    async with MyBakery() as bakery:
+        assert bakery.connection == "connection to db://"
+
+
+async def test_cake_generator_yields_twice() -> None:
+    """Test generator recipe must yield once."""
+
+    def twice() -> Generator[int, None, None]:
+        yield 1
+        yield 2
+
+    class MyBakery(Bakery):
+        """My bakery."""
+
+        value: int = Cake(twice)
+
+    with pytest.raises(RuntimeError, match="didn't stop"):
+        async with MyBakery() as bakery:
+            assert bakery.value == 1
+
+
 async def test_cake_no_bake() -> None:
     """Test no bake method."""
     value: UUID = uuid4()
@@ -279,3 +332,19 @@ async def test_hand_made_any_object(*, hand_made_cake: bool) -> None:
         assert town.house1_value == town.house1.value == town.house2_value
         assert town.house1_avalue == town.house1.avalue == town.house2_avalue
         assert town.house1_smth == "something" == town.house2_smth
+
+
+def test_baking_method_values() -> None:
+    """Values are stable: they could be stored or passed around as ints."""
+    assert [(method.name, method.value) for method in BakingMethod] == [
+        ("BAKE_AUTO", 0),
+        ("BAKE_FROM_CORO_FUNC", 1),
+        ("BAKE_FROM_AWAITABLE", 2),
+        ("BAKE_FROM_ACM", 3),
+        ("BAKE_FROM_CM", 4),
+        ("BAKE_FROM_BUILTIN", 5),
+        ("BAKE_FROM_CALL", 6),
+        ("BAKE_NO_BAKE", 7),
+        ("BAKE_FROM_ASYNC_GEN_FUNC", 8),
+        ("BAKE_FROM_GEN_FUNC", 9),
+    ]
@@ -0,0 +1,119 @@
+"""Test factory (transient) cakes."""
+
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from bakery import Bakery, Cake, factory
+from bakery.cake import fresh_pastry
+from bakery.snapshot import bakery_snapshot, restore_bakery
+
+
+@dataclass
+class Database:
+    dsn: str
+
+
+@dataclass
+class UnitOfWork:
+    database: Database
+    changes: list[str] = field(default_factory=list)
+
+
+class RequestLogger:
+    def __init__(self, name: str, *, handlers: list[str]) -> None:
+        self.name: str = name
+        self.handlers: list[str] = handlers
+
+
+class MyBakery(Bakery):
+    dsn: str = Cake("db://")
+    database: Database = Cake(Database, dsn)
+    unit_of_work: UnitOfWork = factory(Cake(UnitOfWork, database))
+    logger: RequestLogger = factory(Cake(RequestLogger, "request", handlers=[dsn, "stderr"]))
+
+
+async def test_factory_cake() -> None:
+    async with MyBakery() as bakery:
+        first: UnitOfWork = bakery.unit_of_work
+        second: UnitOfWork = bakery.unit_of_work
+        assert first is not second
+        assert first.database is second.database is bakery.database
+        assert first.changes is not second.changes
+
+        assert MyBakery.unit_of_work() is not first
+        assert bakery.logger.handlers == ["db://", "stderr"]
+
+
+async def test_factory_dependent() -> None:
+    class RequestBakery(Bakery):
+        database: Database = Cake(Database, "db://")
+        unit_of_work: UnitOfWork = factory(Cake(UnitOfWork, database))
+        # dependent singleton gets its own fresh value
+        changes: list[str] = unit_of_work.changes
+
+    async with RequestBakery() as bakery:
+        assert bakery.changes == []
+        assert bakery.changes is bakery.changes
+        assert bakery.unit_of_work.changes is not bakery.changes
+
+
+async def test_factory_replaced_dependency() -> None:
+    async with MyBakery(dsn="test://") as bakery:
+        assert bakery.unit_of_work.database.dsn == "test://"
+
+
+async def test_replace_factory() -> None:
+    database: Database = Database("replaced://")
+    async with MyBakery(unit_of_work=Cake(UnitOfWork(database))) as bakery:
+        # plain cake in place of the factory one
+        assert bakery.unit_of_work is bakery.unit_of_work
+        assert bakery.unit_of_work.database is database
+
+    async with MyBakery() as bakery:
+        # factory is back
+        assert bakery.unit_of_work is not bakery.unit_of_work
+
+    class PlainBakery(Bakery):
+        database: Database = Cake(Database, "db://")
+
+    async with PlainBakery(database=factory(Cake(Database, "transient://"))) as plain_bakery:
+        assert plain_bakery.database is not plain_bakery.database
+
+    async with PlainBakery() as plain_bakery:
+        assert plain_bakery.database is plain_bakery.database
+
+
+async def test_factory_copy() -> None:
+    assert copy(MyBakery.unit_of_work).__cake_factory__
+    assert fresh_pastry(MyBakery.unit_of_work).__cake_factory__
+
+    async with MyBakery():
+        await MyBakery.swap(MyBakery.dsn, "swapped://")
+        assert MyBakery.unit_of_work() is not MyBakery.unit_of_work()
+        assert MyBakery.unit_of_work().database.dsn == "swapped://"
+
+
+async def test_factory_snapshot() -> None:
+    restored: Any = restore_bakery(bakery_snapshot(MyBakery))
+    assert restored.unit_of_work.__cake_factory__
+
+    async with restored() as bakery:
+        assert bakery.unit_of_work is not bakery.unit_of_work
+
+
+def test_factory_recipe_is_callable() -> None:
+    async def coro() -> int:
+        return 1
+
+    with pytest.raises(TypeError, match="must be a callable, not BAKE_FROM_CORO_FUNC"):
+        factory(Cake(coro))
+
+
+def test_factory_depends_on_factory() -> None:
+    with pytest.raises(TypeError, match="cannot depend on another factory"):
+        factory(Cake(str, MyBakery.unit_of_work.changes))
@@ -0,0 +1,62 @@
+"""Test FastAPI and Starlette integration."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+
+from bakery import Bakery, Cake, factory
+from bakery.fastapi import bakery_lifespan, depends, provider
+
+
+class Settings:
+    def __init__(self, dsn: str = "db://") -> None:
+        self.dsn: str = dsn
+
+
+class SettingsBakery(Bakery):
+    settings: Settings = Cake(Settings)
+
+
+class AppBakery(Bakery):
+    numbers: list[int] = Cake(list, range(3))
+    counter: list[int] = factory(Cake(list, numbers))
+
+
+async def test_lifespan() -> None:
+    lifespan: Any = bakery_lifespan(SettingsBakery(settings=Settings("test://")), AppBakery)
+
+    async with lifespan(object()):
+        assert SettingsBakery.__bakery_visitors__ == AppBakery.__bakery_visitors__ == 1
+        assert SettingsBakery().settings.dsn == "test://"
+
+    assert not SettingsBakery.__bakery_visitors__
+    assert not AppBakery.__bakery_visitors__
+
+
+async def test_provider() -> None:
+    provide: Callable[[], Any] = provider(AppBakery.numbers)
+    assert provider(AppBakery.numbers) is provide
+    assert provide.__name__ == "provide_numbers"
+
+    async with AppBakery() as bakery:
+        assert await provide() is bakery.numbers
+        assert await provider(AppBakery.counter)() == [0, 1, 2]
+        assert await provider(AppBakery.counter)() is not bakery.counter
+
+    with pytest.raises(ValueError, match="is not baked"):
+        await provide()
+
+
+def test_provider_of_not_cake() -> None:
+    with pytest.raises(TypeError, match="Cake expected"):
+        provider(42)
+
+
+def test_depends() -> None:
+    fastapi: Any = pytest.importorskip("fastapi")
+
+    dependency: Any = depends(AppBakery.numbers)
+    assert isinstance(dependency, type(fastapi.Depends()))
+    assert dependency.dependency is provider(AppBakery.numbers)
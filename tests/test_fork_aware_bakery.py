@@ -0,0 +1,154 @@
+"""Test fork aware bakery."""
+
+from __future__ import annotations
+
+import gc
+import os
+from typing import Any, Coroutine, Iterator
+
+import pytest
+from typing_extensions import Self
+
+from bakery import Bakery, Cake, __Cake__, fork_safe, is_baked
+
+
+class Settings:
+    def __init__(self, dsn: str) -> None:
+        self.dsn: str = dsn
+
+
+class Connection:
+    def __init__(self, settings: Settings) -> None:
+        self.dsn: str = settings.dsn
+        self.pid: int = os.getpid()
+        self.opened: bool = False
+
+    def __enter__(self) -> Self:
+        self.opened = True
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        self.opened = False
+
+
+class ForkBakery(Bakery, fork_aware=True):
+    dsn: str = __Cake__()
+    settings: Settings = fork_safe(Cake(Settings, dsn))
+    connection: Connection = Cake(Cake(Connection, settings))
+    # e.g. connection pool shared with children
+    shared: Connection = fork_safe(Cake(Cake(Connection, settings)))
+    # depends on fork unsafe cake, so it's unsafe too
+    connection_dsn: str = fork_safe(Cake(connection.dsn))
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run coroutine that never suspends."""
+    try:
+        coro.send(None)
+    except StopIteration as exc:
+        return exc.value
+    msg = "Coroutine suspended"
+    raise RuntimeError(msg)
+
+
+async def test_after_fork() -> None:
+    await ForkBakery(dsn="postgresql://").aopen()
+    settings: Settings = ForkBakery.settings()
+    connection: Connection = ForkBakery.connection()
+    shared: Connection = ForkBakery.shared()
+
+    # as if the process is forked
+    ForkBakery.__bakery_after_fork__()
+
+    assert not ForkBakery.__bakery_visitors__
+    assert ForkBakery.settings() is settings
+    assert not is_baked(ForkBakery.connection)
+    assert not is_baked(ForkBakery.connection_dsn)
+    assert connection.opened  # parent process owns it
+
+    async with ForkBakery() as bakery:  # type: ignore[call-arg]
+        assert bakery.settings is settings
+        assert bakery.connection is not connection
+        assert bakery.connection.opened
+        assert bakery.connection_dsn == "postgresql://"
+        child_connection: Connection = bakery.connection
+
+    assert not child_connection.opened
+    assert shared.opened  # discarded, the parent unbakes it
+    assert not is_baked(ForkBakery.shared)
+    assert not is_baked(ForkBakery.settings)
+    assert not ForkBakery.__bakery_forked__
+    assert ForkBakery.dsn.__cake_undefined__
+
+
+async def test_not_fork_aware_bakery() -> None:
+    class MyBakery(Bakery):
+        settings: Settings = fork_safe(Cake(Settings, "postgresql://"))
+
+    assert not MyBakery.__bakery_fork_aware__
+    assert ForkBakery.__bakery_fork_aware__
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+async def test_real_fork() -> None:
+    async with ForkBakery(dsn="postgresql://") as bakery:
+        settings: Settings = bakery.settings
+        connection: Connection = bakery.connection
+        shared: Connection = bakery.shared
+
+        pid: int = os.fork()
+        if not pid:  # pragma: no cover
+            code: int = 0
+            try:
+                assert not is_baked(ForkBakery.connection)
+                child_bakery: ForkBakery = run_sync(ForkBakery.aopen())
+                assert child_bakery.settings is settings
+                assert child_bakery.connection.pid == os.getpid()
+                run_sync(ForkBakery.aclose())
+                assert shared.opened
+            except BaseException:  # noqa: BLE001
+                code = 1
+            os._exit(code)
+
+        _, status = os.waitpid(pid, 0)  # noqa: ASYNC222
+        assert os.WIFEXITED(status)
+        assert os.WEXITSTATUS(status) == 0
+        assert bakery.connection is connection
+        assert connection.opened
+        assert shared.opened
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+async def test_real_fork_generator() -> None:
+    teardowns: list[int] = []
+
+    def open_session() -> Iterator[int]:
+        try:
+            yield os.getpid()
+        finally:
+            teardowns.append(os.getpid())
+
+    class GeneratorBakery(Bakery, fork_aware=True):
+        session: int = Cake(open_session)
+
+    async with GeneratorBakery() as bakery:
+        pid: int = os.fork()
+        if not pid:  # pragma: no cover
+            code: int = 0
+            try:
+                gc.collect()
+                run_sync(GeneratorBakery.aopen())
+                run_sync(GeneratorBakery.aclose())
+                gc.collect()
+                # the child's own session only
+                assert teardowns == [os.getpid()]
+            except BaseException:  # noqa: BLE001
+                code = 1
+            os._exit(code)
+
+        _, status = os.waitpid(pid, 0)  # noqa: ASYNC222
+        assert os.WIFEXITED(status)
+        assert os.WEXITSTATUS(status) == 0
+        assert bakery.session == os.getpid()
+
+    assert teardowns == [os.getpid()]
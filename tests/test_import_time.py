@@ -0,0 +1,35 @@
+"""Test `import bakery` stays light."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+import pytest
+
+import bakery
+from benchmarks.import_time import HEAVY_MODULES, imported_modules
+
+
+def test_no_heavy_imports() -> None:
+    heavy: set[str] = {
+        name for name in imported_modules() if name.partition(".")[0] in HEAVY_MODULES
+    }
+    assert not heavy
+
+
+def test_lazy_attributes() -> None:
+    lazy_modules: set[str] = set(bakery.LAZY_ATTRIBUTES.values())
+    exported: set[str] = set()
+    for module_name in lazy_modules:
+        module: Any = import_module(f"bakery.{module_name}")
+        exported.update(module.__all__)
+        for name in module.__all__:
+            assert getattr(bakery, name) is getattr(module, name)
+
+    assert exported == set(bakery.LAZY_ATTRIBUTES)
+    assert exported <= set(bakery.__all__)
+    assert exported <= set(dir(bakery))
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = bakery.missing  # type: ignore[attr-defined]
@@ -0,0 +1,64 @@
+"""Test lazy import cakes."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from bakery import Bakery, BakingMethod, Cake, lazy
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .bakery_di.misc import Auth, HttpClient
+
+
+class LazyBakery(Bakery):
+    auth: Auth = Cake(lazy("tests.bakery_di.misc:Auth"), username="baker", password="secret")  # noqa: S106
+    client: HttpClient = Cake(
+        Cake(lazy("tests.bakery_di.misc.HttpClient"), "http://bakery", auth=auth)
+    )
+
+
+async def test_lazy_import(monkeypatch: Any) -> None:
+    monkeypatch.delitem(sys.modules, "tests.bakery_di.misc", raising=False)
+
+    assert LazyBakery.auth.__cake_baking_method__ == BakingMethod.BAKE_AUTO
+    assert "tests.bakery_di.misc" not in sys.modules
+
+    async with LazyBakery() as bakery:
+        assert "tests.bakery_di.misc" in sys.modules
+        assert bakery.auth.username == "baker"
+        assert bakery.client.connected
+        assert LazyBakery.auth.__cake_baking_method__ == BakingMethod.BAKE_FROM_CALL
+
+
+async def test_lazy_import_error() -> None:
+    class BrokenBakery(Bakery):
+        value: int = Cake(lazy("tests.bakery_di.misc:Missing"))  # type: ignore[misc]
+
+    with pytest.raises(AttributeError, match="Missing"):
+        await BrokenBakery.aopen()
+
+
+def test_mypy_plugin(tmp_path: Path) -> None:
+    api: Any = pytest.importorskip("mypy.api")
+    source: Path = tmp_path / "lazy_snippet.py"
+    source.write_text(
+        "from bakery import Cake, lazy\n"
+        "\n"
+        'auth: int = Cake(lazy("tests.bakery_di.misc:Auth"), username="u", password="p")\n'
+        'missing = lazy("tests.bakery_di.misc:Missing")\n'
+        'reveal_type(lazy("tests.bakery_di.misc.CPU"))\n'
+    )
+    config: Path = tmp_path / "mypy.ini"
+    config.write_text("[mypy]\nplugins = bakery.mypy\n")
+
+    stdout, _, _ = api.run(
+        [str(source), "--config-file", str(config), "--cache-dir", str(tmp_path / "cache")]
+    )
+    assert 'expression has type "Auth", variable has type "int"' in stdout
+    assert "Cannot find lazy import 'tests.bakery_di.misc:Missing'" in stdout
+    assert "def (core_num: int, manufacturer: str) -> tests.bakery_di.misc.CPU" in stdout
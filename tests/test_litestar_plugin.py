@@ -0,0 +1,65 @@
+"""Test Litestar plugin."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("litestar")
+
+from litestar import get
+from litestar.testing import create_test_client
+
+from bakery import Bakery, Cake, factory
+from bakery.litestar import BakeryPlugin, provide
+
+
+class AppBakery(Bakery):
+    numbers: list[int] = Cake(list, range(3))
+    counter: list[int] = factory(Cake(list, numbers))
+    _private: int = Cake(42)
+
+
+class OtherBakery(Bakery):
+    numbers: list[int] = Cake(list, range(5))
+
+
+@get("/")
+async def handler(numbers: list[int], counter: list[int]) -> dict[str, Any]:
+    return {"numbers": numbers, "counter": counter}
+
+
+def test_plugin() -> None:
+    plugin: BakeryPlugin = BakeryPlugin(AppBakery)
+    assert set(plugin.dependencies) == {"numbers", "counter"}
+
+    with create_test_client(route_handlers=[handler], plugins=[plugin]) as client:
+        assert AppBakery.__bakery_visitors__ == 1
+        assert client.get("/").json() == {"numbers": [0, 1, 2], "counter": [0, 1, 2]}
+
+    assert not AppBakery.__bakery_visitors__
+
+
+def test_explicit_dependencies() -> None:
+    plugin: BakeryPlugin = BakeryPlugin(
+        AppBakery,
+        OtherBakery,
+        dependencies={"numbers": OtherBakery.numbers, "counter": AppBakery.counter},
+    )
+    with create_test_client(route_handlers=[handler], plugins=[plugin]) as client:
+        assert client.get("/").json() == {"numbers": [0, 1, 2, 3, 4], "counter": [0, 1, 2]}
+
+
+def test_cake_name_conflict() -> None:
+    with pytest.raises(ValueError, match="is already provided by another bakery"):
+        BakeryPlugin(AppBakery, OtherBakery)
+
+
+def test_provide() -> None:
+    dependency: Any = provide(AppBakery.numbers)
+    assert not dependency.use_cache
+    assert not dependency.sync_to_thread
+
+    with pytest.raises(TypeError, match="Cake expected"):
+        provide(42)
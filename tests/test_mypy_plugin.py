@@ -0,0 +1,98 @@
+"""Test bakery mypy plugin."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_bakery_attributes(tmp_path: Path) -> None:
+    api: Any = pytest.importorskip("mypy.api")
+    source: Path = tmp_path / "bakery_snippet.py"
+    source.write_text(
+        "from bakery import Bakery, Cake\n"
+        "\n"
+        "class MyBakery(Bakery):\n"
+        "    number: int = Cake(1)\n"
+        "\n"
+        "class SubBakery(MyBakery):\n"
+        "    text: str = Cake('1')\n"
+        "\n"
+        "class Plain:\n"
+        "    number: int = 1\n"
+        "\n"
+        "reveal_type(MyBakery.number)\n"
+        "reveal_type(SubBakery.text)\n"
+        "reveal_type(MyBakery.aopen)\n"
+        "reveal_type(Plain.number)\n"
+    )
+    config: Path = tmp_path / "mypy.ini"
+    config.write_text("[mypy]\nplugins = bakery.mypy\n")
+
+    stdout, _, _ = api.run(
+        [str(source), "--config-file", str(config), "--cache-dir", str(tmp_path / "cache")]
+    )
+    revealed: list[str] = [line for line in stdout.splitlines() if "Revealed type" in line]
+    assert len(revealed) == 4
+    assert re.search(r"Cakeable\[(builtins\.)?int\]", revealed[0])
+    assert re.search(r"Cakeable\[(builtins\.)?str\]", revealed[1])
+    assert "Cakeable" not in revealed[2]
+    assert "Cakeable" not in revealed[3]
+
+
+def test_cached_bakery_module(tmp_path: Path) -> None:
+    api: Any = pytest.importorskip("mypy.api")
+    (tmp_path / "cached_bakery.py").write_text(
+        "from bakery import Bakery, Cake\n\nclass MyBakery(Bakery):\n    number: int = Cake(1)\n"
+    )
+    user: Path = tmp_path / "bakery_user.py"
+    config: Path = tmp_path / "mypy.ini"
+    config.write_text(f"[mypy]\nplugins = bakery.mypy\nmypy_path = {tmp_path}\n")
+    args: list[str] = [str(user), "--config-file", str(config), "--cache-dir", str(tmp_path)]
+
+    user.write_text("from cached_bakery import MyBakery\n\nMyBakery.number()\n")
+    stdout: str = api.run(args)[0]
+    # errors in bakery itself (if reported) are not the user's
+    assert f"{user}:" not in stdout, stdout
+    # bakery module is loaded from the cache: no base class hooks
+    user.write_text("from cached_bakery import MyBakery\n\nreveal_type(MyBakery.number)\n")
+    assert "Cakeable" in api.run(args)[0]
+
+
+def test_no_hook_for_other_classes() -> None:
+    options: Any = pytest.importorskip("mypy.options")
+    mypy_plugin: Any = pytest.importorskip("bakery.mypy")
+
+    plugin: Any = mypy_plugin.BakeryPlugin(options.Options())
+    plugin.set_modules({})
+    assert plugin.get_class_attribute_hook("app.Plain.attr") is None
+    assert plugin.get_base_class_hook("app.Plain") is None
+    assert plugin.get_base_class_hook("bakery.bakery.Bakery") is not None
+    assert plugin.get_class_attribute_hook("app.MyBakery.aopen") is None
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "import bakery\n\nclient = bakery.lazy('lazy_clients:Client')\n",
+        "import os, bakery.cake as cake\n\nclient = cake.lazy('lazy_clients:Client')\n",
+        "from bakery import lazy\n\nclient = lazy('lazy_clients:Client')\n",
+    ],
+)
+def test_lazy_dependencies(tmp_path: Path, source: str) -> None:
+    api: Any = pytest.importorskip("mypy.api")
+    (tmp_path / "lazy_clients.py").write_text("class Client:\n    number: int = 1\n")
+    user: Path = tmp_path / "lazy_user.py"
+    user.write_text(f"{source}reveal_type(client.number)\n")
+    config: Path = tmp_path / "mypy.ini"
+    config.write_text(f"[mypy]\nplugins = bakery.mypy\nmypy_path = {tmp_path}\n")
+
+    stdout, _, _ = api.run(
+        [str(user), "--config-file", str(config), "--cache-dir", str(tmp_path / "cache")]
+    )
+    assert re.search(r'Revealed type is "(builtins\.)?int"', stdout), stdout
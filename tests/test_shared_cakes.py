@@ -0,0 +1,123 @@
+"""Test shared cakes."""
+
+from __future__ import annotations
+
+import json
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import pytest
+
+from bakery import Bakery, Cake, shared
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls: int = 0
+
+    def __call__(self, size: int) -> bytes:
+        self.calls += 1
+        return bytes(range(size))
+
+
+async def test_shared_memory() -> None:
+    name: str = f"bakery-{uuid4().hex[:8]}"
+    loader: Loader = Loader()
+
+    class OwnerBakery(Bakery):
+        size: int = Cake(10)
+        table: memoryview = shared(Cake(loader, size), name)
+
+    class WorkerBakery(Bakery):
+        table: memoryview = shared(Cake(loader, 10), name)
+
+    async with OwnerBakery() as owner:
+        assert owner.table.readonly
+        assert bytes(owner.table) == bytes(range(10))
+
+        async with WorkerBakery() as worker:
+            assert bytes(worker.table) == bytes(range(10))
+
+        assert loader.calls == 1
+        # worker does not remove the data
+        SharedMemory(name).close()
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name)
+
+
+async def test_memory_mapped_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "lookup.json"
+
+    async def load_lookup() -> dict[str, int]:
+        return {"answer": 42}
+
+    class MyBakery(Bakery):
+        lookup: dict[str, Any] = shared(
+            Cake(load_lookup),
+            "lookup",
+            path=path,
+            dumps=lambda data: json.dumps(data).encode(),
+            loads=lambda buf: json.loads(bytes(buf)),
+        )
+
+    async with MyBakery() as bakery:
+        assert bakery.lookup == {"answer": 42}
+        assert path.read_bytes() == b'{"answer": 42}'  # noqa: ASYNC240
+        assert list(tmp_path.iterdir()) == [path]  # noqa: ASYNC240
+
+    assert not path.exists()  # noqa: ASYNC240
+
+
+async def test_stale_shared_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    name: str = f"bakery-{uuid4().hex[:8]}"
+    monkeypatch.setattr("bakery.sharing.ATTACH_TIMEOUT", 0.01)
+    # the owner died before writing the data
+    stale: SharedMemory = SharedMemory(name, create=True, size=16)
+    stale.close()
+
+    class MyBakery(Bakery):
+        table: memoryview = shared(Cake(bytes, b"data"), name)
+
+    async with MyBakery() as bakery:
+        assert bytes(bakery.table) == b"data"
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name)
+
+
+def test_shared_recipe_is_function() -> None:
+    with pytest.raises(TypeError, match="must be a function or a coroutine function"):
+        shared(Cake(b"data"), "data")
+
+
+async def test_memory_mapped_empty_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "empty"
+
+    class MyBakery(Bakery):
+        empty: memoryview = shared(Cake(bytes), "empty", path=path)
+
+    async with MyBakery() as bakery:
+        assert bytes(bakery.empty) == b""
+        assert path.exists()  # noqa: ASYNC240
+
+    assert not path.exists()  # noqa: ASYNC240
+
+
+async def test_shared_data_in_use(tmp_path: Path) -> None:
+    path: Path = tmp_path / "data"
+
+    class MyBakery(Bakery):
+        data: memoryview = shared(Cake(bytes, b"data"), "data", path=path)
+
+    async with MyBakery() as bakery:
+        data: memoryview = bakery.data[1:]
+
+    # still mapped data is not removed
+    assert bytes(data) == b"ata"
+    assert path.exists()  # noqa: ASYNC240
+    data.release()
@@ -0,0 +1,175 @@
+"""Test bakery opened without event loop."""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Generator, Iterator
+
+import pytest
+
+from bakery import Bakery, Cake
+
+
+@dataclass
+class Settings:
+    dsn: str
+
+
+class Connection:
+    def __init__(self, settings: Settings) -> None:
+        self.dsn: str = settings.dsn
+        self.closed: bool = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class Garage(Bakery):
+    car: str = Cake("BMW")
+
+
+class SyncBakery(Bakery):
+    settings: Settings = Cake(Settings, dsn="db://")
+    connection: Connection = Cake(Cake(contextlib.closing, Cake(Connection, settings)))
+    tags: list[str] = Cake(["a", "b"])
+    garage: Garage = Cake(Garage())
+    car: str = garage.car
+
+
+def test_sync_with() -> None:
+    with SyncBakery() as bakery:
+        assert bakery.connection.dsn == "db://"
+        assert bakery.tags == ["a", "b"]
+        assert bakery.car == "BMW"
+        connection: Connection = bakery.connection
+
+    assert connection.closed
+    assert not SyncBakery.__bakery_visitors__
+    assert not Garage.__bakery_visitors__
+
+
+def test_open_close() -> None:
+    bakery: SyncBakery = SyncBakery.open()
+    assert bakery.settings.dsn == "db://"
+    SyncBakery.close()
+    assert not SyncBakery.__bakery_visitors__
+
+
+def test_sync_replacements() -> None:
+    with SyncBakery(settings=Settings("test://")) as bakery:
+        assert bakery.connection.dsn == "test://"
+
+    with SyncBakery() as bakery:
+        assert bakery.connection.dsn == "db://"
+
+
+def test_coroutine_function_recipe() -> None:
+    exits: list[str] = []
+
+    @contextlib.contextmanager
+    def first() -> Iterator[int]:
+        yield 1
+        exits.append("first")
+
+    async def second() -> int:
+        return 2
+
+    class MyBakery(Bakery):
+        first_cake: int = Cake(first())
+        second_cake: int = Cake(second)
+
+    with pytest.raises(TypeError, match="BAKE_FROM_CORO_FUNC.*Use 'async with'"), MyBakery():
+        pass
+
+    # already baked cakes are unbaked
+    assert exits == ["first"]
+    assert not MyBakery.__bakery_visitors__
+
+
+def test_generator_function_recipe() -> None:
+    events: list[str] = []
+
+    def resource() -> Iterator[str]:
+        events.append("setup")
+        yield "resource"
+        events.append("teardown")
+
+    async def async_resource() -> AsyncIterator[str]:
+        yield "async resource"
+
+    class MyBakery(Bakery):
+        value: str = Cake(resource)
+
+    with MyBakery() as bakery:
+        assert bakery.value == "resource"
+    assert events == ["setup", "teardown"]
+
+    class AsyncBakery(Bakery):
+        value: str = Cake(async_resource)
+
+    with pytest.raises(TypeError, match="BAKE_FROM_ASYNC_GEN_FUNC"):
+        AsyncBakery.open()
+
+
+def test_async_context_manager_recipe() -> None:
+    @contextlib.asynccontextmanager
+    async def make_client() -> Any:
+        yield "client"
+
+    class MyBakery(Bakery):
+        client: str = Cake(Cake(make_client))
+
+    with pytest.raises(TypeError, match="BAKE_FROM_ACM"):
+        MyBakery.open()
+
+
+class Suspend:
+    def __await__(self) -> Generator[None, None, None]:
+        yield None
+
+
+class Resource:
+    """Both sync and async context manager."""
+
+    def __enter__(self) -> str:
+        return "sync"
+
+    def __exit__(self, *_args: object) -> None:
+        pass
+
+    async def __aenter__(self) -> str:
+        await Suspend()
+        return "async"
+
+    async def __aexit__(self, *_args: object) -> None:
+        pass
+
+
+def test_suspended_recipe() -> None:
+    baked: list[str] = []
+
+    class MyBakery(Bakery):
+        first: None = Cake(lambda: baked.append("first"))
+        # baked from async context manager, which suspends
+        second: str = Cake(Resource())
+
+    with pytest.raises(TypeError, match="some recipe is asynchronous"):
+        MyBakery.open()
+
+    assert baked == ["first"]
+    assert not MyBakery.__bakery_visitors__
+
+
+async def test_sync_open_async_bakery() -> None:
+    async def coro() -> int:
+        return 42
+
+    class MyBakery(Bakery):
+        value: int = Cake(coro)
+
+    async with MyBakery() as bakery:
+        # already opened bakery just gets a visitor
+        with MyBakery():
+            assert bakery.value == 42
+        assert bakery.value == 42